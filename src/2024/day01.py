@@ -1,6 +1,14 @@
+from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 import sys
 
+import numpy as np
+import numpy.typing as npt
+
+from advent.inputs import read_input
+from advent.parsing import records
+
 
 EXAMPLE_INPUT = """
 3   4
@@ -12,51 +20,143 @@ EXAMPLE_INPUT = """
 """
 
 
-def parse_input(input: str) -> tuple[list[int], list[int]]:
-    lines = input.strip().split("\n")
-    left_list: list[int] = []
-    right_list: list[int] = []
-    for line in lines:
-        left, right = line.split()
-        left_list.append(int(left))
-        right_list.append(int(right))
-    return left_list, right_list
+type Locations = npt.NDArray[np.int64]
+
+
+def parse_chunks(chunks: Iterable[str]) -> tuple[Locations, Locations]:
+    # Both whole lists are needed to sort them, but not the text they come from
+    pairs = np.concatenate(
+        [np.zeros((0, 2), dtype=np.int64)] + [records(chunk, 2) for chunk in chunks]
+    )
+    return pairs[:, 0], pairs[:, 1]
+
+
+def parse_input(input: str) -> tuple[Locations, Locations]:
+    return parse_chunks([input])
+
+
+def total_distance(left: Locations, right: Locations) -> int:
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+def similarity_score(left: Locations, right: Locations) -> int:
+    # Count each id of the right list once, then look the left ones up in the
+    # sorted counts, in O(n log n) instead of a count of the right list per id
+    ids, counts = np.unique(right, return_counts=True)
+    if len(ids) == 0:
+        return 0
+    positions = np.minimum(np.searchsorted(ids, left), len(ids) - 1)
+    occurrences = np.where(ids[positions] == left, counts[positions], 0)
+    return int((left * occurrences).sum())
+
+
+class LocationIndex:
+    """Location lists that grow a pair at a time, answering both parts live.
+
+    The similarity score is kept up to date on every pair from the counts of
+    each id in both lists. The lists are kept sorted for the distance: new
+    pairs wait in a buffer until the next query, which sorts the buffer alone
+    and merges it in, then sums the distance in one vectorized pass.
+    """
+
+    # Both lists, sorted, up to the pairs still pending
+    left: Locations
+    right: Locations
+    pending_left: list[int]
+    pending_right: list[int]
+    left_counts: Counter[int]
+    right_counts: Counter[int]
+    score: int
+    # Distance of the sorted lists, None once pairs were added since
+    distance: int | None
+
+    def __init__(self, pairs: Iterable[tuple[int, int]] = ()) -> None:
+        self.left = np.zeros(0, dtype=np.int64)
+        self.right = np.zeros(0, dtype=np.int64)
+        self.pending_left = []
+        self.pending_right = []
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.score = 0
+        self.distance = 0
+        for left, right in pairs:
+            self.add(left, right)
+
+    def __len__(self) -> int:
+        return len(self.left) + len(self.pending_left)
+
+    def add(self, left: int, right: int) -> None:
+        # Each id scores id * (count on the left) * (count on the right), so a
+        # new id on one side adds id * its count on the other side
+        self.score += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.score += right * self.left_counts[right]
+        self.right_counts[right] += 1
+        self.pending_left.append(left)
+        self.pending_right.append(right)
+        self.distance = None
+
+    def similarity_score(self) -> int:
+        return self.score
+
+    def total_distance(self) -> int:
+        if self.distance is None:
+            self.left = merge_sorted(self.left, self.pending_left)
+            self.right = merge_sorted(self.right, self.pending_right)
+            self.pending_left.clear()
+            self.pending_right.clear()
+            self.distance = int(np.abs(self.left - self.right).sum())
+        return self.distance
+
+
+def merge_sorted(locations: Locations, new: list[int]) -> Locations:
+    # O(n + k log k) for k new ids, instead of sorting all n + k again
+    added = np.sort(np.array(new, dtype=np.int64))
+    return np.insert(locations, np.searchsorted(locations, added), added)
 
 
 def part1(input: str) -> int:
-    left, right = parse_input(input)
+    return total_distance(*parse_input(input))
+
+
+def part2(input: str) -> int:
+    return similarity_score(*parse_input(input))
+
+
+def reference_part1(input: str) -> int:
+    # Straightforward versions of the parts, kept to check faster ones against
+    left, right = (locations.tolist() for locations in parse_input(input))
     left.sort()
     right.sort()
-    total_distance = sum([abs(left[i] - right[i]) for i in range(len(left))])
-    return total_distance
+    return sum([abs(left[i] - right[i]) for i in range(len(left))])
 
 
-def part2(input: str) -> int:
-    left, right = parse_input(input)
+def reference_part2(input: str) -> int:
+    left, right = (locations.tolist() for locations in parse_input(input))
     score = 0
     for id in left:
         score += id * right.count(id)
     return score
 
 
-"""
-Benchmark 1 (153 runs): python src/day01.py
-    measurement          mean ± σ            min … max           outliers
-    wall_time          32.5ms ±  690us    31.5ms … 35.9ms          5 ( 3%)
-    peak_rss           12.5MB ± 39.7KB    12.4MB … 12.6MB          3 ( 2%)
-    cpu_cycles          133M  ± 2.05M      130M  …  141M           2 ( 1%)
-    instructions        266M  ± 78.3K      266M  …  266M           7 ( 5%)
-    cache_references   4.98M  ±  122K     4.81M  … 5.49M          10 ( 7%)
-    cache_misses        342K  ±  121K      163K  …  734K           0 ( 0%)
-    branch_misses       836K  ± 6.22K      824K  …  861K           6 ( 4%)
-"""
+def stream_part1(chunks: Iterable[str]) -> int:
+    return total_distance(*parse_chunks(chunks))
+
+
+def stream_part2(chunks: Iterable[str]) -> int:
+    return similarity_score(*parse_chunks(chunks))
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 1, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day01.txt"
-        ).read_text()
+        input_text = read_input(2024, 1)
 
     assert part1(EXAMPLE_INPUT) == 11
     result1 = part1(input_text)
@@ -65,3 +165,12 @@ if __name__ == "__main__":
     assert part2(EXAMPLE_INPUT) == 31
     result2 = part2(input_text)
     print(result2)
+
+    # Querying halfway merges the pending pairs before the rest come in
+    example_pairs = list(zip(*(e.tolist() for e in parse_input(EXAMPLE_INPUT))))
+    index = LocationIndex(example_pairs[:3])
+    assert index.total_distance() == 3
+    for left, right in example_pairs[3:]:
+        index.add(left, right)
+    assert index.total_distance() == 11
+    assert index.similarity_score() == 31
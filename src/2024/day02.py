@@ -1,6 +1,13 @@
+from collections.abc import Iterable
 from pathlib import Path
 import sys
 
+import numpy as np
+import numpy.typing as npt
+
+from advent.inputs import read_input
+from advent.parsing import RaggedRows, ragged_rows
+
 
 EXAMPLE_INPUT = """
 7 6 4 2 1
@@ -13,15 +20,124 @@ EXAMPLE_INPUT = """
 
 
 def parse_input(input: str) -> list[list[int]]:
-    lines = input.strip().split("\n")
-    reports: list[list[int]] = []
-    for line in lines:
-        report = [int(x) for x in line.split()]
-        reports.append(report)
+    reports: list[list[int]] = ragged_rows(input).tolist()
     return reports
 
 
+# Reports, one per row, padded with zeros to the length of the longest one
+type Levels = npt.NDArray[np.int64]
+type Lengths = npt.NDArray[np.intp]
+type Mask = npt.NDArray[np.bool_]
+
+# Longer reports are checked one at a time in O(k), rather than padding every
+# report of the batch to their length
+MAX_BATCH_LEVELS = 32
+
+
+def is_safe_step(a: int, b: int, direction: int) -> bool:
+    # Levels must change by 1 to 3, all in the same direction (1 or -1)
+    return 1 <= (b - a) * direction <= 3
+
+
+def first_unsafe_step(report: list[int], direction: int, skipped: int = -1) -> int:
+    """Index of the level before the first unsafe step of `report`, or -1.
+
+    `skipped` is the index of a level to leave out, without copying the rest.
+    """
+    previous = -1
+    for i in range(len(report)):
+        if i == skipped:
+            continue
+        if previous != -1 and not is_safe_step(report[previous], report[i], direction):
+            return previous
+        previous = i
+    return -1
+
+
 def is_safe(report: list[int]) -> bool:
+    if len(report) < 2:
+        return True
+    direction = 1 if report[1] > report[0] else -1
+    return first_unsafe_step(report, direction) == -1
+
+
+def is_safe_dampened(report: list[int]) -> bool:
+    """Whether `report` is safe once at most one of its levels is removed.
+
+    For a given direction, the two levels of the first unsafe step can not both
+    stay, so only removing one of them can help. This takes at most 3 passes
+    per direction, O(k) for k levels, instead of checking all the k reports
+    with one level less.
+    """
+    for direction in (1, -1):
+        unsafe = first_unsafe_step(report, direction)
+        if unsafe == -1:
+            return True
+        for skipped in (unsafe, unsafe + 1):
+            if first_unsafe_step(report, direction, skipped) == -1:
+                return True
+    return False
+
+
+def pad_reports(rows: RaggedRows, selected: Lengths) -> Levels:
+    lengths = rows.lengths()[selected]
+    width = int(lengths.max(initial=0))
+    if width == 0:
+        return np.zeros((len(selected), 0), dtype=np.int64)
+    indices = rows.offsets[selected][:, None] + np.arange(width)
+    in_report = np.arange(width) < lengths[:, None]
+    return np.where(
+        in_report, rows.values[np.minimum(indices, len(rows.values) - 1)], 0
+    )
+
+
+def safe_reports(levels: Levels, lengths: Lengths) -> Mask:
+    """is_safe of every row of `levels` at once."""
+    steps = np.diff(levels, axis=1)
+    # The sign of the first step is the direction of the report
+    directed = steps * np.sign(steps[:, :1])
+    in_report = np.arange(1, levels.shape[1]) < lengths[:, None]
+    is_safe_step = ((directed >= 1) & (directed <= 3)) | ~in_report
+    return is_safe_step.all(axis=1)
+
+
+def safe_dampened_reports(levels: Levels, lengths: Lengths) -> Mask:
+    """is_safe_dampened of every row of `levels` at once.
+
+    Each level is removed in turn from the reports that are still unsafe,
+    which only takes one pass per column.
+    """
+    safe = safe_reports(levels, lengths)
+    for removed in range(levels.shape[1]):
+        unsafe = np.flatnonzero(~safe & (removed < lengths))
+        if len(unsafe) == 0:
+            break
+        safe[unsafe] = safe_reports(
+            np.delete(levels[unsafe], removed, axis=1), lengths[unsafe] - 1
+        )
+    return safe
+
+
+def count_safe(rows: RaggedRows, dampened: bool) -> int:
+    lengths = rows.lengths()
+    batched = np.flatnonzero(lengths <= MAX_BATCH_LEVELS)
+    check_batch = safe_dampened_reports if dampened else safe_reports
+    count = int(check_batch(pad_reports(rows, batched), lengths[batched]).sum())
+    check = is_safe_dampened if dampened else is_safe
+    for row in np.flatnonzero(lengths > MAX_BATCH_LEVELS).tolist():
+        count += check(rows[row].tolist())
+    return count
+
+
+def part1(input: str) -> int:
+    return count_safe(ragged_rows(input), dampened=False)
+
+
+def part2(input: str) -> int:
+    return count_safe(ragged_rows(input), dampened=True)
+
+
+def reference_is_safe(report: list[int]) -> bool:
     # Check if report is monotonic
     if sorted(report) != report and sorted(report, reverse=True) != report:
         return False
@@ -32,41 +148,39 @@ def is_safe(report: list[int]) -> bool:
     return False
 
 
-def part1(input: str) -> int:
-    reports = parse_input(input)
-    safe_count = [is_safe(report) for report in reports].count(True)
-    return safe_count
+def reference_part1(input: str) -> int:
+    # Straightforward versions of the parts, kept to check faster ones against
+    return sum(reference_is_safe(report) for report in parse_input(input))
 
 
-def part2(input: str) -> int:
-    reports = parse_input(input)
+def reference_part2(input: str) -> int:
     safe_count = 0
-    for report in reports:
-        sub_reports = [report[0:i] + report[i + 1 :] for i in range(len(report))] + [
-            report
-        ]
-        safe_count += any([is_safe(sub_report) for sub_report in sub_reports])
+    for report in parse_input(input):
+        sub_reports = [report[0:i] + report[i + 1 :] for i in range(len(report))]
+        safe_count += any(
+            reference_is_safe(sub_report) for sub_report in sub_reports + [report]
+        )
     return safe_count
 
 
-"""
-Benchmark 1 (132 runs): python day02.py
-    measurement          mean ± σ            min … max           outliers
-    wall_time          38.0ms ± 4.08ms    33.9ms … 49.6ms          2 ( 2%)
-    peak_rss           12.6MB ±  113KB    12.3MB … 12.8MB          0 ( 0%)
-    cpu_cycles          110M  ± 9.79M     64.2M  …  132M           5 ( 4%)
-    instructions        252M  ± 15.7M      179M  …  264M           2 ( 2%)
-    cache_references    951K  ±  110K      431K  … 1.22M           5 ( 4%)
-    cache_misses       77.4K  ± 51.7K     15.3K  …  319K          12 ( 9%)
-    branch_misses       709K  ±  106K      184K  …  810K           6 ( 5%
-"""
+def stream_part1(chunks: Iterable[str]) -> int:
+    return sum(count_safe(ragged_rows(chunk), dampened=False) for chunk in chunks)
+
+
+def stream_part2(chunks: Iterable[str]) -> int:
+    return sum(count_safe(ragged_rows(chunk), dampened=True) for chunk in chunks)
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 2, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day02.txt"
-        ).read_text()
+        input_text = read_input(2024, 2)
 
     assert part1(EXAMPLE_INPUT) == 2
     result1 = part1(input_text)
@@ -1,17 +1,76 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
 import enum
 from pathlib import Path
 import re
 import sys
 
+from advent.inputs import read_input
+
 EXAMPLE_INPUT = (
     """xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"""
 )
 
 
+# Instructions are found across chunk boundaries, which can then be anywhere
+STREAM_WHOLE_LINES = False
+
+# Every instruction in a single alternation, so that one pass finds them all in
+# order: the operands of a multiplication, or whether a do() is a don't()
+INSTRUCTION = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|do(n't)?\(\)")
+# Length of the longest instruction, "mul(123,456)"
+MAX_INSTRUCTION_LENGTH = 12
+
+
 def parse_input(input: str) -> str:
     return input.strip()
 
 
+@dataclass
+class Scanner:
+    """Sums of the multiplications of a text fed a chunk at a time.
+
+    The end of a chunk that could start an instruction is kept to be scanned
+    again with the next chunk, so that instructions split between two chunks
+    are still found, in constant memory.
+    """
+
+    # Sum of all the multiplications, and of the enabled ones
+    total: int = 0
+    enabled_total: int = 0
+    enabled: bool = True
+    # Text after the last instruction found, too short to rule one out yet
+    tail: str = ""
+
+    def feed(self, chunk: str) -> None:
+        text = self.tail + chunk
+        # findall builds no match objects, and locals are faster than attributes
+        total, enabled_total, enabled = self.total, self.enabled_total, self.enabled
+        for left, right, dont in INSTRUCTION.findall(text):
+            if left != "":
+                product = int(left) * int(right)
+                total += product
+                if enabled:
+                    enabled_total += product
+            else:
+                enabled = dont == ""
+        self.total, self.enabled_total, self.enabled = total, enabled_total, enabled
+        # An instruction that does not fit in the text yet starts in its last
+        # MAX_INSTRUCTION_LENGTH - 1 characters, if anywhere, and after the end
+        # of the last instruction found. Instructions can not overlap, so that
+        # one is also the last found from a bit earlier
+        start = max(len(text) - 2 * MAX_INSTRUCTION_LENGTH, 0)
+        end = max((e.end() for e in INSTRUCTION.finditer(text, start)), default=0)
+        self.tail = text[max(end, len(text) - MAX_INSTRUCTION_LENGTH + 1) :]
+
+
+def scan(chunks: Iterable[str]) -> Scanner:
+    scanner = Scanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner
+
+
 class OP(enum.Enum):
     MUL = 0
     DO = 1
@@ -19,6 +78,23 @@ class OP(enum.Enum):
 
 
 def part1(input: str) -> int:
+    return scan([input]).total
+
+
+def part2(input: str) -> int:
+    return scan([input]).enabled_total
+
+
+def stream_part1(chunks: Iterable[str]) -> int:
+    return scan(chunks).total
+
+
+def stream_part2(chunks: Iterable[str]) -> int:
+    return scan(chunks).enabled_total
+
+
+def reference_part1(input: str) -> int:
+    # Straightforward versions of the parts, kept to check faster ones against
     ops = re.finditer(r"mul\((\d{1,3}),(\d{1,3})\)", input)
     sum = 0
     for op in ops:
@@ -26,7 +102,7 @@ def part1(input: str) -> int:
     return sum
 
 
-def part2(input: str) -> int:
+def reference_part2(input: str) -> int:
     mul_ops = [
         (e.start(), OP.MUL, e)
         for e in re.finditer(r"mul\((\d{1,3}),(\d{1,3})\)", input)
@@ -51,24 +127,16 @@ def part2(input: str) -> int:
     return sum
 
 
-"""
-Benchmark 1 (210 runs): python src/day03.py
-    measurement          mean ± σ            min … max           outliers
-    wall_time          23.7ms ± 3.87ms    20.5ms … 37.6ms         16 ( 8%)
-    peak_rss           12.6MB ±  103KB    12.3MB … 12.8MB          1 ( 0%)
-    cpu_cycles         62.5M  ± 9.62M        0   … 93.2M          25 (12%)
-    instructions        105M  ± 15.7M        0   …  113M          26 (12%)
-    cache_references    999K  ±  120K        0   … 1.14M           9 ( 4%)
-    cache_misses       61.4K  ± 23.0K        0   …  191K           5 ( 2%)
-    branch_misses       663K  ±  104K        0   …  726K          26 (12%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 3, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day03.txt"
-        ).read_text()
+        input_text = read_input(2024, 3)
 
     assert part1(EXAMPLE_INPUT) == 161
     result1 = part1(input_text)
@@ -1,6 +1,7 @@
 from pathlib import Path
 import sys
-import numpy as np
+
+from advent.inputs import read_input
 
 EXAMPLE_INPUT = """
 MMMSXXMASM
@@ -16,96 +17,72 @@ MXMXAXMASX
 """
 
 
-def parse_input(input: str):
-    # Parse a string into a 2d numpy matrix
-    return np.array([list(line) for line in input.strip().split("\n")])
+type Grid = list[str]
+
+
+def parse_input(input: str) -> Grid:
+    # Rows of letters, indexed [line][column]
+    return input.strip().split("\n")
+
+
+def diagonal(grid: Grid, offset: int) -> str:
+    # Same as the diagonals of NumPy: above the main one for positive offsets,
+    # below it for negative ones
+    if offset >= 0:
+        size = min(len(grid), len(grid[0]) - offset)
+        return "".join(grid[i][i + offset] for i in range(size))
+    size = min(len(grid) + offset, len(grid[0]))
+    return "".join(grid[i - offset][i] for i in range(size))
 
 
 def part1(input: str) -> int:
     grid = parse_input(input)
     count = 0
     # Horizonal
-    for line in grid:
-        line_str = "".join(line)
+    for line_str in grid:
         count += (line_str).count("XMAS")
         count += (line_str).count("SAMX")
     # Vertical
-    for column in grid.T:
+    for column in zip(*grid):
         column_str = "".join(column)
         count += (column_str).count("XMAS")
         count += (column_str).count("SAMX")
     # Diagonals
-    for i in range(int(-grid.shape[0] / 2) - 1, int(grid.shape[0] / 2) + 1):
-        diagonal = "".join(grid.diagonal(i))
-        antidiagonal = "".join(np.fliplr(grid).diagonal(i))
-        count += (diagonal).count("XMAS")
-        count += (diagonal).count("SAMX")
-        count += (antidiagonal).count("XMAS")
-        count += (antidiagonal).count("SAMX")
+    flipped = [line[::-1] for line in grid]
+    for i in range(int(-len(grid) / 2) - 1, int(len(grid) / 2) + 1):
+        diagonal_str = diagonal(grid, i)
+        antidiagonal_str = diagonal(flipped, i)
+        count += (diagonal_str).count("XMAS")
+        count += (diagonal_str).count("SAMX")
+        count += (antidiagonal_str).count("XMAS")
+        count += (antidiagonal_str).count("SAMX")
     return count
 
 
 def part2(input: str) -> int:
     grid = parse_input(input)
     count = 0
-    for i in range(grid.shape[0] - 2):
-        for j in range(grid.shape[1] - 2):
-            kernel = grid[i : i + 3, j : j + 3]
-            if kernel[1, 1] != "A":
-                continue
-            if (
-                kernel[0, 0] == "M"
-                and kernel[0, 2] == "M"
-                and kernel[2, 0] == "S"
-                and kernel[2, 2] == "S"
-            ):
-                count += 1
+    for i in range(len(grid) - 2):
+        for j in range(len(grid[0]) - 2):
+            if grid[i + 1][j + 1] != "A":
                 continue
-            if (
-                kernel[0, 0] == "S"
-                and kernel[0, 2] == "S"
-                and kernel[2, 0] == "M"
-                and kernel[2, 2] == "M"
-            ):
+            # Corners of the 3x3 kernel, clockwise from the top left one
+            corners = grid[i][j] + grid[i][j + 2] + grid[i + 2][j + 2] + grid[i + 2][j]
+            if corners in ("MMSS", "SSMM", "MSSM", "SMMS"):
                 count += 1
-                continue
-            if (
-                kernel[0, 0] == "M"
-                and kernel[0, 2] == "S"
-                and kernel[2, 0] == "M"
-                and kernel[2, 2] == "S"
-            ):
-                count += 1
-                continue
-            if (
-                kernel[0, 0] == "S"
-                and kernel[0, 2] == "M"
-                and kernel[2, 0] == "S"
-                and kernel[2, 2] == "M"
-            ):
-                count += 1
-                continue
     return count
 
 
-"""
-Benchmark 1 (100 runs): ./venv/bin/python src/day04.py
-    measurement          mean ± σ            min … max           outliers
-    wall_time           100ms ± 6.08ms    94.4ms …  129ms          4 ( 4%)
-    peak_rss           39.9MB ±  554KB    37.5MB … 41.2MB          7 ( 7%)
-    cpu_cycles         2.86G  ±  129M     2.33G  … 2.99G           3 ( 3%)
-    instructions       2.17G  ± 80.8M     1.85G  … 2.25G           3 ( 3%)
-    cache_references   18.3M  ±  337K     17.9M  … 20.1M           5 ( 5%)
-    cache_misses       1.44M  ±  351K     1.10M  … 2.80M          11 (11%)
-    branch_misses      2.86M  ± 41.2K     2.78M  … 3.03M           5 ( 5%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 4, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day04.txt"
-        ).read_text()
+        input_text = read_input(2024, 4)
 
     assert part1(EXAMPLE_INPUT) == 18
     result1 = part1(input_text)
@@ -1,6 +1,8 @@
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 EXAMPLE_INPUT = """
 47|53
 97|13
@@ -34,9 +36,10 @@ EXAMPLE_INPUT = """
 
 type Rule = tuple[int, int]
 type Update = list[int]
+type Manual = tuple[list[Rule], list[Update]]
 
 
-def parse_input(input: str) -> tuple[list[Rule], list[Update]]:
+def parse(input: str) -> Manual:
     raw_rules, raw_updates = input.strip().split("\n\n")
     rules: list[Rule] = []
     for line in raw_rules.split("\n"):
@@ -110,8 +113,8 @@ def get_correct_and_incorrect_updates(
     return (correct_updates, incorrect_updates)
 
 
-def part1(input: str) -> int:
-    rules, updates = parse_input(input)
+def part1(manual: Manual) -> int:
+    rules, updates = manual
     ruleset = build_ruleset(rules)
     count = 0
     correct_updates, _ = get_correct_and_incorrect_updates(ruleset, updates)
@@ -120,8 +123,8 @@ def part1(input: str) -> int:
     return count
 
 
-def part2(input: str) -> int:
-    rules, updates = parse_input(input)
+def part2(manual: Manual) -> int:
+    rules, updates = manual
     ruleset = build_ruleset(rules)
     count = 0
     _, incorrect_updates = get_correct_and_incorrect_updates(ruleset, updates)
@@ -132,29 +135,42 @@ def part2(input: str) -> int:
     return count
 
 
-"""
-Benchmark 1 (79 runs): python src/day05.py
-    measurement          mean ± σ            min … max           outliers
-    wall_time          63.6ms ± 4.56ms    59.1ms … 80.5ms          4 ( 5%)
-    peak_rss           13.0MB ±  120KB    12.7MB … 13.2MB          1 ( 1%)
-    cpu_cycles          208M  ± 8.44M      173M  …  227M           6 ( 8%)
-    instructions        620M  ± 12.2M      561M  …  627M           6 ( 8%)
-    cache_references   1.10M  ± 93.3K      709K  … 1.27M           1 ( 1%)
-    cache_misses        253K  ± 50.3K      148K  …  396K           0 ( 0%)
-    branch_misses       901K  ± 80.0K      491K  …  960K           9 (11%)
-"""
+def reference_part1(input: str) -> int:
+    # Straightforward version of part 1, kept to check faster ones against
+    rules, updates = parse(input)
+    ruleset = build_ruleset(rules)
+    correct_updates, _ = get_correct_and_incorrect_updates(ruleset, updates)
+    return sum(update[int(len(update) / 2)] for update in correct_updates)
+
+
+def reference_part2(input: str) -> int:
+    rules, updates = parse(input)
+    ruleset = build_ruleset(rules)
+    _, incorrect_updates = get_correct_and_incorrect_updates(ruleset, updates)
+    count = 0
+    for update in incorrect_updates:
+        filtered_ruleset = build_filtered_ruleset(rules, update)
+        corrected_update = [value for value in filtered_ruleset if value in update]
+        count += corrected_update[int(len(corrected_update) / 2)]
+    return count
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 5, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day05.txt"
-        ).read_text()
+        input_text = read_input(2024, 5)
 
-    assert part1(EXAMPLE_INPUT) == 143
-    result1 = part1(input_text)
+    manual = parse(input_text)
+    assert part1(parse(EXAMPLE_INPUT)) == 143
+    result1 = part1(manual)
     print(result1)
 
-    assert part2(EXAMPLE_INPUT) == 123
-    result2 = part2(input_text)
+    assert part2(parse(EXAMPLE_INPUT)) == 123
+    result2 = part2(manual)
     print(result2)
@@ -1,6 +1,9 @@
 from pathlib import Path
 import sys
 
+from advent.grid import BORDER, Grid
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 ....#.....
@@ -58,56 +61,50 @@ TEST_INPUT_6 = """
 ^.#.
 """
 
-# Order is line, column
-type Coordinates = tuple[int, int]
-type Direction = tuple[int, int]
-type Step = tuple[Coordinates, Direction]
+# Flat index of a cell in the padded grid, row by row
+type Position = int
+# Index of the direction in Grid.directions: 0 is up, then clockwise
+type Direction = int
+type Step = tuple[Position, Direction]
+
+OBSTRUCTION = ord("#")
+UP = 0
 
 
-# True means obstructed, False means open
 class Map:
-    _map: list[list[bool]]
-    _patch: Coordinates | None
-    lines: int
-    columns: int
+    grid: Grid
+    _patch: tuple[Position, int] | None
 
-    def patch(self, coords: Coordinates) -> None:
-        self._patch = coords
+    def patch(self, position: Position) -> None:
+        # Obstruct the cell in the grid itself, unpatch restores it
+        self._patch = (position, self.grid[position])
+        self.grid[position] = OBSTRUCTION
 
     def unpatch(self) -> None:
+        if self._patch is not None:
+            position, cell = self._patch
+            self.grid[position] = cell
         self._patch = None
 
-    def __init__(self, map: list[list[bool]]) -> None:
-        self._map = map
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
         self._patch = None
-        self.lines = len(map)
-        self.columns = len(map[0])
-
-    def __call__(self, coords: Coordinates) -> bool | None:
-        if coords == self._patch:
-            return True
-        if (
-            coords[0] < 0
-            or coords[0] >= self.lines
-            or coords[1] < 0
-            or coords[1] >= self.columns
-        ):
-            return None
-        return self._map[coords[0]][coords[1]]
 
     def walk(
-        self, start: Coordinates, direction: Direction
-    ) -> tuple[bool, Coordinates, list[Step]]:
+        self, start: Position, direction: Direction
+    ) -> tuple[bool, Position, list[Step]]:
         # Return True if we left the map
+        cells = self.grid.cells
+        offset = self.grid.directions[direction]
         pos = start
         walk_steps: list[Step] = []
         while True:
-            new_pos = move(pos, direction)
-            new_cell = self(new_pos)
-            if new_cell is None:
+            new_pos = pos + offset
+            new_cell = cells[new_pos]
+            if new_cell == BORDER:
                 # Out of the map
                 return (True, pos, walk_steps)
-            elif new_cell:
+            elif new_cell == OBSTRUCTION:
                 # We are against an obstacle, stop there
                 return (False, pos, walk_steps)
             else:
@@ -117,28 +114,17 @@ class Map:
 
 
 def turn_right(direction: Direction) -> Direction:
-    return (direction[1], -direction[0])
-
+    return (direction + 1) % 4
 
-def move(pos: Coordinates, direction: Direction) -> Coordinates:
-    return (pos[0] + direction[0], pos[1] + direction[1])
 
-
-def parse_input(input: str) -> tuple[Map, Coordinates, Direction]:
-    lines = input.strip().split("\n")
-    raw_map: list[list[bool]] = []
-    guard_location = (-1, -1)
-    for i, line in enumerate(lines):
-        raw_map.append([char == "#" for char in line])
-        guard_column = line.find("^")
-        if guard_column != -1:
-            guard_location = (i, guard_column)
-    return (Map(raw_map), guard_location, (-1, 0))
+def parse_input(input: str) -> tuple[Map, Position, Direction]:
+    grid = Grid(input)
+    return (Map(grid), grid.find("^"), UP)
 
 
 def compute_path(
     map: Map,
-    guard_pos: Coordinates,
+    guard_pos: Position,
     guard_dir: Direction,
     already_visited: set[Step] | None = None,
 ) -> list[Step] | None:
@@ -183,7 +169,7 @@ def part2(input: str) -> int:
     # Assert to make type checker happy
     assert isinstance(clear_path, list)
 
-    obstacles: set[Coordinates] = set()
+    obstacles: set[Position] = set()
     # For each step of the path:
     for i, step in enumerate(clear_path[:-1]):
         # Place an obstacle on the next step
@@ -210,24 +196,16 @@ def part2(input: str) -> int:
     return len(obstacles)
 
 
-"""
-Benchmark 1 (3 runs): ./venv/bin/python src/day06.py /tmp/.sops3742241049/tmp-file1905588157
-    measurement          mean ± σ            min … max           outliers
-    wall_time          3.73s  ± 38.3ms    3.71s  … 3.78s           0 ( 0%)
-    peak_rss           17.1MB ± 34.4KB    17.0MB … 17.1MB          0 ( 0%)
-    cpu_cycles         17.4G  ±  197M     17.2G  … 17.6G           0 ( 0%)
-    instructions       38.0G  ± 5.76M     37.9G  … 38.0G           0 ( 0%)
-    cache_references    772M  ± 3.61M      768M  …  775M           0 ( 0%)
-    cache_misses       14.4M  ± 2.77M     12.1M  … 17.5M           0 ( 0%)
-    branch_misses       116M  ± 4.91M      113M  …  122M           0 ( 0%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 6, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day06.txt"
-        ).read_text()
+        input_text = read_input(2024, 6)
 
     assert part1(EXAMPLE_INPUT) == 41
     result1 = part1(input_text)
@@ -1,6 +1,10 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+from advent.parsing import IntegerOverflowError, ragged_rows
+
 
 EXAMPLE_INPUT = """
 190: 10 19
@@ -18,25 +22,31 @@ type Equation = tuple[int, tuple[int, ...]]
 
 
 def parse_input(input: str) -> list[Equation]:
-    lines = input.strip().split("\n")
-    equations: list[Equation] = []
-    for line in lines:
-        (result_raw, operands_raw) = line.split(": ")
-        result = int(result_raw)
-        operands = tuple([int(op) for op in (operands_raw.split(" "))])
-        equations.append((result, operands))
-    return equations
+    try:
+        rows = ragged_rows(input).tolist()
+    except IntegerOverflowError:
+        # Results made of concatenations can outgrow an int64, Python ints do not
+        rows = [
+            [int(e) for e in line.replace(":", "").split()]
+            for line in input.strip().split("\n")
+        ]
+    # Each line is the result, then the operands
+    return [(row[0], tuple(row[1:])) for row in rows]
+
+
+def iter_equations(chunks: Iterable[str]) -> Iterator[Equation]:
+    for chunk in chunks:
+        yield from parse_input(chunk)
 
 
 def try_solve_recursive(
     target_value: int, current_value: int, remaining_operands: tuple[int, ...]
 ) -> bool:
-    if current_value == target_value:
-        return True
-    elif current_value > target_value:
+    if current_value > target_value:
         return False
     elif len(remaining_operands) == 0:
-        return False
+        # Every operand must be used before the equation holds
+        return current_value == target_value
     else:
         new_operand = remaining_operands[0]
         return try_solve_recursive(
@@ -46,27 +56,49 @@ def try_solve_recursive(
         )
 
 
+def try_solve_recursive_with_concat(
+    target_value: int, current_value: int, remaining_operands: tuple[int, ...]
+) -> bool:
+    # Same as try_solve_recursive, with the concatenation operator too
+    if current_value > target_value:
+        return False
+    elif len(remaining_operands) == 0:
+        return current_value == target_value
+    else:
+        new_operand = remaining_operands[0]
+        return (
+            try_solve_recursive_with_concat(
+                target_value, current_value + new_operand, remaining_operands[1:]
+            )
+            or try_solve_recursive_with_concat(
+                target_value, current_value * new_operand, remaining_operands[1:]
+            )
+            or try_solve_recursive_with_concat(
+                target_value,
+                int(f"{current_value}{new_operand}"),
+                remaining_operands[1:],
+            )
+        )
+
+
 def try_solve_recursive_advanced_backwards(
     current_value: int,
     remaining_operands: tuple[int, ...],
     # Not computing the length at each iteration saves a tiny amount of time
     nb_remaining_operands: int,
 ) -> bool:
-    if current_value == 0:
-        return True
-    elif current_value < 0:
-        return False
-    elif nb_remaining_operands == 0:
+    if current_value <= 0:
         return False
+    elif nb_remaining_operands == 1:
+        # Every operand must be used, the first one is what is left
+        return current_value == remaining_operands[0]
     else:
         new_operand = remaining_operands[-1]
-        if current_value == new_operand:
-            return True
 
         # Multiply case
         if current_value % new_operand == 0:
             multiply_result = try_solve_recursive_advanced_backwards(
-                int(current_value / new_operand),
+                current_value // new_operand,
                 remaining_operands[:-1],
                 nb_remaining_operands - 1,
             )
@@ -100,8 +132,7 @@ def try_solve_recursive_advanced_backwards(
         return multiply_result or concat_result or add_result
 
 
-def part1(input: str) -> int:
-    equations = parse_input(input)
+def total_calibration(equations: Iterable[Equation]) -> int:
     count = 0
     for equation in equations:
         if try_solve_recursive(equation[0], equation[1][0], equation[1][1:]):
@@ -109,8 +140,7 @@ def part1(input: str) -> int:
     return count
 
 
-def part2(input: str) -> int:
-    equations = parse_input(input)
+def total_calibration_with_concat(equations: Iterable[Equation]) -> int:
     count = 0
     for equation in equations:
         if try_solve_recursive_advanced_backwards(
@@ -120,26 +150,55 @@ def part2(input: str) -> int:
     return count
 
 
-"""
-Benchmark 1 (44 runs): ./venv/bin/python src/day07.py /tmp/.sops2502108391/tmp-file3713580327
-    measurement          mean ± σ            min … max           outliers
-    wall_time           114ms ± 1.35ms     112ms …  118ms          1 ( 2%)
-    peak_rss           12.8MB ± 41.8KB    12.7MB … 12.9MB          5 (11%)
-    cpu_cycles          513M  ± 4.81M      508M  …  524M           1 ( 2%)
-    instructions       1.23G  ± 1.18M     1.22G  … 1.23G           0 ( 0%)
-    cache_references   5.31M  ± 56.0K     5.18M  … 5.52M           3 ( 7%)
-    cache_misses        325K  ± 48.8K      277K  …  600K           1 ( 2%)
-    branch_misses      2.20M  ±  125K     2.08M  … 2.56M           1 ( 2%)
-"""
+def part1(input: str) -> int:
+    return total_calibration(parse_input(input))
+
+
+def part2(input: str) -> int:
+    return total_calibration_with_concat(parse_input(input))
+
+
+def stream_part1(chunks: Iterable[str]) -> int:
+    return total_calibration(iter_equations(chunks))
+
+
+def stream_part2(chunks: Iterable[str]) -> int:
+    return total_calibration_with_concat(iter_equations(chunks))
+
+
+def reference_part1(input: str) -> int:
+    # Straightforward versions of the parts, kept to check faster ones against
+    equations = parse_input(input)
+    return sum(
+        result
+        for result, operands in equations
+        if try_solve_recursive(result, operands[0], operands[1:])
+    )
+
+
+def reference_part2(input: str) -> int:
+    equations = parse_input(input)
+    return sum(
+        result
+        for result, operands in equations
+        if try_solve_recursive_with_concat(result, operands[0], operands[1:])
+    )
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 7, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day07.txt"
-        ).read_text()
+        input_text = read_input(2024, 7)
 
     assert part1(EXAMPLE_INPUT) == 3749
+    # Equations only hold once every operand is used
+    assert part1("5: 5 3\n") == 0
     result1 = part1(input_text)
     print(result1)
 
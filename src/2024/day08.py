@@ -2,6 +2,8 @@ import itertools
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 ............
@@ -123,24 +125,16 @@ def part2(input: str) -> int:
     return len(antinodes)
 
 
-"""
-Benchmark 1 (213 runs): ./venv/bin/python src/day08.py /tmp/.sops3766800262/tmp-file512908338
-    measurement          mean ± σ            min … max           outliers
-    wall_time          23.3ms ± 1.09ms    22.3ms … 32.8ms         12 ( 6%)
-    peak_rss           12.7MB ± 81.8KB    12.6MB … 12.9MB          0 ( 0%)
-    cpu_cycles         95.6M  ± 2.03M     92.6M  …  106M           7 ( 3%)
-    instructions        124M  ± 76.5K      124M  …  124M           0 ( 0%)
-    cache_references   5.17M  ± 85.9K     5.03M  … 5.84M           8 ( 4%)
-    cache_misses        246K  ± 97.2K      123K  …  601K           6 ( 3%)
-    branch_misses       892K  ± 11.5K      876K  …  984K           6 ( 3%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 8, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day08.txt"
-        ).read_text()
+        input_text = read_input(2024, 8)
     assert part1(EXAMPLE_INPUT) == 14
     result1 = part1(input_text)
     print(result1)
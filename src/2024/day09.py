@@ -3,6 +3,8 @@ import collections
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """2333133121414131402"""
 
@@ -110,24 +112,22 @@ def part2(input: str) -> int:
     return hash
 
 
-"""
-Benchmark 1 (10 runs): ./venv/bin/python src/day09.py /tmp/.sops3896349036/tmp-file421800216
-    measurement          mean ± σ            min … max           outliers
-    wall_time           520ms ± 14.7ms     506ms …  552ms          0 ( 0%)
-    peak_rss           19.6MB ± 65.3KB    19.5MB … 19.7MB          0 ( 0%)
-    cpu_cycles         1.88G  ± 19.9M     1.82G  … 1.89G           1 (10%)
-    instructions       5.75G  ± 46.8M     5.66G  … 5.79G           1 (10%)
-    cache_references   2.86M  ± 98.6K     2.66M  … 2.98M           0 ( 0%)
-    cache_misses        588K  ±  150K      347K  …  782K           0 ( 0%)
-    branch_misses      1.16M  ± 94.0K      991K  … 1.25M           0 ( 0%)
-"""
+def reference_part2(input: str) -> int:
+    # Straightforward version of part 2, kept to check faster ones against
+    files, _ = compact_without_fragmentation(parse_input(input))
+    return hash_files(files)
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 9, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day09.txt"
-        ).read_text()
+        input_text = read_input(2024, 9)
 
     assert part1(EXAMPLE_INPUT) == 1928
     result1 = part1(input_text)
@@ -1,6 +1,9 @@
 from pathlib import Path
 import sys
 
+from advent.grid import Grid
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 89010123
@@ -57,49 +60,35 @@ TEST_INPUT_6 = """
 98765
 """
 
-type Map = list[list[int]]
-type Coords = tuple[int, int]
-
-DIRECTIONS: list[Coords] = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+# Heights are kept as the digits of the input, which follow each other
+TRAILHEAD = "0"
+SUMMIT = "9"
 
 
-def parse_input(input: str) -> Map:
-    lines = input.strip().split("\n")
-    map: Map = []
-    for line in lines:
-        map.append([int(e) for e in line])
-    return map
+def parse_input(input: str) -> Grid:
+    return Grid(input)
 
 
 def part1(input: str) -> int:
     map = parse_input(input)
-    height = len(map)
-    width = len(map[0])
-    trailheads = [(i, j) for i in range(height) for j in range(width) if map[i][j] == 0]
+    cells = map.cells
+    summit = ord(SUMMIT)
+    trailheads = map.find_all(TRAILHEAD)
     count = 0
     for trailhead in trailheads:
-        heads = [(trailhead, map[trailhead[0]][trailhead[1]])]
-        ends: list[Coords] = []
+        heads = [(trailhead, cells[trailhead])]
+        ends: list[int] = []
         while len(heads) > 0:
             head_pos, head_val = heads.pop()
-            # Look around the adjacent cells
-            for dir in DIRECTIONS:
-                adj_line = head_pos[0] + dir[0]
-                adj_col = head_pos[1] + dir[1]
-                # Ignore OOB
-                if (
-                    adj_line < 0
-                    or adj_line >= height
-                    or adj_col < 0
-                    or adj_col >= width
-                ):
-                    continue
-                adj_val = map[adj_line][adj_col]
+            # Look around the adjacent cells, the border never matches
+            for offset in map.directions:
+                adj_pos = head_pos + offset
+                adj_val = cells[adj_pos]
                 if adj_val == head_val + 1:
-                    new_potential_head = ((adj_line, adj_col), head_val + 1)
-                    if adj_val == 9 and (adj_line, adj_col) not in ends:
+                    new_potential_head = (adj_pos, head_val + 1)
+                    if adj_val == summit and adj_pos not in ends:
                         count += 1
-                        ends.append((adj_line, adj_col))
+                        ends.append(adj_pos)
                     elif new_potential_head not in heads:
                         heads.append(new_potential_head)
 
@@ -108,69 +97,44 @@ def part1(input: str) -> int:
 
 def part2(input: str) -> int:
     map = parse_input(input)
-    height = len(map)
-    width = len(map[0])
+    cells = map.cells
     # Build a map of how many times each location was traversed
-    shadow_map = [[0 for _ in range(width)] for _ in range(height)]
+    shadow_map = [0] * len(cells)
     # Set all the tiles at height 0 to a traversal count of 1
-    for i in range(height):
-        for j in range(width):
-            if map[i][j] == 0:
-                shadow_map[i][j] = 1
-
-    trail_heads: set[Coords] = set(
-        [(i, j) for i in range(height) for j in range(width) if map[i][j] == 0]
-    )
+    trail_heads = set(map.find_all(TRAILHEAD))
+    for head in trail_heads:
+        shadow_map[head] = 1
+
     # Iterate over each height level (except 9)
-    for i in range(9):
-        next_trail_heads: set[Coords] = set()
+    for height in range(ord(TRAILHEAD), ord(SUMMIT)):
+        next_trail_heads: set[int] = set()
         for head in trail_heads:
             # Check each adjacent cell
-            for direction in DIRECTIONS:
-                adj_line = head[0] + direction[0]
-                adj_col = head[1] + direction[1]
-                if (
-                    adj_line < 0
-                    or adj_line >= height
-                    or adj_col < 0
-                    or adj_col >= width
-                ):
-                    continue
-
-                neighbour = map[adj_line][adj_col]
-                if neighbour == i + 1:
+            for offset in map.directions:
+                adj_pos = head + offset
+                if cells[adj_pos] == height + 1:
                     # This cell is a continuation of the trail
-                    shadow_map[adj_line][adj_col] += shadow_map[head[0]][head[1]]
-                    next_trail_heads.add((adj_line, adj_col))
+                    shadow_map[adj_pos] += shadow_map[head]
+                    next_trail_heads.add(adj_pos)
         trail_heads = next_trail_heads
 
     # Count the number of trails leading to each cell of value '9'
     count = 0
-    for i in range(height):
-        for j in range(width):
-            if map[i][j] == 9:
-                count += shadow_map[i][j]
+    for summit in map.find_all(SUMMIT):
+        count += shadow_map[summit]
     return count
 
 
-"""
-Benchmark 1 (157 runs): ./venv/bin/python src/day10.py /tmp/.sops1870891364/tmp-file3033514338
-    measurement          mean ± σ            min … max           outliers
-    wall_time          31.8ms ± 4.47ms    27.2ms … 48.3ms          8 ( 5%)
-    peak_rss           12.7MB ± 86.0KB    12.4MB … 12.8MB          0 ( 0%)
-    cpu_cycles         88.3M  ± 9.58M     46.0M  …  105M          19 (12%)
-    instructions        197M  ± 14.8M      130M  …  207M          11 ( 7%)
-    cache_references   1.04M  ±  106K      592K  … 1.25M           7 ( 4%)
-    cache_misses        127K  ± 73.5K     29.4K  …  310K           0 ( 0%)
-    branch_misses       738K  ± 99.0K      268K  …  818K          15 (10%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 10, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day10.txt"
-        ).read_text()
+        input_text = read_input(2024, 10)
 
     assert part1(TEST_INPUT_1) == 1
     assert part1(TEST_INPUT_2) == 1
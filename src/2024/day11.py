@@ -1,8 +1,10 @@
 from collections import defaultdict
-from functools import cache
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+from advent.memo import memoize
+
 
 EXAMPLE_INPUT = """125 17"""
 
@@ -19,7 +21,7 @@ def parse_input(input: str) -> Stones:
     return stones
 
 
-@cache
+@memoize()
 def split_stone(nb: int) -> tuple[int, int]:
     stone_str = str(nb)
     middle_idx = int(len(stone_str) / 2)
@@ -62,24 +64,16 @@ def part2(input: str) -> int:
     return count
 
 
-"""
-Benchmark 1 (52 runs): ./venv/bin/python src/day11.py /tmp/.sops2530612852/tmp-file1496266942
-    measurement          mean ± σ            min … max           outliers
-    wall_time          96.4ms ± 3.90ms    91.2ms …  119ms          2 ( 4%)
-    peak_rss           13.4MB ± 78.5KB    13.3MB … 13.6MB          0 ( 0%)
-    cpu_cycles          402M  ± 6.33M      391M  …  426M           2 ( 4%)
-    instructions        772M  ±  739K      771M  …  773M           0 ( 0%)
-    cache_references   8.92M  ±  163K     8.53M  … 9.40M           1 ( 2%)
-    cache_misses       1.01M  ±  174K      680K  … 1.64M           1 ( 2%)
-    branch_misses      2.23M  ± 33.1K     2.17M  … 2.30M           0 ( 0%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 11, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day11.txt"
-        ).read_text()
+        input_text = read_input(2024, 11)
 
     assert part1(EXAMPLE_INPUT) == 55312
     result1 = part1(input_text)
@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+from advent.parsing import records
+
 
 EXAMPLE_INPUT = """
 Button A: X+94, Y+34
@@ -33,22 +36,8 @@ class Machine:
 
 
 def parse_input(input: str) -> list[Machine]:
-    machines: list[Machine] = []
-    machines_str = input.strip().split("\n\n")
-    for machine_str in machines_str:
-        a_line, b_line, p_line = machine_str.strip().split("\n")
-        _, _, ax_str, ay_str = a_line.split()
-        _, _, bx_str, by_str = b_line.split()
-        _, px_str, py_str = p_line.split()
-        ax = int(ax_str[2:-1])
-        ay = int(ay_str[2:])
-        bx = int(bx_str[2:-1])
-        by = int(by_str[2:])
-        px = int(px_str[2:-1])
-        py = int(py_str[2:])
-        machine = Machine(ax, ay, bx, by, px, py)
-        machines.append(machine)
-    return machines
+    # The 6 integers of each machine: buttons A and B, then the prize
+    return [Machine(*machine) for machine in records(input, 6).tolist()]
 
 
 def solve_machine(m: Machine, max_presses: int | None = None) -> int:
@@ -89,24 +78,16 @@ def part2(input: str) -> int:
     return count
 
 
-"""
-Benchmark 1 (152 runs): ./venv/bin/python src/day13.py /tmp/.sops857850962/tmp-file239295447
-    measurement          mean ± σ            min … max           outliers
-    wall_time          32.5ms ±  965us    31.3ms … 38.4ms         11 ( 7%)
-    peak_rss           14.4MB ± 65.5KB    14.2MB … 14.5MB          0 ( 0%)
-    cpu_cycles          144M  ± 3.31M      140M  …  158M          12 ( 8%)
-    instructions        191M  ±  137K      191M  …  191M           1 ( 1%)
-    cache_references   7.59M  ± 75.4K     7.40M  … 7.87M           5 ( 3%)
-    cache_misses        410K  ±  187K      207K  … 1.10M          11 ( 7%)
-    branch_misses      1.32M  ± 7.00K     1.30M  … 1.34M           1 ( 1%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 13, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day13.txt"
-        ).read_text()
+        input_text = read_input(2024, 13)
 
     assert part1(EXAMPLE_INPUT) == 480
     result1 = part1(input_text)
@@ -1,9 +1,13 @@
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
-import re
 import sys
 from typing import Literal
 
+from advent.inputs import read_input
+from advent.parsing import records
+from advent.watchdog import progress
+
 
 EXAMPLE_INPUT = """
 p=0,4 v=3,-3
@@ -29,15 +33,17 @@ class Robot:
     vy: int
 
 
+# Size of the real bathroom, the example uses a smaller one
+PART1_ARGS = (101, 103)
+
+
 def parse_input(input: str) -> list[Robot]:
-    robots: list[Robot] = []
-    lines = input.strip().split("\n")
-    for line in lines:
-        matches = re.findall(r"-?\d+", line)
-        px, py, vx, vy = [int(e) for e in matches]
-        robot = Robot(px, py, vx, vy)
-        robots.append(robot)
-    return robots
+    return [Robot(*robot) for robot in records(input, 4).tolist()]
+
+
+def iter_robots(chunks: Iterable[str]) -> Iterator[Robot]:
+    for chunk in chunks:
+        yield from parse_input(chunk)
 
 
 def move_and_get_quadrant(
@@ -65,7 +71,7 @@ def move_and_get_quadrant(
 
 
 def compute_safety_factor_after_move(
-    robots: list[Robot], nb_steps: int, width: int, height: int
+    robots: Iterable[Robot], nb_steps: int, width: int, height: int
 ) -> int:
     quadrants_count = [0] * 4
     for robot in robots:
@@ -87,6 +93,11 @@ def part1(input: str, width: int, height: int) -> int:
     return compute_safety_factor_after_move(robots, 100, width, height)
 
 
+def stream_part1(chunks: Iterable[str], width: int, height: int) -> int:
+    # Part 2 moves every robot thousands of times, they must all be in memory
+    return compute_safety_factor_after_move(iter_robots(chunks), 100, width, height)
+
+
 def part2(input: str) -> int:
     # Full bluff, let's assume that lowest safety = most clumped robots = picture
     # I hate this problem
@@ -97,6 +108,7 @@ def part2(input: str) -> int:
     safest_iter = 0
     min_safety = 1e12
     for i in range(max_iters):
+        progress(i)
         safety_factor = compute_safety_factor_after_move(robots, i, 101, 103)
         if safety_factor < min_safety:
             safest_iter = i
@@ -104,27 +116,19 @@ def part2(input: str) -> int:
     return safest_iter
 
 
-"""
-Benchmark 1 (3 runs): ./venv/bin/python src/day14.py /tmp/.sops379695281/tmp-file554841587
-    measurement          mean ± σ            min … max           outliers
-    wall_time          3.06s  ± 49.2ms    3.03s  … 3.11s           0 ( 0%)
-    peak_rss           14.7MB ± 48.9KB    14.6MB … 14.7MB          0 ( 0%)
-    cpu_cycles         14.0G  ± 66.2M     14.0G  … 14.1G           0 ( 0%)
-    instructions       36.3G  ±  222K     36.3G  … 36.3G           0 ( 0%)
-    cache_references   28.2M  ± 4.46M     24.9M  … 33.3M           0 ( 0%)
-    cache_misses       4.97M  ± 2.33M     3.54M  … 7.65M           0 ( 0%)
-    branch_misses      44.5M  ± 1.27M     43.5M  … 45.9M           0 ( 0%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 14, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day14.txt"
-        ).read_text()
+        input_text = read_input(2024, 14)
 
     assert part1(EXAMPLE_INPUT, 11, 7) == 12
-    result1 = part1(input_text, 101, 103)
+    result1 = part1(input_text, *PART1_ARGS)
     print(result1)
 
     result2 = part2(input_text)
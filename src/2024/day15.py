@@ -1,6 +1,8 @@
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 ##########
@@ -387,18 +389,16 @@ def part2(input: str) -> int:
     return count
 
 
-"""
-Benchmark 1: ./venv/bin/python src/day15.py /var/folders/fm/891_8yt158b05hy09ypkjyt40000gn/T/.sops2761808855/tmp-file576825842
-    Time (mean ± σ):     125.7 ms ±  10.2 ms    [User: 107.8 ms, System: 12.2 ms]
-    Range (min … max):   110.5 ms … 148.4 ms    22 runs
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 15, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day15.txt"
-        ).read_text()
+        input_text = read_input(2024, 15)
 
     assert part1(TEST_INPUT_1) == 2028
     assert part1(EXAMPLE_INPUT) == 10092
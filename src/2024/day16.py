@@ -1,7 +1,9 @@
-from functools import cache
 from pathlib import Path
 import sys
-from typing import Literal
+
+from advent.grid import BORDER, Grid
+from advent.inputs import read_input
+from advent.search import dijkstra
 
 EXAMPLE_INPUT = """
 ###############
@@ -56,216 +58,95 @@ TEST_INPUT_3 = """
 """
 
 
-type Coords = tuple[int, int]
-type Axis = Literal["v", "h"]
-type CoordsAndAxis = tuple[Coords, Axis]
-# String in the form "$xpos_$ypos_$axis"
-type NodeId = str
+# Index of a cell in the grid
+type Position = int
+# VERTICAL or HORIZONTAL
+type Axis = int
+# Node of the search: a position and the axis the reindeer faces, see node_id
+type NodeId = int
 type Cost = int
-type HeuristicValue = int
-type Graph = dict[NodeId, list[tuple[Cost, NodeId]]]
 
-FLOOR = "."
-WALL = "#"
+WALL = ord("#")
 START = "S"
 END = "E"
-UP = (-1, 0)
-DOWN = (1, 0)
-LEFT = (0, 1)
-RIGHT = (0, -1)
-DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
-UPDOWN = (UP, DOWN)
-LEFTRIGHT = (LEFT, RIGHT)
+VERTICAL = 0
+HORIZONTAL = 1
+AXES = (VERTICAL, HORIZONTAL)
+# Moving forward, and turning then moving
+STEP_COST = 1
+TURN_COST = 1_001
 
 
 class NoNextNodeFoundError(Exception):
     pass
 
 
-class InvalidIdError(Exception):
-    pass
+def node_id(pos: Position, axis: Axis) -> NodeId:
+    return pos * len(AXES) + axis
 
 
-def move(pos: Coords, direction: Coords) -> Coords:
-    return (pos[0] + direction[0], pos[1] + direction[1])
+def id_to_pos_and_axis(id: NodeId) -> tuple[Position, Axis]:
+    return divmod(id, len(AXES))
 
 
 class Map:
-    _grid: list[list[str]]
-    # How to interpret:
-    # When entering cell N from axis X, lookup graph[(N,X)]
-    # It provides a list of reachable cells, the axis used to travel to them, and the cost to reach them
-    graph: Graph
-    width: int
-    height: int
-    start: Coords
-    end: Coords
-
-    def __init__(self, grid: list[list[str]]) -> None:
-        self.height = len(grid)
-        self.width = len(grid[0])
-        self.graph = {}
-        self._grid = grid
-        for i, line in enumerate(grid):
-            if START in line:
-                self.start = (i, line.index(START))
-            if END in line:
-                self.end = (i, line.index(END))
-
-    def build_graph(self) -> None:
-        for line_idx in range(self.height):
-            for col_idx in range(self.width):
-                if self.grid((line_idx, col_idx)) == WALL:
+    grid: Grid
+    # Offsets of the moves along each axis
+    moves: tuple[tuple[int, int], tuple[int, int]]
+    start: Position
+    end: Position
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+        up, right, down, left = grid.directions
+        self.moves = ((up, down), (left, right))
+        self.start = grid.find(START)
+        self.end = grid.find(END)
+
+    def neighbors(self, id: NodeId) -> list[tuple[NodeId, Cost]]:
+        """Nodes reachable from `id` and the cost to reach them.
+
+        Walls and the border are never reached, the reindeer can move along its
+        axis, or turn and move along the other one.
+        """
+        pos, axis = id_to_pos_and_axis(id)
+        cells = self.grid.cells
+        neighbors: list[tuple[NodeId, Cost]] = []
+        for move_axis in AXES:
+            cost = STEP_COST if move_axis == axis else TURN_COST
+            for offset in self.moves[move_axis]:
+                adj_pos = pos + offset
+                if cells[adj_pos] in (WALL, BORDER):
                     continue
+                neighbors.append((node_id(adj_pos, move_axis), cost))
+        return neighbors
 
-                vert_edges: list[tuple[Cost, NodeId]] = []
-                hor_edges: list[tuple[Cost, NodeId]] = []
-
-                for direction in UPDOWN:
-                    adj_coords = move((line_idx, col_idx), direction)
-                    if self.is_oob(adj_coords):
-                        continue
-                    if self.grid(adj_coords) == WALL:
-                        continue
-                    # Add edge of weight 1 for movement in same direction
-                    vert_edges.append(
-                        (
-                            1,
-                            coords_and_axis_to_id(adj_coords, "v"),
-                        )
-                    )
-                    # Add edge of weigth 1000 for movement in different direction
-                    hor_edges.append(
-                        (
-                            1_001,
-                            coords_and_axis_to_id(adj_coords, "v"),
-                        )
-                    )
-
-                for direction in LEFTRIGHT:
-                    adj_coords = move((line_idx, col_idx), direction)
-                    if self.is_oob(adj_coords):
-                        continue
-                    if self.grid(adj_coords) == WALL:
-                        continue
-                    # Add edge of weigth 1000 for movement in different direction
-                    vert_edges.append(
-                        (
-                            1_001,
-                            coords_and_axis_to_id(adj_coords, "h"),
-                        )
-                    )
-                    # Add edge of weight 1 for movement in same direction
-                    hor_edges.append(
-                        (
-                            1,
-                            coords_and_axis_to_id(adj_coords, "h"),
-                        )
-                    )
-                self.graph[coords_and_axis_to_id((line_idx, col_idx), "v")] = vert_edges
-                self.graph[coords_and_axis_to_id((line_idx, col_idx), "h")] = hor_edges
-
-        # Link the end cells together for free
-        self.graph[coords_and_axis_to_id(self.end, "v")].append(
-            ((0, coords_and_axis_to_id(self.end, "h")))
-        )
-        self.graph[coords_and_axis_to_id(self.end, "h")].append(
-            (0, coords_and_axis_to_id(self.end, "v"))
-        )
-
-    def grid(self, pos: Coords) -> str:
-        return self._grid[pos[0]][pos[1]]
-
-    def is_oob(self, cell: Coords) -> bool:
-        if (
-            cell[0] < 0
-            or cell[0] >= self.height
-            or cell[1] < 0
-            or cell[1] >= self.width
-        ):
-            return True
-        return False
+    def distance_to_end(self, id: NodeId) -> Cost:
+        # Every step costs at least 1, so this never overestimates
+        line, col = self.grid.coords(id_to_pos_and_axis(id)[0])
+        end_line, end_col = self.grid.coords(self.end)
+        return abs(line - end_line) + abs(col - end_col)
 
     def find_cheapest_path(self) -> int:
-        # Do a dijkstra without a priority queue
-        dist: dict[NodeId, int] = {}
-        prev: dict[NodeId, NodeId | None] = {}
-        # Let's just pretend this is a priority queue
-        # Actually, we bin nodes in lists based on their currently estimated cost
-        queue: dict[Cost, list[NodeId]] = {0: [], sys.maxsize: []}
-
-        # Initialize the data structures
-        for vertex in self.graph.keys():
-            dist[vertex] = sys.maxsize
-            prev[vertex] = None
-            if vertex != coords_and_axis_to_id(self.start, "h"):
-                queue[sys.maxsize].append(vertex)
-            else:
-                queue[0].append(vertex)
-        dist[coords_and_axis_to_id(self.start, "h")] = 0
-
-        # Run the search
-        end_vert_node = coords_and_axis_to_id(self.end, "v")
-        end_hor_node = coords_and_axis_to_id(self.end, "h")
-        next_node = None
-        while len(queue) > 0:
-            # Get the entry with the lower value
-            next_dist = min(queue.keys())
-            next_node = queue[next_dist].pop()
-            if queue[next_dist] == []:
-                del queue[next_dist]
-            if next_node == end_hor_node or next_node == end_vert_node:
-                break
-
-            for neighbor in self.graph[next_node]:
-                alt = next_dist + neighbor[0]
-                if alt < dist[neighbor[1]]:
-                    queue[dist[neighbor[1]]].remove(neighbor[1])
-                    if queue[dist[neighbor[1]]] == []:
-                        del queue[dist[neighbor[1]]]
-                    if alt not in queue:
-                        queue[alt] = []
-                    queue[alt].append(neighbor[1])
-                    dist[neighbor[1]] = alt
-                    prev[neighbor[1]] = next_node
-
-        # Traceback through the prev dict to find the path
-        # next_node contains the actual node of the end
-        if next_node is None:
+        # The reindeer starts facing east, and may reach the end on either axis
+        result = dijkstra(
+            [node_id(self.start, HORIZONTAL)],
+            self.neighbors,
+            len(self.grid.cells) * len(AXES),
+            goal=lambda id: id_to_pos_and_axis(id)[0] == self.end,
+            heuristic=self.distance_to_end,
+        )
+        if result.goal is None:
             raise NoNextNodeFoundError
-        cost = dist[next_node]
-
-        return cost
-
-
-@cache
-def coords_and_axis_to_id(pos: Coords, axis: Axis) -> NodeId:
-    id = f"{pos[0]}_{pos[1]}_{axis}"
-    return id
-
-
-@cache
-def id_to_coords_and_axis(id: NodeId) -> CoordsAndAxis:
-    x_str, y_str, axis = id.split("_")
-    pos = (int(x_str), int(y_str))
-    if axis == "v":
-        return (pos, "v")
-    elif axis == "h":
-        return (pos, "h")
-    raise InvalidIdError(id)
+        return result.distance(result.goal)
 
 
 def parse_input(input: str) -> Map:
-    lines = input.strip().split("\n")
-    grid: list[list[str]] = []
-    for line in lines:
-        grid.append([e for e in line])
-    return Map(grid)
+    return Map(Grid(input))
 
 
 def part1(input: str) -> int:
     map = parse_input(input)
-    map.build_graph()
     cost = map.find_cheapest_path()
     return cost
 
@@ -275,15 +156,16 @@ def part2(input: str) -> int:
     return count
 
 
-"""
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 16, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day16.txt"
-        ).read_text()
+        input_text = read_input(2024, 16)
 
     assert part1(TEST_INPUT_3) == 2
     assert part1(TEST_INPUT_2) == 1004
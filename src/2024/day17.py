@@ -3,6 +3,10 @@ from pathlib import Path
 import re
 import sys
 
+from advent.inputs import read_input
+from advent.parsing import IntegerOverflowError, integers
+from advent.watchdog import progress
+
 
 EXAMPLE_INPUT = """
 Register A: 729
@@ -146,6 +150,7 @@ class CPU:
             # FIXME: maybe using a bitwise AND with 0b111 would be faster?
             result = operand % 8
             self.out.append(result)
+            progress(len(self.out))
         else:
             raise InvalidOpCode(f"Invalid opcode {opcode}")
 
@@ -166,11 +171,12 @@ class CPU:
 
 
 def parse_input(input: str) -> CPU:
-    lines = input.strip().split("\n")
-    a = int(re.findall(r"\d+", lines[0])[0])
-    b = int(re.findall(r"\d+", lines[1])[0])
-    c = int(re.findall(r"\d+", lines[2])[0])
-    instructions = [int(e) for e in re.findall(r"\d+", lines[4])]
+    # The registers, then the program
+    try:
+        a, b, c, *instructions = integers(input).tolist()
+    except IntegerOverflowError:
+        # Registers can outgrow an int64, Python ints do not
+        a, b, c, *instructions = [int(e) for e in re.findall(r"-?\d+", input)]
     cpu = CPU(a, b, c, instructions)
     return cpu
 
@@ -189,15 +195,16 @@ def part2(input: str, a_override: int | None = None) -> list[int]:
     return result
 
 
-"""
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 17, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day17.txt"
-        ).read_text()
+        input_text = read_input(2024, 17)
 
     assert part1(EXAMPLE_INPUT) == "4,6,3,5,6,3,5,2,1,0"
     assert part1(EXAMPLE_INPUT_2) == "0,3,5,4,3,0"
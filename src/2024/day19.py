@@ -1,7 +1,9 @@
-from functools import cache
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+from advent.memo import memoize
+
 
 EXAMPLE_INPUT = """
 r, wr, b, g, bwu, rb, gb, br
@@ -27,7 +29,9 @@ def parse_input(input: str) -> tuple[tuple[Towel, ...], tuple[Pattern, ...]]:
     return towels, patterns
 
 
-@cache
+# The towels are the same for every pattern of an input, only the pattern is
+# worth hashing, and parts clear the caches before using them
+@memoize(key=lambda pattern, towels: pattern)
 def pattern_is_doable(pattern: Pattern, towels: tuple[Towel, ...]) -> bool:
     if len(pattern) == 0:
         return True
@@ -39,7 +43,7 @@ def pattern_is_doable(pattern: Pattern, towels: tuple[Towel, ...]) -> bool:
     return is_doable
 
 
-@cache
+@memoize(key=lambda pattern, towels: pattern)
 def count_doable_patterns(pattern: Pattern, towels: tuple[Towel, ...]) -> int:
     if len(pattern) == 0:
         return 1
@@ -53,6 +57,7 @@ def count_doable_patterns(pattern: Pattern, towels: tuple[Towel, ...]) -> int:
 
 def part1(input: str) -> int:
     towels, patterns = parse_input(input)
+    pattern_is_doable.cache_clear()
     count = 0
     for pattern in patterns:
         if pattern_is_doable(pattern, towels):
@@ -62,30 +67,23 @@ def part1(input: str) -> int:
 
 def part2(input: str) -> int:
     towels, patterns = parse_input(input)
+    count_doable_patterns.cache_clear()
     count = 0
     for pattern in patterns:
         count += count_doable_patterns(pattern, towels)
     return count
 
 
-"""
-Benchmark 1 (8 runs): ./venv/bin/python src/day19.py /tmp/.sops4167395053/tmp-file721990689
-    measurement          mean ± σ            min … max           outliers
-    wall_time           626ms ± 10.3ms     614ms …  645ms          0 ( 0%)
-    peak_rss           22.3MB ±  130KB    22.1MB … 22.5MB          0 ( 0%)
-    cpu_cycles         2.29G  ± 21.3M     2.24G  … 2.30G           2 (25%)
-    instructions       9.57G  ±  109M     9.32G  … 9.65G           2 (25%)
-    cache_references   2.56M  ±  103K     2.42M  … 2.72M           0 ( 0%)
-    cache_misses        571K  ±  115K      445K  …  728K           0 ( 0%)
-    branch_misses      3.94M  ± 69.3K     3.83M  … 4.03M           0 ( 0%)
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 19, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day19.txt"
-        ).read_text()
+        input_text = read_input(2024, 19)
 
     assert part1(EXAMPLE_INPUT) == 6
     result1 = part1(input_text)
@@ -1,7 +1,11 @@
 from collections import deque
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+from advent.parsing import integers
+
 
 EXAMPLE_INPUT = """
 1
@@ -19,10 +23,15 @@ TEST_INPUT_1 = """
 
 
 def parse_input(input: str) -> list[int]:
-    secrets = [int(e) for e in input.strip().split()]
+    secrets: list[int] = integers(input).tolist()
     return secrets
 
 
+def iter_secrets(chunks: Iterable[str]) -> Iterator[int]:
+    for chunk in chunks:
+        yield from parse_input(chunk)
+
+
 def mix(a: int, b: int) -> int:
     return a ^ b
 
@@ -41,8 +50,7 @@ def cycle(val: int) -> int:
     return val
 
 
-def part1(input: str) -> int:
-    secrets = parse_input(input)
+def sum_of_secrets(secrets: Iterable[int]) -> int:
     count = 0
     for secret in secrets:
         for _ in range(2000):
@@ -51,8 +59,7 @@ def part1(input: str) -> int:
     return count
 
 
-def part2(input: str) -> int:
-    secrets = parse_input(input)
+def best_sequence_price(secrets: Iterable[int]) -> int:
     count = 0
     sequences_prices: dict[tuple[int, ...], int] = {}
     for secret in secrets:
@@ -82,18 +89,33 @@ def part2(input: str) -> int:
     return most_valuable_sequence_price
 
 
-"""
-Benchmark 1: ./venv/bin/python src/day22.py /var/folders/fm/891_8yt158b05hy09ypkjyt40000gn/T/.sops2393224265/tmp-file3319837045
-    Time (mean ± σ):      7.071 s ±  0.299 s    [User: 6.947 s, System: 0.041 s]
-    Range (min … max):    6.685 s …  7.576 s    10 runs
-"""
+def part1(input: str) -> int:
+    return sum_of_secrets(parse_input(input))
+
+
+def part2(input: str) -> int:
+    return best_sequence_price(parse_input(input))
+
+
+def stream_part1(chunks: Iterable[str]) -> int:
+    return sum_of_secrets(iter_secrets(chunks))
+
+
+def stream_part2(chunks: Iterable[str]) -> int:
+    # Only the prices of the 19**4 sequences are kept, not the secrets
+    return best_sequence_price(iter_secrets(chunks))
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 22, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day22.txt"
-        ).read_text()
+        input_text = read_input(2024, 22)
 
     assert part1(EXAMPLE_INPUT) == 37327623
     result1 = part1(input_text)
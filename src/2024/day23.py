@@ -1,7 +1,10 @@
+from collections.abc import Iterable
 from functools import reduce
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 EXAMPLE_INPUT = """
 kh-tc
 qp-kh
@@ -43,8 +46,18 @@ type Network = dict[Hostname, set[Hostname]]
 
 
 def parse_input(input: str) -> Network:
-    lines = input.strip().split("\n")
+    return parse_chunks([input])
+
+
+def parse_chunks(chunks: Iterable[str]) -> Network:
     network: Network = {}
+    for chunk in chunks:
+        add_links(network, chunk)
+    return network
+
+
+def add_links(network: Network, input: str) -> None:
+    lines = input.strip().split("\n")
     for line in lines:
         host1, host2 = line.split("-")
         if host1 not in network:
@@ -53,7 +66,6 @@ def parse_input(input: str) -> Network:
             network[host2] = set()
         network[host1].add(host2)
         network[host2].add(host1)
-    return network
 
 
 def triplet_to_str(triplet: tuple[Hostname, Hostname, Hostname]) -> str:
@@ -89,8 +101,7 @@ def find_all_cliques(network: Network) -> list[set[Hostname]]:
     return cliques
 
 
-def part1(input: str) -> int:
-    network = parse_input(input)
+def count_triplets(network: Network) -> int:
     # Each triplet is represented as a concatenation of the hostnames, after
     # sorting them alphabetically
     triplets: set[str] = set()
@@ -110,26 +121,40 @@ def part1(input: str) -> int:
     return count
 
 
-def part2(input: str) -> str:
-    network = parse_input(input)
+def lan_party_password(network: Network) -> str:
     cliques = find_all_cliques(network)
     max_clique = max(cliques, key=lambda clique: len(clique))
     password = ",".join(sorted(max_clique))
     return password
 
 
-"""
-Benchmark 1: ./venv/bin/python src/day23.py /var/folders/fm/891_8yt158b05hy09ypkjyt40000gn/T/.sops1188168711/tmp-file1330927531
-    Time (mean ± σ):      55.8 ms ±   2.9 ms    [User: 43.2 ms, System: 9.3 ms]
-    Range (min … max):    48.5 ms …  62.5 ms    48 runs
-"""
+def part1(input: str) -> int:
+    return count_triplets(parse_input(input))
+
+
+def part2(input: str) -> str:
+    return lan_party_password(parse_input(input))
+
+
+def stream_part1(chunks: Iterable[str]) -> int:
+    # The network is needed whole, but not the text of its links
+    return count_triplets(parse_chunks(chunks))
+
+
+def stream_part2(chunks: Iterable[str]) -> str:
+    return lan_party_password(parse_chunks(chunks))
+
+
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 23, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day23.txt"
-        ).read_text()
+        input_text = read_input(2024, 23)
 
     assert part1(EXAMPLE_INPUT) == 7
     result1 = part1(input_text)
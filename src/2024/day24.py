@@ -3,6 +3,8 @@ import re
 import sys
 from typing import Callable
 
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 x00: 1
@@ -372,18 +374,16 @@ def part2(input: str) -> str:
     return output
 
 
-"""
-Benchmark 1: ./venv/bin/python src/day24.py /var/folders/fm/891_8yt158b05hy09ypkjyt40000gn/T/.sops45296776/tmp-file65667850
-    Time (mean ± σ):      87.6 ms ±   6.6 ms    [User: 73.1 ms, System: 10.9 ms]
-    Range (min … max):    78.9 ms … 103.3 ms    31 runs
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 24, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day24.txt"
-        ).read_text()
+        input_text = read_input(2024, 24)
 
     assert part1(TEST_INPUT_1) == 4
     assert part1(EXAMPLE_INPUT) == 2024
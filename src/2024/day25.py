@@ -1,6 +1,8 @@
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 #####
@@ -91,18 +93,16 @@ def part1(input: str) -> int:
     return potential_matches
 
 
-"""
-Benchmark 1: ./venv/bin/python src/day25.py /var/folders/fm/891_8yt158b05hy09ypkjyt40000gn/T/.sops4205263516/tmp-file1023618495
-    Time (mean ± σ):      59.4 ms ±   1.9 ms    [User: 47.8 ms, System: 8.6 ms]
-    Range (min … max):    56.7 ms …  67.7 ms    40 runs
-"""
 if __name__ == "__main__":
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(2024, 25, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "2024" / "day25.txt"
-        ).read_text()
+        input_text = read_input(2024, 25)
 
     assert part1(EXAMPLE_INPUT) == 3
     result1 = part1(input_text)
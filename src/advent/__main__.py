@@ -0,0 +1,480 @@
+import argparse
+from pathlib import Path
+import sys
+import time
+
+from advent.bench import (
+    BENCH_PHASES,
+    BenchmarkRecord,
+    RecordsNotFoundError,
+    benchmark_day,
+    git_commit,
+    import_docstrings,
+    load_records,
+    records_path,
+    render_poop,
+    render_table,
+    resolve_records_path,
+    save_records,
+)
+from advent.compare import compare_records, render_comparison
+from advent.days import ROOT_DIR, Day, discover, parse_day_range, parse_years
+from advent.differential import (
+    DEFAULT_SEEDS,
+    DEFAULT_SIZES,
+    DifferentialResult,
+    check_day,
+    render_differential,
+)
+from advent.generators import GeneratorNotFoundError, generate, generator_module
+from advent.inputs import default_provider
+from advent.profiling import DEFAULT_TOP
+from advent.runner import (
+    MEMORY,
+    PROFILE,
+    SAMPLE,
+    aggregate_samples,
+    format_reports,
+    format_table,
+    format_timeouts,
+    record_timings,
+    run_batch,
+    run_days,
+)
+from advent.sampling import AGGREGATE_PATH
+from advent.scaling import ScalingResult, measure_scaling, render_scaling
+from advent.startup import (
+    BUNDLE_PATH,
+    DEFAULT_PACKAGES,
+    DEFAULT_REPEAT,
+    build_bundle,
+    render_startup,
+    startup_reports,
+)
+from advent.watchdog import DEFAULT_BUDGET
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="advent")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Solve days from a single entry point"
+    )
+    run_parser.add_argument("years", type=parse_years, help='e.g. 2024 or "all"')
+    run_parser.add_argument("days", nargs="?", default="1-25", type=parse_day_range)
+    run_parser.add_argument(
+        "--part", type=int, choices=(1, 2), action="append", dest="parts"
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Spread the parts over a pool of N worker processes",
+    )
+    run_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_BUDGET,
+        help="Seconds each part may run, parse included, before it is stopped, "
+        "unless its day sets PART<N>_TIME_BUDGET (0: no limit) "
+        f"(default: {DEFAULT_BUDGET:g})",
+    )
+    run_parser.add_argument(
+        "--input",
+        type=Path,
+        action="append",
+        dest="inputs",
+        help="Solve the days on this input file, or on every file of this "
+        "directory, instead of the puzzle input (repeatable, not watched)",
+    )
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="With --input, read the files a chunk at a time in the parts that "
+        "can, for inputs too large to hold in memory",
+    )
+    instrument_group = run_parser.add_mutually_exclusive_group()
+    instrument_group.add_argument(
+        "--profile",
+        action="store_const",
+        const=PROFILE,
+        dest="instrument",
+        help="Profile each phase, saving .pstats files under .advent/profiles",
+    )
+    instrument_group.add_argument(
+        "--memory",
+        action="store_const",
+        const=MEMORY,
+        dest="instrument",
+        help="Trace the allocations of each phase with tracemalloc",
+    )
+    instrument_group.add_argument(
+        "--sample",
+        action="store_const",
+        const=SAMPLE,
+        dest="instrument",
+        help="Sample the stacks of each phase, saving flame graph input under "
+        ".advent/samples",
+    )
+    run_parser.add_argument(
+        "--aggregate",
+        type=Path,
+        nargs="?",
+        const=AGGREGATE_PATH,
+        default=None,
+        help="With --sample, also merge the samples of every phase into one file "
+        f"(default: {AGGREGATE_PATH.relative_to(ROOT_DIR)})",
+    )
+    run_parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="Number of functions or allocation sites to report per phase",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark the parse, part1 and part2 phases of days, and whole runs",
+    )
+    bench_parser.add_argument("years", type=parse_years, help='e.g. 2024 or "all"')
+    bench_parser.add_argument("days", nargs="?", default="1-25", type=parse_day_range)
+    bench_parser.add_argument(
+        "--phase", choices=BENCH_PHASES, action="append", dest="phases"
+    )
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument("-n", "--repeat", type=int, default=10)
+    bench_parser.add_argument(
+        "--format", choices=("table", "poop"), default="table", dest="output_format"
+    )
+    bench_parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="JSON file to record the results in (default: benchmarks/<commit>.json)",
+    )
+    bench_parser.add_argument("--no-save", action="store_true")
+    bench_parser.add_argument(
+        "--size",
+        type=int,
+        default=None,
+        help="Benchmark on a generated input of this size instead of the real one",
+    )
+    bench_parser.add_argument("--seed", type=int, default=0)
+
+    import_parser = subparsers.add_parser(
+        "bench-import",
+        help="Import the benchmark blocks pasted in the solutions as baselines",
+    )
+    import_parser.add_argument("years", type=parse_years, help='e.g. 2024 or "all"')
+    import_parser.add_argument("days", nargs="?", default="1-25", type=parse_day_range)
+
+    show_parser = subparsers.add_parser("bench-show", help="Render recorded results")
+    show_parser.add_argument("reference", help="Records file or commit")
+    show_parser.add_argument(
+        "--format", choices=("table", "poop"), default="table", dest="output_format"
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag benchmark regressions against a baseline"
+    )
+    compare_parser.add_argument("baseline", help="Records file or commit")
+    compare_parser.add_argument(
+        "current",
+        nargs="?",
+        default=None,
+        help="Records file or commit (default: the current commit)",
+    )
+    compare_parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=10.0,
+        help="Allowed increase of the median wall time, in percent",
+    )
+    compare_parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=10.0,
+        help="Allowed increase of the peak RSS, in percent",
+    )
+
+    scaling_parser = subparsers.add_parser(
+        "scaling",
+        help="Estimate the complexity of days on generated inputs of growing size",
+    )
+    scaling_parser.add_argument("years", type=parse_years, help='e.g. 2024 or "all"')
+    scaling_parser.add_argument("days", nargs="?", default="1-25", type=parse_day_range)
+    scaling_parser.add_argument(
+        "--part", type=int, choices=(1, 2), action="append", dest="parts"
+    )
+    scaling_parser.add_argument("--seed", type=int, default=0)
+    scaling_parser.add_argument("--start-size", type=int, default=16)
+    scaling_parser.add_argument(
+        "--points", type=int, default=5, help="Number of sizes to fit per phase"
+    )
+    scaling_parser.add_argument("-n", "--repeat", type=int, default=3)
+    scaling_parser.add_argument(
+        "--max-time",
+        type=float,
+        default=1.0,
+        help="Stop growing a phase once a call takes this long, in seconds",
+    )
+    scaling_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="Allowed excess of the fitted exponent over the expected one",
+    )
+
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="Check optimized parts against their reference versions",
+    )
+    diff_parser.add_argument("years", type=parse_years, help='e.g. 2024 or "all"')
+    diff_parser.add_argument("days", nargs="?", default="1-25", type=parse_day_range)
+    diff_parser.add_argument(
+        "--part", type=int, choices=(1, 2), action="append", dest="parts"
+    )
+    diff_parser.add_argument(
+        "--size",
+        type=int,
+        action="append",
+        dest="sizes",
+        help=f"Size of the generated inputs (default: {DEFAULT_SIZES})",
+    )
+    diff_parser.add_argument(
+        "--seeds",
+        type=int,
+        default=DEFAULT_SEEDS,
+        help="Number of generated inputs of each size",
+    )
+    diff_parser.add_argument(
+        "--no-minimize",
+        action="store_false",
+        dest="minimize",
+        help="Report failing inputs whole",
+    )
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Report the interpreter startup and import time of days"
+    )
+    startup_parser.add_argument("years", type=parse_years, help='e.g. 2024 or "all"')
+    startup_parser.add_argument("days", nargs="?", default="1-25", type=parse_day_range)
+    startup_parser.add_argument("-n", "--repeat", type=int, default=DEFAULT_REPEAT)
+    startup_parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_PACKAGES,
+        help="Number of packages to report per day, slowest to import first",
+    )
+    startup_parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Load the days from the bundle built by `advent bundle`",
+    )
+
+    subparsers.add_parser(
+        "bundle",
+        help="Build a zipapp of the harness and every solution, precompiled, "
+        f"run with `python {BUNDLE_PATH.relative_to(ROOT_DIR)} run ...`",
+    )
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate a synthetic input for a day"
+    )
+    generate_parser.add_argument("year", type=int)
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument("size", type=int)
+    generate_parser.add_argument("--seed", type=int, default=0)
+
+    input_parser = subparsers.add_parser(
+        "input-path", help="Print the path of a (decrypted) input"
+    )
+    input_parser.add_argument("year", type=int)
+    input_parser.add_argument("day", type=int)
+    return parser
+
+
+def print_records(records: list[BenchmarkRecord], output_format: str) -> None:
+    if output_format == "poop":
+        print("\n".join(render_poop(record) for record in records))
+    else:
+        print(render_table(records))
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    commit = git_commit()
+    records: list[BenchmarkRecord] = []
+    for day in discover(args.years, args.days):
+        if args.size is None and not default_provider().has_input(day.year, day.day):
+            print(f"{day.label}: missing input", file=sys.stderr)
+            continue
+        records += benchmark_day(
+            day, args.phases, args.warmup, args.repeat, commit, args.size, args.seed
+        )
+    print_records(records, args.output_format)
+    if not args.no_save and len(records) > 0:
+        save_records(records, args.output or records_path(commit))
+    return 0
+
+
+def cmd_bench_import(args: argparse.Namespace) -> int:
+    records = import_docstrings(discover(args.years, args.days))
+    print_records(records, "table")
+    return 0
+
+
+def cmd_bench_show(args: argparse.Namespace) -> int:
+    print_records(
+        load_records(resolve_records_path(args.reference)), args.output_format
+    )
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    current_reference = args.current if args.current is not None else git_commit()
+    try:
+        baseline = load_records(resolve_records_path(args.baseline))
+        current = load_records(resolve_records_path(current_reference))
+    except RecordsNotFoundError as e:
+        print(f"No benchmark records for {e}", file=sys.stderr)
+        return 1
+    comparisons, warnings = compare_records(
+        baseline, current, args.time_threshold, args.memory_threshold
+    )
+    for warning in warnings:
+        print(warning, file=sys.stderr)
+    if len(comparisons) == 0:
+        print("No day/phase in common with the baseline", file=sys.stderr)
+        return 1
+    print(render_comparison(comparisons))
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+def cmd_scaling(args: argparse.Namespace) -> int:
+    results: list[ScalingResult] = []
+    for day in discover(args.years, args.days):
+        try:
+            generator_module(day)
+        except GeneratorNotFoundError:
+            print(f"{day.label}: no input generator", file=sys.stderr)
+            continue
+        results += measure_scaling(
+            day,
+            args.parts,
+            seed=args.seed,
+            start_size=args.start_size,
+            points=args.points,
+            repeat=args.repeat,
+            max_time=args.max_time,
+        )
+    print(render_scaling(results, args.tolerance))
+    steeper = [result for result in results if result.exceeds(args.tolerance)]
+    for result in steeper:
+        print(
+            f"{result.day.label} {result.phase}: O(n^{result.exponent:.2f}), "
+            f"expected O(n^{result.expected:.2f})",
+            file=sys.stderr,
+        )
+    return 1 if len(steeper) > 0 else 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    results: list[DifferentialResult] = []
+    sizes = args.sizes if args.sizes is not None else DEFAULT_SIZES
+    for day in discover(args.years, args.days):
+        results += check_day(day, args.parts, sizes, args.seeds, args.minimize)
+    if len(results) == 0:
+        print("No reference parts to check against", file=sys.stderr)
+        return 0
+    print(render_differential(results))
+    return 1 if any(len(result.mismatches) > 0 for result in results) else 0
+
+
+def cmd_startup(args: argparse.Namespace) -> int:
+    bundle = BUNDLE_PATH if args.bundle else None
+    if bundle is not None and not bundle.is_file():
+        print(f"No bundle at {bundle}, build it with `advent bundle`", file=sys.stderr)
+        return 1
+    days = discover(args.years, args.days)
+    bare_time, reports = startup_reports(days, args.repeat, bundle)
+    print(render_startup(bare_time, reports, args.top))
+    return 1 if any(report.error is not None for report in reports) else 0
+
+
+def cmd_bundle(args: argparse.Namespace) -> int:
+    path = build_bundle()
+    print(f"Bundle written to {path}")
+    return 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    sys.stdout.write(generate(Day(args.year, args.day), args.size, args.seed))
+    return 0
+
+
+def cmd_input_path(args: argparse.Namespace) -> int:
+    print(default_provider().path(args.year, args.day))
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    days = discover(args.years, args.days)
+    start = time.perf_counter()
+    if args.inputs is not None:
+        results = run_batch(
+            days, args.inputs, args.parts, args.jobs, args.instrument, args.stream
+        )
+    else:
+        results = run_days(
+            days, args.parts, args.jobs, args.instrument, args.timeout or None
+        )
+    wall_time = time.perf_counter() - start
+    if args.instrument is None and args.inputs is None:
+        # Instrumentation overhead would skew the scheduling of later runs
+        record_timings(results)
+    print(format_table(results, wall_time if args.jobs > 1 else None))
+    timeouts = format_timeouts(results)
+    if timeouts != "":
+        print()
+        print(timeouts)
+    if args.instrument is not None:
+        print()
+        print(format_reports(results, args.top))
+    if args.instrument == SAMPLE and args.aggregate is not None:
+        aggregate_path = aggregate_samples(results, args.aggregate)
+        print()
+        print(f"Samples of every phase merged in {aggregate_path}")
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "run":
+        return cmd_run(args)
+    elif args.command == "bench":
+        return cmd_bench(args)
+    elif args.command == "bench-import":
+        return cmd_bench_import(args)
+    elif args.command == "bench-show":
+        return cmd_bench_show(args)
+    elif args.command == "compare":
+        return cmd_compare(args)
+    elif args.command == "scaling":
+        return cmd_scaling(args)
+    elif args.command == "diff":
+        return cmd_diff(args)
+    elif args.command == "startup":
+        return cmd_startup(args)
+    elif args.command == "bundle":
+        return cmd_bundle(args)
+    elif args.command == "generate":
+        return cmd_generate(args)
+    elif args.command == "input-path":
+        return cmd_input_path(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
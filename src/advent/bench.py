@@ -0,0 +1,604 @@
+import ast
+from concurrent.futures import ProcessPoolExecutor
+import copy
+from dataclasses import asdict, dataclass, field
+import datetime
+import hashlib
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from advent.days import ROOT_DIR, SRC_DIR, Day
+from advent.generators import generate, load_input
+from advent.inputs import default_provider
+from advent.memo import clear_memos, memo_stats
+from advent.solver import PARSE, PHASES, Solver, part_phase
+
+BENCHMARKS_DIR = ROOT_DIR / "benchmarks"
+DOCSTRINGS_PATH = BENCHMARKS_DIR / "docstrings.json"
+# Whole runs of a solution script, interpreter startup included, as measured
+# by the hyperfine and poop blocks that used to be pasted in the solutions
+TOTAL = "total"
+BENCH_PHASES = (*PHASES, TOTAL)
+# Runs a script after `warmup` untimed runs, then prints the wall time and the
+# peak RSS of each of `repeat` runs. A child starts with the peak RSS of the
+# process it is forked from, so the runs are forked from this small
+# interpreter rather than from the harness.
+SCRIPT_TIMER = """
+import os, subprocess, sys, time
+script, input_path, warmup, repeat = sys.argv[1:]
+for i in range(int(warmup) + int(repeat)):
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, script, input_path], stdout=subprocess.DEVNULL
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    duration = time.perf_counter() - start
+    if os.waitstatus_to_exitcode(status) != 0:
+        sys.exit(f"{script} exited with {os.waitstatus_to_exitcode(status)}")
+    if i >= int(warmup):
+        print(duration, usage.ru_maxrss)
+"""
+
+
+TIME_UNITS = {"ns": 1e-9, "us": 1e-6, "ms": 1e-3, "s": 1.0}
+SIZE_UNITS = {"B": 1, "KB": 1e3, "MB": 1e6, "GB": 1e9}
+COUNT_UNITS = {"": 1, "K": 1e3, "M": 1e6, "G": 1e9}
+
+
+class UnknownPhaseError(Exception):
+    pass
+
+
+class UnknownUnitError(Exception):
+    pass
+
+
+@dataclass
+class Measurement:
+    runs: int
+    mean: float
+    stddev: float
+    min: float
+    max: float
+    median: float | None = None
+    outliers: int = 0
+
+    @staticmethod
+    def from_samples(samples: list[float]) -> "Measurement":
+        return Measurement(
+            runs=len(samples),
+            mean=statistics.fmean(samples),
+            stddev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            min=min(samples),
+            max=max(samples),
+            median=statistics.median(samples),
+            outliers=count_outliers(samples),
+        )
+
+
+@dataclass
+class BenchmarkRecord:
+    year: int
+    day: int
+    # One of PHASES, or TOTAL for whole-process measurements
+    phase: str
+    commit: str
+    input_hash: str | None
+    wall_time: Measurement
+    # Bytes, for the whole process
+    peak_rss: Measurement | None = None
+    # Size passed to the generator, None for the real input
+    input_size: int | None = None
+    # Extra counters reported by external tools (cpu_cycles, cache_misses...)
+    counters: dict[str, Measurement] = field(default_factory=dict)
+    source: str = "harness"
+    command: str = ""
+    timestamp: str = ""
+    python: str = ""
+
+    @property
+    def key(self) -> tuple[int, int, str, str | None]:
+        return (self.year, self.day, self.phase, self.input_hash)
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}/{self.day:02d} {self.phase}"
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "BenchmarkRecord":
+        data = dict(data)
+        data["wall_time"] = Measurement(**data["wall_time"])
+        if data.get("peak_rss") is not None:
+            data["peak_rss"] = Measurement(**data["peak_rss"])
+        data["counters"] = {
+            name: Measurement(**value)
+            for name, value in data.get("counters", {}).items()
+        }
+        return BenchmarkRecord(**data)
+
+
+def count_outliers(samples: list[float]) -> int:
+    # Same definition as poop: anything further than 1.5 IQR from the quartiles
+    if len(samples) < 4:
+        return 0
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    iqr = q3 - q1
+    return len([e for e in samples if e < q1 - 1.5 * iqr or e > q3 + 1.5 * iqr])
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if status != "" else "")
+
+
+def hash_input(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def rss_bytes(max_rss: int) -> int:
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def peak_rss() -> int:
+    return rss_bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def phase_callables(
+    day: Day, phase: str, input_text: str
+) -> tuple[Callable[[], Any], Callable[[Any], Any]]:
+    """Return the untimed preparation of one phase, and the timed phase itself."""
+    solver = Solver(day.load())
+    if phase == PARSE:
+        return (lambda: input_text), solver.parse_only
+    for part in solver.parts:
+        if phase == part_phase(part):
+            parsed = solver.parse(input_text)
+            # Parts must not mutate their parsed input, but a fresh copy for
+            # each call keeps a misbehaving one from skewing the measurements
+            if solver.parses_once:
+                return (lambda: copy.deepcopy(parsed)), (
+                    lambda value: solver.solve(part, value)
+                )
+            return (lambda: parsed), (lambda value: solver.solve(part, value))
+    raise UnknownPhaseError(phase)
+
+
+def measure_phase(
+    day: Day,
+    phase: str,
+    warmup: int,
+    repeat: int,
+    size: int | None = None,
+    seed: int = 0,
+) -> tuple[list[float], int, str, dict[str, float]]:
+    """Time `repeat` calls of one phase of a day, after `warmup` untimed ones.
+
+    The input is the real one, or a generated one when `size` is given.
+    Returns the durations in seconds, the peak RSS of the process in bytes, the
+    hash of the input and the counters of the memoized functions of the last
+    call.
+    """
+    input_text = load_input(day, size, seed)
+    prepare, run = phase_callables(day, phase, input_text)
+    for _ in range(warmup):
+        clear_memos()
+        run(prepare())
+    samples: list[float] = []
+    for _ in range(repeat):
+        value = prepare()
+        # Every call starts from empty caches, like the first one of a real run
+        clear_memos()
+        start = time.perf_counter()
+        run(value)
+        samples.append(time.perf_counter() - start)
+    return samples, peak_rss(), hash_input(input_text), memo_counters()
+
+
+def measure_total(
+    day: Day, warmup: int, repeat: int, size: int | None = None, seed: int = 0
+) -> tuple[list[float], list[float], str]:
+    """Time `repeat` whole runs of the script of a day, after `warmup` ones.
+
+    Returns the durations in seconds, the peak RSS of each run in bytes and
+    the hash of the input.
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    with tempfile.TemporaryDirectory() as directory:
+        if size is None:
+            input_path = default_provider().path(day.year, day.day)
+        else:
+            input_path = Path(directory) / f"{day.name}.txt"
+            input_path.write_text(generate(day, size, seed))
+        input_hash = hash_input(input_path.read_bytes())
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                SCRIPT_TIMER,
+                str(day.path),
+                str(input_path),
+                str(warmup),
+                str(repeat),
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    runs = [line.split() for line in output.splitlines()]
+    return (
+        [float(duration) for duration, _ in runs],
+        [float(rss_bytes(int(max_rss))) for _, max_rss in runs],
+        input_hash,
+    )
+
+
+def memo_counters() -> dict[str, float]:
+    stats = [e for e in memo_stats() if e.hits + e.misses > 0]
+    if len(stats) == 0:
+        return {}
+    return {
+        "memo_hits": sum(e.hits for e in stats),
+        "memo_misses": sum(e.misses for e in stats),
+        "memo_entries": sum(e.size for e in stats),
+    }
+
+
+def benchmark_phase(
+    day: Day,
+    phase: str,
+    warmup: int,
+    repeat: int,
+    commit: str,
+    size: int | None = None,
+    seed: int = 0,
+) -> BenchmarkRecord:
+    if phase == TOTAL:
+        samples, rss_samples, input_hash = measure_total(
+            day, warmup, repeat, size, seed
+        )
+        counters: dict[str, float] = {}
+    else:
+        # Each phase runs in a fresh interpreter, so that the peak RSS only
+        # covers the interpreter, the solution module and this phase
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            samples, rss, input_hash, counters = executor.submit(
+                measure_phase, day, phase, warmup, repeat, size, seed
+            ).result()
+        rss_samples = [float(rss)]
+    command = f"advent bench {day.year} {day.day} --phase {phase}"
+    if size is not None:
+        command += f" --size {size} --seed {seed}"
+    return BenchmarkRecord(
+        year=day.year,
+        day=day.day,
+        phase=phase,
+        commit=commit,
+        input_hash=input_hash,
+        wall_time=Measurement.from_samples(samples),
+        peak_rss=Measurement.from_samples(rss_samples),
+        input_size=size,
+        counters={
+            name: Measurement.from_samples([value]) for name, value in counters.items()
+        },
+        command=command,
+        timestamp=datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+        python=platform.python_version(),
+    )
+
+
+def available_phases(day: Day) -> list[str]:
+    solver = Solver(day.load())
+    return [PARSE] + [part_phase(part) for part in solver.parts] + [TOTAL]
+
+
+def benchmark_day(
+    day: Day,
+    phases: list[str] | None = None,
+    warmup: int = 1,
+    repeat: int = 10,
+    commit: str | None = None,
+    size: int | None = None,
+    seed: int = 0,
+) -> list[BenchmarkRecord]:
+    commit = commit if commit is not None else git_commit()
+    return [
+        benchmark_phase(day, phase, warmup, repeat, commit, size, seed)
+        for phase in available_phases(day)
+        if phases is None or phase in phases
+    ]
+
+
+def load_records(path: Path) -> list[BenchmarkRecord]:
+    data = json.loads(path.read_text())
+    return [BenchmarkRecord.from_dict(e) for e in data["records"]]
+
+
+def save_records(records: list[BenchmarkRecord], path: Path) -> None:
+    """Merge records into a JSON file, replacing any with the same key."""
+    existing = load_records(path) if path.is_file() else []
+    new_keys = {record.key for record in records}
+    merged = [e for e in existing if e.key not in new_keys] + records
+    merged.sort(key=lambda e: (e.year, e.day, e.phase))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"records": [asdict(e) for e in merged]}, indent=2) + "\n"
+    )
+
+
+def records_path(commit: str) -> Path:
+    return BENCHMARKS_DIR / f"{commit}.json"
+
+
+class RecordsNotFoundError(Exception):
+    pass
+
+
+def resolve_records_path(reference: str) -> Path:
+    """Find the records of a file path, a commit or a unique commit prefix."""
+    path = Path(reference)
+    if path.is_file():
+        return path
+    if records_path(reference).is_file():
+        return records_path(reference)
+    candidates = sorted(BENCHMARKS_DIR.glob(f"{reference}*.json"))
+    if len(candidates) != 1:
+        raise RecordsNotFoundError(reference)
+    return candidates[0]
+
+
+def format_value(value: float, units: dict[str, float]) -> str:
+    # Three significant digits with the largest unit that keeps the value >= 1
+    unit, scale = min(units.items(), key=lambda e: e[1])
+    for candidate, candidate_scale in sorted(units.items(), key=lambda e: e[1]):
+        if abs(value) >= candidate_scale:
+            unit, scale = candidate, candidate_scale
+    scaled = value / scale
+    if scaled == 0:
+        return f"0{unit}"
+    elif abs(scaled) >= 100:
+        return f"{scaled:.0f}{unit}"
+    elif abs(scaled) >= 10:
+        return f"{scaled:.1f}{unit}"
+    return f"{scaled:.2f}{unit}"
+
+
+def format_measurement_line(
+    name: str, measurement: Measurement, units: dict[str, float]
+) -> str:
+    mean = format_value(measurement.mean, units)
+    stddev = format_value(measurement.stddev, units)
+    low = format_value(measurement.min, units)
+    high = format_value(measurement.max, units)
+    percent = round(100 * measurement.outliers / max(measurement.runs, 1))
+    return (
+        f"    {name:<18} {mean:>6} ± {stddev:<6}    {low:>6} … {high:<6}"
+        f"     {measurement.outliers:>5} ({percent:>2}%)"
+    )
+
+
+def render_poop(record: BenchmarkRecord, index: int = 1) -> str:
+    """Render a record as the poop output pasted in the solution files."""
+    lines = [
+        f"Benchmark {index} ({record.wall_time.runs} runs): "
+        + (record.command or record.label),
+        "    measurement          mean ± σ            min … max           outliers",
+        format_measurement_line("wall_time", record.wall_time, TIME_UNITS),
+    ]
+    if record.peak_rss is not None:
+        lines.append(format_measurement_line("peak_rss", record.peak_rss, SIZE_UNITS))
+    for name, counter in record.counters.items():
+        lines.append(format_measurement_line(name, counter, COUNT_UNITS))
+    return "\n".join(lines)
+
+
+def render_table(records: list[BenchmarkRecord]) -> str:
+    rows = [("Day", "Phase", "Runs", "Min", "Mean", "Median", "Stddev", "Peak RSS")]
+    for record in records:
+        wall_time = record.wall_time
+        rows.append(
+            (
+                f"{record.year}/{record.day:02d}",
+                record.phase,
+                str(wall_time.runs),
+                format_value(wall_time.min, TIME_UNITS),
+                format_value(wall_time.mean, TIME_UNITS),
+                format_value(wall_time.median, TIME_UNITS)
+                if wall_time.median is not None
+                else "-",
+                format_value(wall_time.stddev, TIME_UNITS),
+                format_value(record.peak_rss.max, SIZE_UNITS)
+                if record.peak_rss is not None
+                else "-",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(widths[i]) if i < 2 else cell.rjust(widths[i])
+            for i, cell in enumerate(row)
+        )
+        for row in rows
+    )
+
+
+POOP_HEADER = re.compile(r"^Benchmark \d+ \((\d+) runs\): (.*)$")
+HYPERFINE_HEADER = re.compile(r"^Benchmark \d+: (.*)$")
+POOP_LINE = re.compile(
+    r"^(\w+)\s+([\d.]+)\s*(\w*)\s*±\s*([\d.]+)\s*(\w*)\s+"
+    r"([\d.]+)\s*(\w*)\s*…\s*([\d.]+)\s*(\w*)\s+(\d+)"
+)
+HYPERFINE_TIME = re.compile(
+    r"^Time \(mean ± σ\):\s+([\d.]+) (\w+)\s*±\s*([\d.]+) (\w+)"
+)
+HYPERFINE_RANGE = re.compile(
+    r"^Range \(min … max\):\s+([\d.]+) (\w+)\s*…\s*([\d.]+) (\w+)\s+(\d+) runs"
+)
+
+
+def parse_value(number: str, unit: str, units: dict[str, float]) -> float:
+    if unit not in units:
+        raise UnknownUnitError(unit)
+    return float(number) * units[unit]
+
+
+def units_for(name: str) -> dict[str, float]:
+    if name == "wall_time":
+        return TIME_UNITS
+    elif name == "peak_rss":
+        return SIZE_UNITS
+    return COUNT_UNITS
+
+
+def parse_benchmark_block(block: str, day: Day, commit: str) -> BenchmarkRecord | None:
+    """Parse a poop or hyperfine output block into a whole-process record."""
+    lines = [line.strip() for line in block.strip().split("\n")]
+    if len(lines) == 0:
+        return None
+    runs = 0
+    measurements: dict[str, Measurement] = {}
+    poop_header = POOP_HEADER.match(lines[0])
+    hyperfine_header = HYPERFINE_HEADER.match(lines[0])
+    if poop_header is not None:
+        runs = int(poop_header.group(1))
+        command = poop_header.group(2)
+        for line in lines[1:]:
+            match = POOP_LINE.match(line)
+            if match is None:
+                continue
+            name = match.group(1)
+            units = units_for(name)
+            values = [
+                parse_value(match.group(i), match.group(i + 1), units)
+                for i in (2, 4, 6, 8)
+            ]
+            measurements[name] = Measurement(
+                runs=runs,
+                mean=values[0],
+                stddev=values[1],
+                min=values[2],
+                max=values[3],
+                outliers=int(match.group(10)),
+            )
+    elif hyperfine_header is not None:
+        command = hyperfine_header.group(1)
+        mean = stddev = low = high = 0.0
+        for line in lines[1:]:
+            time_match = HYPERFINE_TIME.match(line)
+            range_match = HYPERFINE_RANGE.match(line)
+            if time_match is not None:
+                mean = parse_value(time_match.group(1), time_match.group(2), TIME_UNITS)
+                stddev = parse_value(
+                    time_match.group(3), time_match.group(4), TIME_UNITS
+                )
+            elif range_match is not None:
+                low = parse_value(
+                    range_match.group(1), range_match.group(2), TIME_UNITS
+                )
+                high = parse_value(
+                    range_match.group(3), range_match.group(4), TIME_UNITS
+                )
+                runs = int(range_match.group(5))
+        measurements["wall_time"] = Measurement(runs, mean, stddev, low, high)
+    else:
+        return None
+
+    if "wall_time" not in measurements:
+        return None
+    wall_time = measurements.pop("wall_time")
+    return BenchmarkRecord(
+        year=day.year,
+        day=day.day,
+        phase=TOTAL,
+        commit=commit,
+        input_hash=None,
+        wall_time=wall_time,
+        peak_rss=measurements.pop("peak_rss", None),
+        counters=measurements,
+        source="docstring",
+        command=command,
+    )
+
+
+def block_commit(path: Path, start: int, end: int) -> str:
+    # The commit the numbers of a pasted block come from: the last one to
+    # change its lines, as the block was pasted along with the code it measured
+    try:
+        return (
+            subprocess.run(
+                ["git", "log", "-1", "-s", "--format=%H", f"-L{start},{end}:{path}"],
+                cwd=ROOT_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+            or "unknown"
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def extract_docstring_benchmarks(day: Day) -> list[BenchmarkRecord]:
+    # The blocks are bare module-level strings, parse the source rather than
+    # importing the module so that their position does not matter
+    tree = ast.parse(day.path.read_text())
+    records: list[BenchmarkRecord] = []
+    for node in tree.body:
+        if not isinstance(node, ast.Expr):
+            continue
+        if not isinstance(node.value, ast.Constant):
+            continue
+        if not isinstance(node.value.value, str):
+            continue
+        commit = block_commit(day.path, node.lineno, node.end_lineno or node.lineno)
+        record = parse_benchmark_block(node.value.value, day, commit)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def import_docstrings(
+    days: list[Day], path: Path = DOCSTRINGS_PATH
+) -> list[BenchmarkRecord]:
+    """Import the pasted benchmark blocks of `days` as historical baselines.
+
+    Each block is tagged with the last commit that changed it, "unknown" when
+    there is none (e.g. the block is not committed yet).
+    """
+    records: list[BenchmarkRecord] = []
+    for day in days:
+        records += extract_docstring_benchmarks(day)
+    if len(records) > 0:
+        save_records(records, path)
+    return records
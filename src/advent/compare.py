@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+
+from advent.bench import SIZE_UNITS, TIME_UNITS, BenchmarkRecord, format_value
+
+
+@dataclass
+class Comparison:
+    label: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        if self.baseline == 0:
+            return 0.0
+        return (self.current - self.baseline) / self.baseline * 100
+
+
+def central_time(record: BenchmarkRecord) -> float:
+    # Imported baselines only know the mean
+    median = record.wall_time.median
+    return median if median is not None else record.wall_time.mean
+
+
+def compare_records(
+    baseline: list[BenchmarkRecord],
+    current: list[BenchmarkRecord],
+    time_threshold: float = 10.0,
+    memory_threshold: float = 10.0,
+) -> tuple[list[Comparison], list[str]]:
+    """Compare each day/phase of `current` with the same one in `baseline`.
+
+    Only records of the same input are compared, baselines without an input
+    hash (e.g. imported from docstrings) stand for any input. Thresholds are
+    percentages. Returns the comparisons, and warnings about records that could
+    not be compared.
+    """
+    baseline_by_input = {(e.year, e.day, e.phase, e.input_hash): e for e in baseline}
+    baseline_phases = {(e.year, e.day, e.phase) for e in baseline}
+    comparisons: list[Comparison] = []
+    warnings: list[str] = []
+    for record in current:
+        phase = (record.year, record.day, record.phase)
+        reference = baseline_by_input.get((*phase, record.input_hash))
+        if reference is None:
+            reference = baseline_by_input.get((*phase, None))
+        if reference is None:
+            if phase in baseline_phases:
+                warnings.append(f"{record.label}: inputs differ, not compared")
+            continue
+
+        baseline_time = central_time(reference)
+        current_time = central_time(record)
+        comparisons.append(
+            Comparison(
+                label=record.label,
+                metric="wall_time",
+                baseline=baseline_time,
+                current=current_time,
+                regressed=current_time > baseline_time * (1 + time_threshold / 100),
+            )
+        )
+        if reference.peak_rss is not None and record.peak_rss is not None:
+            comparisons.append(
+                Comparison(
+                    label=record.label,
+                    metric="peak_rss",
+                    baseline=reference.peak_rss.max,
+                    current=record.peak_rss.max,
+                    regressed=record.peak_rss.max
+                    > reference.peak_rss.max * (1 + memory_threshold / 100),
+                )
+            )
+    return comparisons, warnings
+
+
+def render_comparison(comparisons: list[Comparison]) -> str:
+    rows = [("Day", "Metric", "Baseline", "Current", "Change", "")]
+    for comparison in comparisons:
+        units = TIME_UNITS if comparison.metric == "wall_time" else SIZE_UNITS
+        rows.append(
+            (
+                comparison.label,
+                comparison.metric,
+                format_value(comparison.baseline, units),
+                format_value(comparison.current, units),
+                f"{comparison.change:+.1f}%",
+                "REGRESSION" if comparison.regressed else "",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(widths[i]) if i in (0, 1, 5) else cell.rjust(widths[i])
+            for i, cell in enumerate(row)
+        ).rstrip()
+        for row in rows
+    )
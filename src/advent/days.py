@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+import importlib
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+import zipimport
+
+# Whether this runs from the zipapp built by `advent bundle`, which holds the
+# solutions as precompiled top-level modules and lives in ROOT_DIR/.advent
+BUNDLED = isinstance(globals().get("__loader__"), zipimport.zipimporter)
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+ROOT_DIR = PACKAGE_DIR.parent.parent.parent if BUNDLED else PACKAGE_DIR.parent.parent
+SRC_DIR = ROOT_DIR / "src"
+INPUTS_DIR = ROOT_DIR / "inputs"
+
+
+class DayNotFoundError(Exception):
+    pass
+
+
+class InvalidDayRangeError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Day:
+    year: int
+    day: int
+
+    @property
+    def name(self) -> str:
+        return f"day{self.day:02d}"
+
+    @property
+    def label(self) -> str:
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def path(self) -> Path:
+        return SRC_DIR / str(self.year) / f"{self.name}.py"
+
+    @property
+    def module_name(self) -> str:
+        # Year directories are not valid package names, so each solution gets
+        # a synthetic top-level module name
+        return f"advent_{self.year}_{self.name}"
+
+    def exists(self) -> bool:
+        if BUNDLED:
+            return importlib.util.find_spec(self.module_name) is not None
+        return self.path.is_file()
+
+    def load(self) -> ModuleType:
+        """Import the solution module, reusing it if it was already loaded."""
+        module = sys.modules.get(self.module_name)
+        if module is not None:
+            return module
+        if BUNDLED:
+            if not self.exists():
+                raise DayNotFoundError(self.module_name)
+            return importlib.import_module(self.module_name)
+        if not self.exists():
+            raise DayNotFoundError(self.path)
+        spec = importlib.util.spec_from_file_location(self.module_name, self.path)
+        if spec is None or spec.loader is None:
+            raise DayNotFoundError(self.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[self.module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[self.module_name]
+            raise
+        return module
+
+
+def parse_day_range(spec: str) -> list[int]:
+    """Parse a day selection such as "1-25" or "1,3,5-7" into a sorted list."""
+    days: set[int] = set()
+    for chunk in spec.split(","):
+        chunk = chunk.strip()
+        if chunk == "":
+            continue
+        try:
+            if "-" in chunk:
+                start_str, end_str = chunk.split("-", 1)
+                days.update(range(int(start_str), int(end_str) + 1))
+            else:
+                days.add(int(chunk))
+        except ValueError:
+            raise InvalidDayRangeError(spec)
+    if len(days) == 0 or min(days) < 1 or max(days) > 25:
+        raise InvalidDayRangeError(spec)
+    return sorted(days)
+
+
+def available_years() -> list[int]:
+    return sorted(int(path.name) for path in SRC_DIR.iterdir() if path.name.isdigit())
+
+
+def parse_years(spec: str) -> list[int]:
+    """Parse a year selection such as "2024", "2023,2024" or "all"."""
+    if spec == "all":
+        return available_years()
+    try:
+        return sorted({int(year) for year in spec.split(",") if year.strip() != ""})
+    except ValueError:
+        raise InvalidDayRangeError(spec)
+
+
+def discover(years: list[int], days: list[int]) -> list[Day]:
+    """Return the requested days of `years` that have a solution on disk."""
+    return [Day(year, day) for year in years for day in days if Day(year, day).exists()]
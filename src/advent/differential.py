@@ -0,0 +1,164 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from types import ModuleType
+
+from advent.days import Day
+from advent.generators import GeneratorNotFoundError, generate, generator_module
+from advent.memo import clear_memos
+from advent.solver import Solver, part_phase
+
+DEFAULT_SIZES = (8, 32, 128)
+DEFAULT_SEEDS = 3
+# Each attempt runs both variants, minimizing stops there even if it could go on
+MAX_ATTEMPTS = 500
+
+# repr() of the answer, or "! <exception type>"
+type Outcome = str
+
+
+@dataclass
+class Case:
+    # e.g. "EXAMPLE_INPUT" or "size 32, seed 1"
+    name: str
+    text: str
+
+
+@dataclass
+class Mismatch:
+    case: Case
+    expected: Outcome
+    actual: Outcome
+    # Smallest input found that still tells the variants apart
+    minimized: str
+
+
+@dataclass
+class DifferentialResult:
+    day: Day
+    part: int
+    # Cases the reference could solve, the other ones are not valid inputs
+    checked: int = 0
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+
+def example_cases(module: ModuleType) -> list[Case]:
+    """The EXAMPLE_INPUT and TEST_INPUT_* strings of a solution module."""
+    return [
+        Case(name, value)
+        for name, value in vars(module).items()
+        if (name == "EXAMPLE_INPUT" or name.startswith("TEST_INPUT"))
+        and isinstance(value, str)
+    ]
+
+
+def generated_cases(day: Day, sizes: Sequence[int], seeds: int) -> list[Case]:
+    try:
+        generator_module(day)
+    except GeneratorNotFoundError:
+        return []
+    return [
+        Case(f"size {size}, seed {seed}", generate(day, size, seed))
+        for size in sizes
+        for seed in range(seeds)
+    ]
+
+
+def outcome(function: Callable[[], object]) -> Outcome:
+    # Memoized functions must not remember the other variant's answers
+    clear_memos()
+    try:
+        return repr(function())
+    except Exception as e:
+        return f"! {type(e).__name__}"
+
+
+def is_error(result: Outcome) -> bool:
+    return result.startswith("! ")
+
+
+def outcomes(solver: Solver, part: int, text: str) -> tuple[Outcome, Outcome]:
+    expected = outcome(lambda: solver.solve_reference(part, text))
+    actual = outcome(lambda: solver.solve(part, solver.parse(text)))
+    return expected, actual
+
+
+def minimize(solver: Solver, part: int, text: str) -> str:
+    """Remove as much of `text` as possible while the variants still disagree.
+
+    Chunks of lines are removed, halving their size each round, and only kept
+    removed if the reference still solves the rest. Single-line inputs (e.g.
+    day 9) are minimized character by character instead.
+    """
+
+    def disagree(candidate: str) -> bool:
+        expected, actual = outcomes(solver, part, candidate)
+        return not is_error(expected) and expected != actual
+
+    stripped = text.strip("\n")
+    lines = stripped.split("\n")
+    separator = "\n"
+    if len(lines) == 1:
+        lines, separator = list(stripped), ""
+    attempts = 0
+    chunk = len(lines) // 2
+    while chunk > 0 and attempts < MAX_ATTEMPTS:
+        start = 0
+        while start < len(lines) and attempts < MAX_ATTEMPTS:
+            candidate = lines[:start] + lines[start + chunk :]
+            attempts += 1
+            if len(candidate) > 0 and disagree(separator.join(candidate) + "\n"):
+                lines = candidate
+            else:
+                start += chunk
+        chunk //= 2
+    return separator.join(lines) + "\n"
+
+
+def check_day(
+    day: Day,
+    parts: list[int] | None = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    seeds: int = DEFAULT_SEEDS,
+    shrink: bool = True,
+) -> list[DifferentialResult]:
+    """Compare the optimized parts of a day with their reference versions.
+
+    Both run on the examples of the solution file, then on generated inputs.
+    """
+    module = day.load()
+    solver = Solver(module)
+    cases = example_cases(module) + generated_cases(day, sizes, seeds)
+    results: list[DifferentialResult] = []
+    for part in solver.reference_parts:
+        if parts is not None and part not in parts:
+            continue
+        result = DifferentialResult(day, part)
+        for case in cases:
+            expected, actual = outcomes(solver, part, case.text)
+            if is_error(expected):
+                continue
+            result.checked += 1
+            if expected != actual:
+                minimized = minimize(solver, part, case.text) if shrink else case.text
+                result.mismatches.append(Mismatch(case, expected, actual, minimized))
+        results.append(result)
+    return results
+
+
+def render_differential(results: list[DifferentialResult]) -> str:
+    lines: list[str] = []
+    for result in results:
+        label = f"{result.day.label} {part_phase(result.part)}"
+        if len(result.mismatches) == 0:
+            lines.append(f"{label}: {result.checked} inputs, OK")
+            continue
+        lines.append(
+            f"{label}: {len(result.mismatches)} of {result.checked} inputs MISMATCH"
+        )
+        for mismatch in result.mismatches:
+            lines.append(
+                f"  {mismatch.case.name}: expected {mismatch.expected}, "
+                f"got {mismatch.actual}, on:"
+            )
+            lines += ["    " + line for line in mismatch.minimized.splitlines()]
+    return "\n".join(lines)
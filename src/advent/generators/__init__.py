@@ -0,0 +1,37 @@
+import importlib
+from types import ModuleType
+
+from advent.days import Day
+from advent.inputs import read_input
+
+
+class GeneratorNotFoundError(Exception):
+    pass
+
+
+def generator_module(day: Day) -> ModuleType:
+    try:
+        return importlib.import_module(f"advent.generators.y{day.year}.{day.name}")
+    except ModuleNotFoundError as e:
+        raise GeneratorNotFoundError(day.label) from e
+
+
+def generate(day: Day, size: int, seed: int = 0) -> str:
+    """Generate a valid input for `day`, whose scale grows with `size`.
+
+    What `size` counts depends on the day (lines, grid side, bits...), see the
+    `generate` function of each generator.
+    """
+    return generator_module(day).generate(size, seed)
+
+
+def dimensions(day: Day) -> int:
+    # The input of `day` grows as size ** dimensions, e.g. 2 for grids
+    return getattr(generator_module(day), "DIMENSIONS", 1)
+
+
+def load_input(day: Day, size: int | None = None, seed: int = 0) -> str:
+    """The real input of `day`, or a generated one when `size` is given."""
+    if size is None:
+        return read_input(day.year, day.day)
+    return generate(day, size, seed)
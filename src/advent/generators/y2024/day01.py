@@ -0,0 +1,11 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` location ID pairs, one per line."""
+    rng = random.Random(seed)
+    # Draw from a range comparable to the number of IDs so that the right list
+    # contains repeated IDs, as in the real input
+    high = max(10, size * 5)
+    lines = [f"{rng.randint(1, high)}   {rng.randint(1, high)}" for _ in range(size)]
+    return "\n".join(lines) + "\n"
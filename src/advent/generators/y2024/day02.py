@@ -0,0 +1,20 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` reports of 5 to 8 levels, roughly half of them safe."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        length = rng.randint(5, 8)
+        direction = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        report = [level]
+        for _ in range(length - 1):
+            level += direction * rng.randint(1, 3)
+            report.append(level)
+        # Break some reports once (dampener can fix them) or twice
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            report[rng.randrange(length)] += rng.choice((-5, -1, 0, 4))
+        lines.append(" ".join(str(e) for e in report))
+    return "\n".join(lines) + "\n"
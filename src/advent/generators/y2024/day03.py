@@ -0,0 +1,31 @@
+import random
+
+JUNK = "abcdmul(),don't%&*[]!@#^<>?{}' 0123456789"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Corrupted memory holding about `size` instructions."""
+    rng = random.Random(seed)
+    chunks: list[str] = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.7:
+            chunks.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif roll < 0.8:
+            chunks.append("do()")
+        elif roll < 0.9:
+            chunks.append("don't()")
+        else:
+            # Near misses that must not be matched
+            chunks.append(
+                rng.choice(
+                    (
+                        f"mul({rng.randint(1, 999)}, {rng.randint(1, 999)})",
+                        f"mul[{rng.randint(1, 999)},{rng.randint(1, 999)}]",
+                        f"mul({rng.randint(1000, 9999)},{rng.randint(1, 9)})",
+                        "do_not()",
+                    )
+                )
+            )
+        chunks.append("".join(rng.choices(JUNK, k=rng.randint(0, 8))))
+    return "".join(chunks) + "\n"
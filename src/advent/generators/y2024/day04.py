@@ -0,0 +1,11 @@
+import random
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` word search."""
+    rng = random.Random(seed)
+    lines = ["".join(rng.choices("XMAS", k=size)) for _ in range(size)]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,27 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Ordering rules over 49 pages and `size` updates, about half in order."""
+    rng = random.Random(seed)
+    pages = rng.sample(range(10, 100), 49)
+    # Pages are totally ordered by their position in `pages`, with one rule
+    # per pair like in the real input
+    rules = [
+        (pages[i], pages[j])
+        for i in range(len(pages))
+        for j in range(i + 1, len(pages))
+    ]
+    rng.shuffle(rules)
+    updates: list[list[int]] = []
+    for _ in range(size):
+        length = rng.choice(range(5, 24, 2))
+        indices = sorted(rng.sample(range(len(pages)), length))
+        update = [pages[i] for i in indices]
+        if rng.random() < 0.5:
+            while update == [pages[i] for i in indices]:
+                rng.shuffle(update)
+        updates.append(update)
+    rules_str = "\n".join(f"{before}|{after}" for before, after in rules)
+    updates_str = "\n".join(",".join(str(e) for e in update) for update in updates)
+    return rules_str + "\n\n" + updates_str + "\n"
@@ -0,0 +1,38 @@
+import random
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def guard_leaves(grid: list[list[str]], start: tuple[int, int]) -> bool:
+    size = len(grid)
+    seen: set[tuple[int, int, int]] = set()
+    line, column, direction = start[0], start[1], 0
+    while (line, column, direction) not in seen:
+        seen.add((line, column, direction))
+        next_line = line + DIRECTIONS[direction][0]
+        next_column = column + DIRECTIONS[direction][1]
+        if not (0 <= next_line < size and 0 <= next_column < size):
+            return True
+        if grid[next_line][next_column] == "#":
+            direction = (direction + 1) % 4
+        else:
+            line, column = next_line, next_column
+    return False
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` lab where the guard eventually walks out."""
+    rng = random.Random(seed)
+    while True:
+        grid = [
+            ["#" if rng.random() < 0.05 else "." for _ in range(size)]
+            for _ in range(size)
+        ]
+        start = (rng.randrange(size), rng.randrange(size))
+        grid[start[0]][start[1]] = "^"
+        # The puzzle needs a guard that leaves, which random labs do not
+        # guarantee: draw again until one does
+        if guard_leaves(grid, start):
+            return "\n".join("".join(line) for line in grid) + "\n"
@@ -0,0 +1,23 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` calibration equations of 2 to 12 operands, some solvable."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        if rng.random() < 0.5:
+            result = operands[0]
+            for operand in operands[1:]:
+                operator = rng.choice("+*|")
+                if operator == "+":
+                    result += operand
+                elif operator == "*":
+                    result *= operand
+                else:
+                    result = int(f"{result}{operand}")
+        else:
+            result = rng.randint(1, 10 ** rng.randint(3, 15))
+        lines.append(f"{result}: " + " ".join(str(e) for e in operands))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,18 @@
+import random
+import string
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+FREQUENCIES = string.digits + string.ascii_letters
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` map with about one antenna per 40 cells."""
+    rng = random.Random(seed)
+    grid = [["." for _ in range(size)] for _ in range(size)]
+    nb_antennas = max(2, size * size // 40)
+    # About four antennas per frequency, like the real input
+    frequencies = FREQUENCIES[: max(1, min(len(FREQUENCIES), nb_antennas // 4))]
+    for _ in range(nb_antennas):
+        grid[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+    return "\n".join("".join(line) for line in grid) + "\n"
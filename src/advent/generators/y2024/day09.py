@@ -0,0 +1,13 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A disk map of `size` digits, alternating files and free spaces."""
+    rng = random.Random(seed)
+    # A disk map always ends with a file
+    size = size if size % 2 == 1 else size + 1
+    digits = [
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+        for i in range(size)
+    ]
+    return "".join(digits) + "\n"
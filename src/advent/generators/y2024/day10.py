@@ -0,0 +1,24 @@
+import random
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` topographic map made of overlapping hills."""
+    rng = random.Random(seed)
+    peaks = [
+        (rng.randrange(size), rng.randrange(size))
+        for _ in range(max(1, size * size // 150))
+    ]
+    lines: list[str] = []
+    for i in range(size):
+        line: list[str] = []
+        for j in range(size):
+            distance = min(abs(i - peak[0]) + abs(j - peak[1]) for peak in peaks)
+            height = max(0, 9 - distance)
+            if rng.random() < 0.1:
+                height = rng.randint(0, 9)
+            line.append(str(height))
+        lines.append("".join(line))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,8 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A line of `size` engraved stones."""
+    rng = random.Random(seed)
+    stones = [rng.choice((0, rng.randint(1, 9_999_999))) for _ in range(size)]
+    return " ".join(str(e) for e in stones) + "\n"
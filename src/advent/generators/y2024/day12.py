@@ -0,0 +1,30 @@
+import random
+import string
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` garden of plots grown around random seeds."""
+    rng = random.Random(seed)
+    grid: list[list[str | None]] = [[None] * size for _ in range(size)]
+    # Grow regions from random seeds in a random order, like a Voronoi diagram
+    # with ragged borders
+    frontier: list[tuple[int, int, str]] = [
+        (rng.randrange(size), rng.randrange(size), rng.choice(string.ascii_uppercase))
+        for _ in range(max(1, size * size // 20))
+    ]
+    while len(frontier) > 0:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        line, column, plant = frontier.pop()
+        if grid[line][column] is not None:
+            continue
+        grid[line][column] = plant
+        for delta_line, delta_column in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            next_line = line + delta_line
+            next_column = column + delta_column
+            if 0 <= next_line < size and 0 <= next_column < size:
+                frontier.append((next_line, next_column, plant))
+    return "\n".join("".join(str(e) for e in line) for line in grid) + "\n"
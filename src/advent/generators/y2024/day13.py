@@ -0,0 +1,19 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` claw machines, about half of them winnable within 100 presses."""
+    rng = random.Random(seed)
+    machines: list[str] = []
+    for _ in range(size):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            presses_a, presses_b = rng.randint(1, 100), rng.randint(1, 100)
+            px = presses_a * ax + presses_b * bx
+            py = presses_a * ay + presses_b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}"
+        )
+    return "\n\n".join(machines) + "\n"
@@ -0,0 +1,12 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` robots in the real 101 x 103 bathroom."""
+    rng = random.Random(seed)
+    lines = [
+        f"p={rng.randrange(101)},{rng.randrange(103)} "
+        f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
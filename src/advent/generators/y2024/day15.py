@@ -0,0 +1,27 @@
+import random
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+MOVES_PER_LINE = 1000
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` warehouse followed by 8 moves per cell."""
+    rng = random.Random(seed)
+    size = max(size, 4)
+    grid = [["#"] * size for _ in range(size)]
+    for i in range(1, size - 1):
+        for j in range(1, size - 1):
+            roll = rng.random()
+            grid[i][j] = "O" if roll < 0.3 else "#" if roll < 0.35 else "."
+    grid[rng.randint(1, size - 2)][rng.randint(1, size - 2)] = "@"
+    moves = "".join(rng.choices("<>^v", k=8 * size * size))
+    moves_lines = [
+        moves[i : i + MOVES_PER_LINE] for i in range(0, len(moves), MOVES_PER_LINE)
+    ]
+    return (
+        "\n".join("".join(line) for line in grid)
+        + "\n\n"
+        + "\n".join(moves_lines)
+        + "\n"
+    )
@@ -0,0 +1,44 @@
+import random
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+
+
+def carve_maze(size: int, rng: random.Random) -> list[list[str]]:
+    """Carve a perfect maze in a `size` x `size` grid (`size` odd)."""
+    grid = [["#"] * size for _ in range(size)]
+    start = (size - 2, 1)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while len(stack) > 0:
+        line, column = stack[-1]
+        neighbours = [
+            (line + delta_line, column + delta_column)
+            for delta_line, delta_column in ((0, 2), (0, -2), (2, 0), (-2, 0))
+            if 0 < line + delta_line < size - 1
+            and 0 < column + delta_column < size - 1
+            and grid[line + delta_line][column + delta_column] == "#"
+        ]
+        if len(neighbours) == 0:
+            stack.pop()
+            continue
+        next_line, next_column = rng.choice(neighbours)
+        grid[(line + next_line) // 2][(column + next_column) // 2] = "."
+        grid[next_line][next_column] = "."
+        stack.append((next_line, next_column))
+    return grid
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` maze with loops, S bottom left and E top right."""
+    rng = random.Random(seed)
+    size = max(size if size % 2 == 1 else size + 1, 5)
+    grid = carve_maze(size, rng)
+    # Knock down some walls so that there are several paths to compare
+    for _ in range(size * size // 20):
+        line, column = rng.randint(1, size - 2), rng.randint(1, size - 2)
+        if (line + column) % 2 == 1:
+            grid[line][column] = "."
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    return "\n".join("".join(line) for line in grid) + "\n"
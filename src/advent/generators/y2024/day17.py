@@ -0,0 +1,22 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A program printing `size` values, shaped like the real puzzle ones.
+
+    The program loops over register A three bits at a time, so its output
+    grows with the number of octal digits of A.
+    """
+    rng = random.Random(seed)
+    first_xor, second_xor = rng.randrange(8), rng.randrange(8)
+    # bst A, bxl, cdv B, bxl, bxc, adv 3, out B, jnz 0
+    program = [2, 4, 1, first_xor, 7, 5, 1, second_xor, 4, rng.randrange(8)]
+    program += [0, 3, 5, 5, 3, 0]
+    register_a = rng.randrange(8 ** (size - 1), 8**size) if size > 0 else 0
+    return (
+        f"Register A: {register_a}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {','.join(str(e) for e in program)}\n"
+    )
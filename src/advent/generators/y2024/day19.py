@@ -0,0 +1,26 @@
+import random
+
+COLORS = "wubrg"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """About 450 towel patterns and `size` designs, most of them doable."""
+    rng = random.Random(seed)
+    towels: set[str] = set()
+    while len(towels) < 450:
+        towels.add("".join(rng.choices(COLORS, k=rng.randint(1, 8))))
+    # Like in the real input, a missing single color makes some designs
+    # impossible
+    missing = rng.choice(COLORS)
+    towels.discard(missing)
+    towels_list = sorted(towels)
+    designs: list[str] = []
+    for _ in range(size):
+        design = ""
+        while len(design) < rng.randint(40, 60):
+            design += rng.choice(towels_list)
+        if rng.random() < 0.2:
+            position = rng.randrange(len(design))
+            design = design[:position] + missing * 3 + design[position:]
+        designs.append(design)
+    return ", ".join(towels_list) + "\n\n" + "\n".join(designs) + "\n"
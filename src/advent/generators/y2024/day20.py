@@ -0,0 +1,48 @@
+import random
+
+# `size` is the side of a grid, so the input grows with its square
+DIMENSIONS = 2
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A `size` x `size` racetrack: a single winding track without forks."""
+    rng = random.Random(seed)
+    size = max(size if size % 2 == 1 else size + 1, 5)
+    # Carve a spanning tree of the odd cells, then only keep the path between
+    # its two ends that are the furthest apart so that the track never forks
+    parents: dict[tuple[int, int], tuple[int, int] | None] = {}
+    start = (
+        2 * rng.randrange((size - 1) // 2) + 1,
+        2 * rng.randrange((size - 1) // 2) + 1,
+    )
+    parents[start] = None
+    depths = {start: 0}
+    stack = [start]
+    while len(stack) > 0:
+        line, column = stack[-1]
+        neighbours = [
+            (line + delta_line, column + delta_column)
+            for delta_line, delta_column in ((0, 2), (0, -2), (2, 0), (-2, 0))
+            if 0 < line + delta_line < size - 1
+            and 0 < column + delta_column < size - 1
+            and (line + delta_line, column + delta_column) not in parents
+        ]
+        if len(neighbours) == 0:
+            stack.pop()
+            continue
+        cell = rng.choice(neighbours)
+        parents[cell] = (line, column)
+        depths[cell] = depths[(line, column)] + 1
+        stack.append(cell)
+
+    end = max(depths, key=lambda cell: depths[cell])
+    grid = [["#"] * size for _ in range(size)]
+    cell = end
+    parent = parents[cell]
+    while parent is not None:
+        grid[cell[0]][cell[1]] = "."
+        grid[(cell[0] + parent[0]) // 2][(cell[1] + parent[1]) // 2] = "."
+        cell, parent = parent, parents[parent]
+    grid[start[0]][start[1]] = "S"
+    grid[end[0]][end[1]] = "E"
+    return "\n".join("".join(line) for line in grid) + "\n"
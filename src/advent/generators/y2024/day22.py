@@ -0,0 +1,7 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Initial secret numbers of `size` buyers."""
+    rng = random.Random(seed)
+    return "\n".join(str(rng.randint(1, 2**24 - 1)) for _ in range(size)) + "\n"
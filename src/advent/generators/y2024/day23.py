@@ -0,0 +1,36 @@
+import itertools
+import random
+import string
+
+
+def hostnames(count: int, rng: random.Random) -> list[str]:
+    # Two letters like the real input, longer names once they run out
+    length = 2
+    while len(string.ascii_lowercase) ** length < count:
+        length += 1
+    names: set[str] = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    return sorted(names)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A network of `size` computers of degree ~13, with a planted clique."""
+    rng = random.Random(seed)
+    size = max(size, 4)
+    names = hostnames(size, rng)
+    links: set[tuple[str, str]] = set()
+
+    def link(a: str, b: str) -> None:
+        if a != b:
+            links.add((min(a, b), max(a, b)))
+
+    clique = rng.sample(names, min(13, size))
+    for a, b in itertools.combinations(clique, 2):
+        link(a, b)
+    for name in names:
+        for other in rng.sample(names, min(6, size)):
+            link(name, other)
+    lines = [f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}" for a, b in links]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,55 @@
+import random
+import string
+
+# Kinds of output swaps that keep the circuit acyclic, using the names of the
+# wires of one full adder: a = x ^ y, b = x & y, z = a ^ carry_in,
+# d = a & carry_in, carry_out = b | d
+SAFE_SWAPS = (("a", "b"), ("z", "d"), ("z", "carry"), ("z", "b"))
+
+
+def generate(size: int, seed: int = 0, swaps: int = 4) -> str:
+    """A `size`-bit ripple-carry adder with `swaps` pairs of swapped outputs."""
+    rng = random.Random(seed)
+    size = max(size, swaps + 2)
+    used: set[str] = set()
+
+    def wire() -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=3))
+            if name[0] not in "xyz" and name not in used:
+                used.add(name)
+                return name
+
+    gates: dict[str, tuple[str, str, str]] = {}
+    adders: list[dict[str, str]] = []
+    gates["z00"] = ("x00", "XOR", "y00")
+    carry = wire()
+    gates[carry] = ("x00", "AND", "y00")
+    for bit in range(1, size):
+        x, y, z = f"x{bit:02d}", f"y{bit:02d}", f"z{bit:02d}"
+        adder = {"a": wire(), "b": wire(), "z": z, "d": wire()}
+        adder["carry"] = f"z{size:02d}" if bit == size - 1 else wire()
+        gates[adder["a"]] = (x, "XOR", y)
+        gates[adder["b"]] = (x, "AND", y)
+        gates[adder["z"]] = (adder["a"], "XOR", carry)
+        gates[adder["d"]] = (adder["a"], "AND", carry)
+        gates[adder["carry"]] = (adder["b"], "OR", adder["d"])
+        adders.append(adder)
+        carry = adder["carry"]
+
+    # Swap outputs in distinct adders, away from the first and last bits
+    for adder in rng.sample(adders[1:-1], min(swaps, len(adders) - 2)):
+        first, second = rng.choice(SAFE_SWAPS)
+        first_wire, second_wire = adder[first], adder[second]
+        gates[first_wire], gates[second_wire] = gates[second_wire], gates[first_wire]
+
+    registers = [f"x{bit:02d}: {rng.randint(0, 1)}" for bit in range(size)]
+    registers += [f"y{bit:02d}: {rng.randint(0, 1)}" for bit in range(size)]
+    gate_lines = [
+        f"{left} {operation} {right} -> {output}"
+        if rng.random() < 0.5
+        else f"{right} {operation} {left} -> {output}"
+        for output, (left, operation, right) in gates.items()
+    ]
+    rng.shuffle(gate_lines)
+    return "\n".join(registers) + "\n\n" + "\n".join(gate_lines) + "\n"
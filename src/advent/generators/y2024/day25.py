@@ -0,0 +1,17 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """`size` lock and key schematics, in roughly equal numbers."""
+    rng = random.Random(seed)
+    schematics: list[str] = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows: list[str] = []
+        for row in range(7):
+            # Locks hang from the top row, keys stand on the bottom one
+            depth = row if is_lock else 6 - row
+            rows.append("".join("#" if depth <= height else "." for height in heights))
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics) + "\n"
@@ -0,0 +1,108 @@
+from collections.abc import Iterator
+from typing import Self
+
+# Byte of the cells around the grid, which no puzzle uses
+BORDER = 0
+
+
+class Grid:
+    """A rectangular grid of one-byte cells, stored flat in a `bytearray`.
+
+    Cells are addressed by a single integer index, and the grid is surrounded
+    by `padding` layers of BORDER cells: stepping off the grid by up to
+    `padding` cells lands on a border cell instead of needing a bounds check
+    or wrapping around to another line.
+
+    Moving is adding an offset to an index. `directions` holds the offsets of
+    the 4 neighbours, clockwise from up, so that turning right is moving to the
+    next one, and `diagonals` those of the 4 diagonal neighbours.
+    """
+
+    cells: bytearray
+    height: int
+    width: int
+    padding: int
+    # Number of cells between a cell and the one below it
+    stride: int
+    directions: tuple[int, int, int, int]
+    diagonals: tuple[int, int, int, int]
+
+    def __init__(self, text: str, padding: int = 1) -> None:
+        lines = text.strip().split("\n")
+        self.height = len(lines)
+        self.width = len(lines[0])
+        self.padding = padding
+        self.stride = self.width + 2 * padding
+        border_line = bytes([BORDER]) * self.stride * padding
+        side = bytes([BORDER]) * padding
+        self.cells = bytearray(
+            border_line
+            + b"".join(side + line.encode() + side for line in lines)
+            + border_line
+        )
+        self.directions = (-self.stride, 1, self.stride, -1)
+        self.diagonals = (
+            -self.stride + 1,
+            self.stride + 1,
+            self.stride - 1,
+            -self.stride - 1,
+        )
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def index(self, line: int, column: int) -> int:
+        return (line + self.padding) * self.stride + column + self.padding
+
+    def coords(self, index: int) -> tuple[int, int]:
+        line, column = divmod(index, self.stride)
+        return (line - self.padding, column - self.padding)
+
+    def is_border(self, index: int) -> bool:
+        return self.cells[index] == BORDER
+
+    def indices(self) -> Iterator[int]:
+        """Indices of every cell of the grid, line by line."""
+        for line in range(self.height):
+            start = self.index(line, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, cell: str) -> int:
+        index = self.cells.find(cell.encode())
+        if index == -1:
+            raise ValueError(f"{cell!r} is not in the grid")
+        return index
+
+    def find_all(self, cell: str) -> list[int]:
+        value = ord(cell)
+        return [index for index in self.indices() if self.cells[index] == value]
+
+    def count(self, cell: str) -> int:
+        return self.cells.count(cell.encode())
+
+    def offsets_within(self, distance: int) -> list[tuple[int, int]]:
+        """(offset, distance) of the cells within a Manhattan `distance`.
+
+        Only valid from cells of the grid if `distance` <= `padding`.
+        """
+        offsets: list[tuple[int, int]] = []
+        for line in range(-distance, distance + 1):
+            reach = distance - abs(line)
+            for column in range(-reach, reach + 1):
+                offsets.append((line * self.stride + column, abs(line) + abs(column)))
+        return offsets
+
+    def copy(self) -> Self:
+        grid = type(self).__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells.copy()
+        return grid
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[start : start + self.width].decode()
+            for start in (self.index(line, 0) for line in range(self.height))
+        )
@@ -0,0 +1,241 @@
+import hashlib
+import os
+from pathlib import Path
+import time
+from typing import Protocol
+
+from advent.days import INPUTS_DIR
+
+DEFAULT_MAX_AGE = 24 * 3600
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class InputNotFoundError(Exception):
+    pass
+
+
+class DecryptionError(Exception):
+    pass
+
+
+class DecryptBackend(Protocol):
+    def decrypt(self, path: Path) -> bytes: ...
+
+
+class SopsBackend:
+    def decrypt(self, path: Path) -> bytes:
+        # Imported here like tempfile below, as most runs hit the cache and
+        # every solution imports this module
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["sops", "decrypt", str(path)], capture_output=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise DecryptionError(path) from e
+        return result.stdout
+
+
+class PlaintextBackend:
+    # Stand-in for sops when the "encrypted" files are plain fixtures
+    def decrypt(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+
+BACKENDS: dict[str, type[DecryptBackend]] = {
+    "sops": SopsBackend,
+    "plaintext": PlaintextBackend,
+}
+
+
+def default_cache_dir() -> Path:
+    # Prefer a tmpfs so that plaintext inputs never reach a disk
+    shm = Path("/dev/shm")
+    if shm.is_dir():
+        base = shm
+    else:
+        import tempfile
+
+        base = Path(tempfile.gettempdir())
+    return base / f"advent-{os.getuid()}"
+
+
+class InputCache:
+    """Cache of decrypted inputs, keyed by the hash of their ciphertext.
+
+    Entries live both in memory and in a private directory, so that other
+    processes (workers, hyperfine runs...) do not decrypt them again.
+    """
+
+    directory: Path
+    max_age: float
+    max_size: int
+    _memory: dict[str, bytes]
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self.directory = directory if directory is not None else default_cache_dir()
+        self.max_age = max_age
+        self.max_size = max_size
+        self._memory = {}
+
+    def _ensure_directory(self) -> None:
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._check_directory()
+
+    def _check_directory(self) -> None:
+        # Refuse to share plaintext through a directory someone else controls,
+        # both ways: an entry planted there could stand in for an input
+        stat = self.directory.stat()
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+            raise PermissionError(f"Insecure input cache {self.directory}")
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.txt"
+
+    def get(self, key: str) -> bytes | None:
+        if key in self._memory:
+            return self._memory[key]
+        if not self.directory.is_dir():
+            return None
+        self._check_directory()
+        path = self.path(key)
+        if not path.is_file():
+            return None
+        if time.time() - path.stat().st_mtime > self.max_age:
+            path.unlink(missing_ok=True)
+            return None
+        data = path.read_bytes()
+        self._memory[key] = data
+        return data
+
+    def put(self, key: str, data: bytes) -> Path:
+        import tempfile
+
+        self._ensure_directory()
+        self._memory[key] = data
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, self.path(key))
+        self.evict(keep=self.path(key))
+        return self.path(key)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Drop expired entries, then the oldest ones until under max_size.
+
+        `keep` is never dropped for size, so a fresh entry stays usable even if
+        it is larger than the cache on its own.
+        """
+        if not self.directory.is_dir():
+            return
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.txt"):
+            stat = path.stat()
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(e[1] for e in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.directory.is_dir():
+            for path in self.directory.glob("*.txt"):
+                path.unlink(missing_ok=True)
+
+
+class InputProvider:
+    """Hands out puzzle inputs, decrypting each ciphertext at most once.
+
+    A plaintext `inputs/<year>/dayNN.txt` takes precedence over the encrypted
+    `dayNN.txt.enc`, which goes through the decrypt backend and the cache.
+    """
+
+    inputs_dir: Path
+    backend: DecryptBackend
+    cache: InputCache
+
+    def __init__(
+        self,
+        backend: DecryptBackend | None = None,
+        cache: InputCache | None = None,
+        inputs_dir: Path = INPUTS_DIR,
+    ) -> None:
+        if backend is None:
+            backend = BACKENDS[os.environ.get("ADVENT_DECRYPT", "sops")]()
+        self.backend = backend
+        self.cache = cache if cache is not None else InputCache()
+        self.inputs_dir = inputs_dir
+
+    def plaintext_path(self, year: int, day: int) -> Path:
+        return self.inputs_dir / str(year) / f"day{day:02d}.txt"
+
+    def encrypted_path(self, year: int, day: int) -> Path:
+        return self.inputs_dir / str(year) / f"day{day:02d}.txt.enc"
+
+    def has_input(self, year: int, day: int) -> bool:
+        return (
+            self.plaintext_path(year, day).is_file()
+            or self.encrypted_path(year, day).is_file()
+        )
+
+    def _decrypted(self, year: int, day: int) -> tuple[str, bytes]:
+        encrypted_path = self.encrypted_path(year, day)
+        if not encrypted_path.is_file():
+            raise InputNotFoundError(encrypted_path)
+        key = hashlib.sha256(encrypted_path.read_bytes()).hexdigest()
+        data = self.cache.get(key)
+        if data is None:
+            data = self.backend.decrypt(encrypted_path)
+            self.cache.put(key, data)
+        return key, data
+
+    def path(self, year: int, day: int) -> Path:
+        """Return a path to the plaintext input, decrypting it if needed."""
+        plaintext_path = self.plaintext_path(year, day)
+        if plaintext_path.is_file():
+            return plaintext_path
+        key, data = self._decrypted(year, day)
+        cached_path = self.cache.path(key)
+        if not cached_path.is_file():
+            cached_path = self.cache.put(key, data)
+        return cached_path
+
+    def read_bytes(self, year: int, day: int) -> bytes:
+        plaintext_path = self.plaintext_path(year, day)
+        if plaintext_path.is_file():
+            return plaintext_path.read_bytes()
+        _, data = self._decrypted(year, day)
+        return data
+
+    def read_text(self, year: int, day: int) -> str:
+        return self.read_bytes(year, day).decode()
+
+
+_provider: InputProvider | None = None
+
+
+def default_provider() -> InputProvider:
+    global _provider
+    if _provider is None:
+        _provider = InputProvider()
+    return _provider
+
+
+def read_input(year: int, day: int) -> str:
+    """Input of a day, used by the solutions when no path is given."""
+    return default_provider().read_text(year, day)
@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import functools
+from typing import Any, NamedTuple, Protocol
+
+# Entries kept per memoized function: far more than any real input needs, but
+# a bound on what scaled-up inputs can pile up
+DEFAULT_MAX_SIZE = 1 << 20
+
+
+class CacheInfo(NamedTuple):
+    # Same fields as the one of functools.lru_cache
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class Cached[**P, R](Protocol):
+    """A memoized function, called like the function it wraps."""
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
+
+    # (hits, misses, maxsize, currsize), as the CacheInfo of functools
+    def cache_info(self) -> tuple[int, int, int | None, int]: ...
+
+    def cache_clear(self) -> None: ...
+
+
+class Memoizer(Protocol):
+    """What `memoize(...)` returns, to decorate a function with."""
+
+    def __call__[**P, R](self, function: Callable[P, R], /) -> Cached[P, R]: ...
+
+
+@dataclass
+class MemoStats:
+    name: str
+    hits: int
+    misses: int
+    size: int
+    max_size: int | None
+
+
+class KeyedCache[**P, R]:
+    """LRU cache of a function, keyed by `key(*args, **kwargs)`."""
+
+    function: Callable[P, R]
+    key: Callable[P, Hashable]
+    max_size: int | None
+    entries: OrderedDict[Hashable, R]
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        function: Callable[P, R],
+        key: Callable[P, Hashable],
+        max_size: int | None,
+    ) -> None:
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.key = key
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        key = self.key(*args, **kwargs)
+        try:
+            value = self.entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            if self.max_size is not None:
+                self.entries.move_to_end(key)
+            return value
+        value = self.function(*args, **kwargs)
+        self.misses += 1
+        self.entries[key] = value
+        if self.max_size is not None and len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.max_size, len(self.entries))
+
+    def cache_clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Every memoized function and its name, so that the harness can reset and
+# report them
+_memoized: list[tuple[str, Cached[..., Any]]] = []
+
+
+def memoize(
+    max_size: int | None = DEFAULT_MAX_SIZE,
+    key: Callable[..., Hashable] | None = None,
+) -> Memoizer:
+    """Bounded replacement of `functools.cache`, with statistics.
+
+    The least recently used entries are evicted past `max_size` entries. `key`
+    maps the arguments to the key of the cache, by default all of them, e.g.
+    to leave out a large argument that is the same on every call: the cache
+    must then be cleared with `cache_clear()` whenever that argument changes.
+    """
+
+    def decorator[**P, R](function: Callable[P, R]) -> Cached[P, R]:
+        cached: Cached[P, R]
+        if key is None:
+            # The C implementation of the standard library is faster
+            cached = functools.lru_cache(maxsize=max_size)(function)
+        else:
+            cached = KeyedCache(function, key, max_size)
+        _memoized.append((function.__qualname__, cached))
+        return cached
+
+    return decorator
+
+
+def clear_memos() -> None:
+    # e.g. so that a benchmark run does not reuse the results of the previous one
+    for _, cached in _memoized:
+        cached.cache_clear()
+
+
+def memo_stats() -> list[MemoStats]:
+    stats: list[MemoStats] = []
+    for name, cached in _memoized:
+        hits, misses, max_size, size = cached.cache_info()
+        stats.append(MemoStats(name, hits, misses, size, max_size))
+    return stats
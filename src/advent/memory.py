@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+import signal
+import threading
+import tracemalloc
+from types import FrameType
+from typing import Any, Callable
+
+from advent.bench import SIZE_UNITS, format_value
+from advent.profiling import HARNESS_FILES
+
+# Sites kept per phase, reports usually show fewer
+MAX_SITES = 50
+# Seconds between two looks at the traced memory while a phase runs
+POLL_INTERVAL = 0.005
+# Only snapshot again once the memory grew by this much, snapshots are slow
+SNAPSHOT_GROWTH = 1.5
+
+# Allocations of the harness, but not of the helpers solutions call
+IGNORED_FILES = (tracemalloc.__file__, *sorted(HARNESS_FILES))
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    # Highest memory allocated by the phase at any time, in bytes
+    peak: int
+    # Memory it still held when it returned (e.g. the parsed input), in bytes
+    retained: int
+    # Largest allocation sites, as of the snapshot taken closest to the peak
+    sites: list[AllocationSite] = field(default_factory=list)
+
+
+def snapshot_sites() -> list[AllocationSite]:
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, pattern) for pattern in IGNORED_FILES]
+    )
+    return [
+        AllocationSite(str(statistic.traceback), statistic.size, statistic.count)
+        for statistic in snapshot.statistics("lineno")[:MAX_SITES]
+    ]
+
+
+def trace_memory(function: Callable[[], Any]) -> tuple[Any, MemoryReport]:
+    """Call `function` with tracemalloc on, and report what it allocated.
+
+    Only the allocations made during the call are traced. tracemalloc only
+    knows the sites of memory that is still alive, so a timer snapshots them
+    whenever the memory grows, and the sites reported are those of the
+    snapshot closest to the peak. Outside of the main thread, where there are
+    no signals, only the memory retained at the end is snapshot.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.clear_traces()
+    tracemalloc.reset_peak()
+
+    sites: list[AllocationSite] | None = None
+    sites_size = 0
+    peak = 0
+    snapshotting = False
+
+    def on_timer(signum: int, frame: FrameType | None) -> None:
+        # The handler runs in the main thread, between two bytecodes of the
+        # phase, which is paused meanwhile
+        nonlocal sites, sites_size, peak, snapshotting
+        current, current_peak = tracemalloc.get_traced_memory()
+        if snapshotting or current <= sites_size * SNAPSHOT_GROWTH:
+            return
+        snapshotting = True
+        peak = max(peak, current_peak)
+        sites, sites_size = snapshot_sites(), current
+        # Snapshots are traced too, forget the spike of taking one
+        tracemalloc.reset_peak()
+        snapshotting = False
+
+    use_timer = threading.current_thread() is threading.main_thread()
+    if use_timer:
+        previous_handler = signal.signal(signal.SIGALRM, on_timer)
+        signal.setitimer(signal.ITIMER_REAL, POLL_INTERVAL, POLL_INTERVAL)
+    try:
+        answer = function()
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        retained, current_peak = tracemalloc.get_traced_memory()
+        peak = max(peak, current_peak)
+        # Short phases end before the timer fired
+        if sites is None or retained >= sites_size:
+            sites = snapshot_sites()
+        if not was_tracing:
+            tracemalloc.stop()
+    return answer, MemoryReport(peak, retained, sites)
+
+
+def format_memory_report(report: MemoryReport, top: int) -> str:
+    lines = [
+        f"Peak {format_value(report.peak, SIZE_UNITS)}, "
+        f"retained {format_value(report.retained, SIZE_UNITS)}"
+    ]
+    rows = [("Size", "Blocks", "Allocation site")]
+    for site in report.sites[:top]:
+        rows.append(
+            (format_value(site.size, SIZE_UNITS), str(site.count), site.location)
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(2)]
+    lines += [f"{row[0]:>{widths[0]}}  {row[1]:>{widths[1]}}  {row[2]}" for row in rows]
+    return "\n".join(lines)
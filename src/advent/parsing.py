@@ -0,0 +1,138 @@
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # NumPy takes longer to import than most days take to run, it is only
+    # imported once there is something to parse
+    import numpy as np
+    import numpy.typing as npt
+
+type Integers = npt.NDArray[np.int64]
+type Offsets = npt.NDArray[np.intp]
+
+SPACE = ord(" ")
+NEWLINE = ord("\n")
+MINUS = ord("-")
+ZERO = ord("0")
+# Bytes that make up integers, every other one but newlines becomes a space
+NUMBER_BYTES = b"0123456789-"
+SEPARATORS = bytes(
+    byte if byte in NUMBER_BYTES or byte == NEWLINE else SPACE for byte in range(256)
+)
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+class RecordWidthError(Exception):
+    pass
+
+
+class IntegerOverflowError(OverflowError):
+    pass
+
+
+def separate(text: str | bytes) -> bytes:
+    """`text` with only its integers left, separated by whitespace."""
+    data = text.encode() if isinstance(text, str) else text
+    data = data.translate(SEPARATORS)
+    if b"-" not in data:
+        return data
+    import numpy as np
+
+    # A "-" is only a sign right before the digits of a number, not e.g. in
+    # "->" or "1-3", and NumPy would read "- 1" as -1
+    buffer = np.frombuffer(bytearray(data), dtype=np.uint8)
+    signs = np.flatnonzero(buffer == MINUS)
+    last = len(buffer) - 1
+    before = buffer[np.maximum(signs - 1, 0)]
+    after = buffer[np.minimum(signs + 1, last)]
+    not_signs = (
+        ((after - ZERO) >= 10)
+        | (signs == last)
+        | (((before - ZERO) < 10) & (signs > 0))
+    )
+    buffer[signs[not_signs]] = SPACE
+    return buffer.tobytes()
+
+
+def parse_separated(data: bytes) -> Integers:
+    import numpy as np
+
+    # fromstring reads a blank text as a single 0
+    if data == b"" or data.isspace():
+        return np.zeros(0, dtype=np.int64)
+    values = np.fromstring(data, dtype=np.int64, sep=" ")
+    # and saturates instead of failing on integers that do not fit
+    if values.max() == INT64_MAX or values.min() == INT64_MIN:
+        raise IntegerOverflowError
+    return values
+
+
+def integers(text: str | bytes) -> Integers:
+    """All the integers of `text`, in order, with their "-" sign if any.
+
+    Everything but the integers is blanked out by `bytes.translate`, then NumPy
+    parses them all in C, which is about 3 times faster than splitting the text
+    and calling `int` on every token. `.tolist()` turns the result into Python
+    ints, which solutions doing scalar arithmetic should keep using.
+    """
+    return parse_separated(separate(text))
+
+
+def integer_array(text: str | bytes) -> array[int]:
+    """Same as `integers`, as a compact `array('q')`."""
+    values = array("q")
+    values.frombytes(integers(text).tobytes())
+    return values
+
+
+def records(text: str | bytes, width: int) -> Integers:
+    """The integers of `text` as rows of `width`, e.g. 4 per robot line."""
+    values = integers(text)
+    if len(values) % width != 0:
+        raise RecordWidthError(f"{len(values)} integers are not rows of {width}")
+    return values.reshape(-1, width)
+
+
+@dataclass
+class RaggedRows:
+    """Integers of each line of a text, when lines hold different counts."""
+
+    values: Integers
+    # Index in `values` of the first integer of each line, then len(values)
+    offsets: Offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> Integers:
+        return self.values[self.offsets[row] : self.offsets[row + 1]]
+
+    def lengths(self) -> Offsets:
+        return self.offsets[1:] - self.offsets[:-1]
+
+    def tolist(self) -> list[list[int]]:
+        values = self.values.tolist()
+        offsets = self.offsets.tolist()
+        return [values[offsets[i] : offsets[i + 1]] for i in range(len(self))]
+
+
+def ragged_rows(text: str | bytes) -> RaggedRows:
+    """The integers of every line of `text`, e.g. day 2 reports."""
+    import numpy as np
+
+    data = separate(text.strip())
+    values = parse_separated(data)
+    if len(data) == 0:
+        # Not a single line, rather than a single empty one
+        return RaggedRows(values, np.zeros(1, dtype=np.intp))
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    is_blank = (buffer == SPACE) | (buffer == NEWLINE)
+    # Integers start after a blank, and the line of each is the number of
+    # newlines before it
+    follows_blank = np.concatenate(([True], is_blank[:-1]))
+    starts = np.flatnonzero(~is_blank & follows_blank)
+    line_ends = np.flatnonzero(buffer == NEWLINE)
+    offsets = np.concatenate(([0], np.searchsorted(starts, line_ends), [len(values)]))
+    return RaggedRows(values, offsets)
@@ -0,0 +1,98 @@
+import cProfile
+from pathlib import Path
+import pstats
+from typing import Any, Callable
+
+from advent.days import Day
+from advent.timings import STATE_DIR
+
+PROFILES_DIR = STATE_DIR / "profiles"
+DEFAULT_TOP = 15
+# Modules of the harness itself, whose frames wrap every phase. The helpers
+# solutions call (grid, search, parsing, memo...) are left out, their frames
+# are part of the solutions.
+HARNESS_MODULES = (
+    "__main__",
+    "bench",
+    "differential",
+    "memory",
+    "profiling",
+    "runner",
+    "sampling",
+    "scaling",
+    "solver",
+    "watchdog",
+)
+HARNESS_FILES = frozenset(
+    str(Path(__file__).parent / f"{module}.py") for module in HARNESS_MODULES
+)
+
+
+def profile_path(day: Day, phase: str, directory: Path = PROFILES_DIR) -> Path:
+    return directory / str(day.year) / f"{day.name}-{phase}.pstats"
+
+
+def run_profiled(function: Callable[[], Any], path: Path) -> Any:
+    """Call `function` under cProfile, and save its stats to `path`.
+
+    The stats are saved even if the function raises, since a crash deep into a
+    long phase is worth a look too.
+    """
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(function)
+    finally:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(path)
+
+
+def is_harness(function: tuple[str, int, str]) -> bool:
+    filename, _, name = function
+    if filename == "~":
+        return name == "<method 'disable' of '_lsprof.Profiler' objects>"
+    return filename in HARNESS_FILES
+
+
+def function_name(function: tuple[str, int, str]) -> str:
+    filename, line, name = function
+    if filename == "~":
+        # Builtins, e.g. "<method 'count' of 'list' objects>"
+        return name
+    return f"{Path(filename).name}:{line}({name})"
+
+
+def format_profile(path: Path, top: int = DEFAULT_TOP) -> str:
+    """The `top` functions of a saved profile, by cumulative and by self time."""
+    stats = pstats.Stats(str(path))
+    total = stats.total_tt  # type: ignore[attr-defined]
+    # {function: (primitive calls, calls, self time, cumulative time, callers)}
+    entries = stats.stats  # type: ignore[attr-defined]
+    sections: list[str] = []
+    for title, column in (("cumulative", 3), ("self", 2)):
+        rows = [("Calls", "Time", "Share", f"Function (by {title} time)")]
+        ranked = sorted(
+            (e for e in entries.items() if not is_harness(e[0])),
+            key=lambda e: e[1][column],
+            reverse=True,
+        )
+        for function, entry in ranked[:top]:
+            calls = str(entry[1]) if entry[0] == entry[1] else f"{entry[1]}/{entry[0]}"
+            seconds = entry[column]
+            share = seconds / total * 100 if total > 0 else 0.0
+            rows.append(
+                (
+                    calls,
+                    f"{seconds * 1e3:.3f}ms",
+                    f"{share:.1f}%",
+                    function_name(function),
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(3)]
+        sections.append(
+            "\n".join(
+                f"{row[0]:>{widths[0]}}  {row[1]:>{widths[1]}}  "
+                f"{row[2]:>{widths[2]}}  {row[3]}"
+                for row in rows
+            )
+        )
+    return "\n\n".join(sections)
@@ -0,0 +1,666 @@
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+import math
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable
+
+from advent.days import Day
+from advent.inputs import default_provider, read_input
+from advent.memory import MemoryReport, format_memory_report, trace_memory
+from advent.profiling import DEFAULT_TOP, format_profile, profile_path, run_profiled
+from advent.sampling import (
+    aggregate_stacks,
+    format_samples,
+    load_stacks,
+    run_sampled,
+    sample_path,
+    save_stacks,
+)
+from advent.solver import PARSE, PARTS, Solver, part_phase
+from advent.streaming import file_chunks
+from advent.timings import Timings, load_timings, save_timings, timing_key
+from advent.watchdog import (
+    DONE,
+    GRACE_PERIOD,
+    REPORT_SIGNAL,
+    RESULT,
+    TIMEOUT,
+    TimeoutReport,
+    format_timeout,
+    install_report_handler,
+    reset_progress,
+)
+
+# A day and one of its parts
+type Unit = tuple[Day, int]
+# A day and the parts of it to solve in the same process
+type DayUnit = tuple[Day, list[int]]
+
+# Phase of the results of days that could not be run at all
+LOAD = "load"
+# Order of the phases in the results of a day
+PHASE_ORDER = [LOAD, PARSE] + [part_phase(part) for part in PARTS]
+
+# Optional instrumentation of the phases, which skews their timings
+PROFILE = "profile"
+MEMORY = "memory"
+SAMPLE = "sample"
+
+
+@dataclass
+class PhaseResult:
+    day: Day
+    phase: str
+    answer: Any = None
+    duration: float = 0.0
+    error: str | None = None
+    # Saved cProfile stats of the phase, when profiled
+    profile: Path | None = None
+    # Allocations of the phase, when traced
+    memory: MemoryReport | None = None
+    # Saved stack samples of the phase, when sampled
+    samples: Path | None = None
+    # Where the phase was when it ran out of time
+    timeout: TimeoutReport | None = None
+    # Input file the phase ran on, in batch runs
+    input: Path | None = None
+
+
+def timed(
+    day: Day, phase: str, function: Callable[[], Any], instrument: str | None = None
+) -> PhaseResult:
+    result = PhaseResult(day, phase)
+    reset_progress()
+    start = time.perf_counter()
+    try:
+        if instrument == PROFILE:
+            result.profile = profile_path(day, phase)
+            result.answer = run_profiled(function, result.profile)
+        elif instrument == MEMORY:
+            result.answer, result.memory = trace_memory(function)
+        elif instrument == SAMPLE:
+            result.samples = sample_path(day, phase)
+            result.answer = run_sampled(function, result.samples)
+        else:
+            result.answer = function()
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def solve_day(
+    day: Day,
+    parts: list[int],
+    instrument: str | None = None,
+    input_text: str | None = None,
+    report: Callable[[PhaseResult], None] | None = None,
+) -> list[PhaseResult]:
+    """Parse the input of a day once, then solve the requested parts on it.
+
+    `report` is called with each result as soon as its phase is over.
+    """
+    solver = Solver(day.load())
+    if input_text is None:
+        input_text = read_input(day.year, day.day)
+    # The parse phase of other days does nothing worth instrumenting
+    parse_result = timed(
+        day,
+        PARSE,
+        lambda: solver.parse(input_text),
+        instrument if solver.parses_once else None,
+    )
+    parsed = parse_result.answer
+    # The parsed value is not an answer, and can be huge
+    parse_result.answer = None
+    if report is not None and (solver.parses_once or parse_result.error is not None):
+        report(parse_result)
+    if parse_result.error is not None:
+        return [parse_result]
+    results = [parse_result] if solver.parses_once else []
+    for part in parts:
+        result = timed(
+            day, part_phase(part), lambda: solver.solve(part, parsed), instrument
+        )
+        if report is not None:
+            report(result)
+        results.append(result)
+    return results
+
+
+def solve_unit(day: Day, part: int, instrument: str | None = None) -> list[PhaseResult]:
+    # Entry point of the worker processes: everything is rebuilt from the
+    # (picklable) day so that nothing but the results crosses processes
+    return solve_day(day, [part], instrument)
+
+
+def solve_inputs(
+    day: Day,
+    paths: list[Path],
+    parts: list[int] | None = None,
+    instrument: str | None = None,
+    stream: bool = False,
+) -> list[PhaseResult]:
+    """Solve a day on each input file in turn, in this process.
+
+    The solution module and what it builds at import time (compiled regexes,
+    tables, memoized functions that do not depend on the input) are only
+    loaded once for all the inputs.
+
+    With `stream`, the parts that have a streaming version read the files a
+    chunk at a time instead of whole.
+    """
+    try:
+        solver = Solver(day.load())
+    except Exception as e:
+        return [PhaseResult(day, LOAD, error=f"{type(e).__name__}: {e}")]
+    day_parts = [part for part in solver.parts if parts is None or part in parts]
+    streamed = [part for part in day_parts if stream and part in solver.stream_parts]
+    whole = [part for part in day_parts if part not in streamed]
+    results: list[PhaseResult] = []
+    for path in paths:
+        input_results: list[PhaseResult] = []
+        for part in streamed:
+            input_results.append(
+                timed(
+                    day,
+                    part_phase(part),
+                    lambda: solver.solve_stream(
+                        part,
+                        file_chunks(path, whole_lines=solver.stream_whole_lines),
+                    ),
+                    instrument,
+                )
+            )
+        if len(whole) > 0:
+            try:
+                input_text = path.read_text()
+            except OSError as e:
+                input_results.append(
+                    PhaseResult(day, LOAD, error=f"{type(e).__name__}: {e}")
+                )
+            else:
+                input_results += solve_day(day, whole, instrument, input_text)
+        for result in input_results:
+            result.input = path
+        results += sorted(input_results, key=lambda e: PHASE_ORDER.index(e.phase))
+    return results
+
+
+def input_files(paths: list[Path]) -> list[Path]:
+    """`paths`, with each directory replaced by the files it holds, by name."""
+    files: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files += sorted(
+                e for e in path.iterdir() if e.is_file() and not e.name.startswith(".")
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def run_batch(
+    days: list[Day],
+    inputs: list[Path],
+    parts: list[int] | None = None,
+    jobs: int = 1,
+    instrument: str | None = None,
+    stream: bool = False,
+) -> list[PhaseResult]:
+    """Solve each day on every input file, with one set of results per input.
+
+    With several `jobs`, the inputs of each day are dealt over the workers, so
+    that each loads the day once for its share of them.
+    """
+    paths = input_files(inputs)
+    results: list[PhaseResult] = []
+    if jobs > 1:
+        futures: list[tuple[Day, Future[list[PhaseResult]]]] = []
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for day in days:
+                for i in range(min(jobs, len(paths))):
+                    futures.append(
+                        (
+                            day,
+                            executor.submit(
+                                solve_inputs,
+                                day,
+                                paths[i::jobs],
+                                parts,
+                                instrument,
+                                stream,
+                            ),
+                        )
+                    )
+            for day, future in futures:
+                try:
+                    results += future.result()
+                except Exception as e:
+                    results.append(
+                        PhaseResult(day, LOAD, error=f"{type(e).__name__}: {e}")
+                    )
+    else:
+        for day in days:
+            results += solve_inputs(day, paths, parts, instrument, stream)
+    # Back to the order of the inputs, from the order of the workers, with
+    # results that never got to an input first
+    input_order: dict[Path | None, int] = {path: i for i, path in enumerate(paths)}
+    results.sort(
+        key=lambda result: (
+            result.day.year,
+            result.day.day,
+            input_order.get(result.input, -1),
+        )
+    )
+    return results
+
+
+def plan_units(
+    days: list[Day], parts: list[int] | None = None
+) -> tuple[list[Unit], list[PhaseResult]]:
+    """Split the days into (day, part) units of work.
+
+    Days that cannot be run at all are returned as failed results instead.
+    """
+    units: list[Unit] = []
+    failures: list[PhaseResult] = []
+    for day in days:
+        try:
+            solver = Solver(day.load())
+        except Exception as e:
+            failures.append(PhaseResult(day, LOAD, error=f"{type(e).__name__}: {e}"))
+            continue
+        if not default_provider().has_input(day.year, day.day):
+            failures.append(PhaseResult(day, LOAD, error="missing input"))
+            continue
+        for part in solver.parts:
+            if parts is None or part in parts:
+                units.append((day, part))
+    return units, failures
+
+
+def schedule(units: list[DayUnit], timings: Timings) -> list[DayUnit]:
+    """Order units longest-first to minimise the makespan of a parallel run.
+
+    Units that were never timed are scheduled first, as they could be anything.
+    """
+
+    def expected_duration(unit: DayUnit) -> float:
+        day, parts = unit
+        return sum(
+            timings.get(timing_key(day.label, part_phase(part)), math.inf)
+            for part in parts
+        ) + timings.get(timing_key(day.label, PARSE), 0.0)
+
+    return sorted(units, key=expected_duration, reverse=True)
+
+
+def run_parallel(
+    units: list[Unit], jobs: int, instrument: str | None = None
+) -> list[PhaseResult]:
+    results: list[PhaseResult] = []
+    futures: list[tuple[Unit, Future[list[PhaseResult]]]] = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        single_parts = [(day, [part]) for day, part in units]
+        for day, [part] in schedule(single_parts, load_timings()):
+            futures.append(
+                ((day, part), executor.submit(solve_unit, day, part, instrument))
+            )
+        for (day, part), future in futures:
+            try:
+                results += future.result()
+            except Exception as e:
+                results.append(
+                    PhaseResult(day, part_phase(part), error=f"{type(e).__name__}: {e}")
+                )
+    return unique_results(results)
+
+
+def unique_results(results: list[PhaseResult]) -> list[PhaseResult]:
+    # Every worker parsed the input of its day, only report it once
+    unique: list[PhaseResult] = []
+    seen: set[tuple[Day, str]] = set()
+    for result in results:
+        if (result.day, result.phase) not in seen:
+            seen.add((result.day, result.phase))
+            unique.append(result)
+    return unique
+
+
+def watched_day(
+    connection: Connection, day: Day, parts: list[int], instrument: str | None = None
+) -> None:
+    # Entry point of the watched workers, which send each result as soon as it
+    # is known so that the parent can time each part on its own, and so that a
+    # timeout only loses the phase that was running
+    install_report_handler(connection)
+    solve_day(
+        day,
+        parts,
+        instrument,
+        report=lambda result: connection.send((RESULT, result)),
+    )
+    connection.send((DONE, None))
+    connection.close()
+
+
+@dataclass
+class WatchedDay:
+    day: Day
+    parts: list[int]
+    parses_once: bool
+    # Seconds each part may run, parse included for the first one
+    budgets: dict[int, float]
+    process: BaseProcess
+    connection: Connection
+    # When the part running now started, i.e. when the previous one ended
+    part_start: float
+    results: list[PhaseResult] = field(default_factory=list)
+
+    def pending_parts(self) -> list[int]:
+        done = {result.phase for result in self.results}
+        return [part for part in self.parts if part_phase(part) not in done]
+
+    def remaining_parts(self) -> list[int]:
+        """Parts still to solve once the worker is gone, none if parse failed."""
+        if any(e.phase == PARSE and e.error is not None for e in self.results):
+            return []
+        return self.pending_parts()
+
+    def running_phase(self) -> str | None:
+        done = {result.phase for result in self.results}
+        if self.parses_once and PARSE not in done:
+            return PARSE
+        pending = self.pending_parts()
+        return part_phase(pending[0]) if len(pending) > 0 else None
+
+    @property
+    def deadline(self) -> float:
+        pending = self.pending_parts()
+        if len(pending) == 0:
+            return math.inf
+        return self.part_start + self.budgets[pending[0]]
+
+    def add_result(self, result: PhaseResult) -> None:
+        self.results.append(result)
+        # The worker moves on to the next part right after sending a result
+        if result.phase != PARSE:
+            self.part_start = time.perf_counter()
+
+    def fail(self, error: str, timeout: TimeoutReport | None = None) -> None:
+        # The phase that was running when the worker stopped, if any
+        phase = self.running_phase()
+        if phase is not None:
+            self.results.append(
+                PhaseResult(
+                    self.day,
+                    phase,
+                    duration=time.perf_counter() - self.part_start,
+                    error=error,
+                    timeout=timeout,
+                )
+            )
+
+    def stop(self) -> None:
+        """Kill the worker, and add the partial result of the running phase."""
+        budget = self.budgets[self.pending_parts()[0]]
+        report = TimeoutReport(budget)
+        if self.process.pid is not None:
+            os.kill(self.process.pid, REPORT_SIGNAL)
+        deadline = time.monotonic() + GRACE_PERIOD
+        try:
+            # A result may still be on its way before the report
+            while self.connection.poll(max(deadline - time.monotonic(), 0)):
+                kind, value = self.connection.recv()
+                if kind == RESULT:
+                    self.add_result(value)
+                elif kind == TIMEOUT:
+                    report = value
+                    report.budget = budget
+                    break
+        except (EOFError, OSError):
+            pass
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+        self.fail(f"TimeoutError: no answer after {report.budget:g}s", report)
+
+
+def start_watched(
+    day: Day, parts: list[int], instrument: str | None, timeout: float
+) -> WatchedDay:
+    solver = Solver(day.load())
+    budgets = {
+        part: budget if (budget := solver.time_budget(part)) is not None else timeout
+        for part in parts
+    }
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=watched_day, args=(sender, day, parts, instrument), daemon=True
+    )
+    process.start()
+    # Only the worker writes, and the parent must see EOF if it dies
+    sender.close()
+    return WatchedDay(
+        day,
+        parts,
+        solver.parses_once,
+        budgets,
+        process,
+        receiver,
+        time.perf_counter(),
+    )
+
+
+def day_units(units: list[Unit]) -> list[DayUnit]:
+    """Group the units of each day together, in the order of their days."""
+    parts: dict[Day, list[int]] = {}
+    for day, part in units:
+        parts.setdefault(day, []).append(part)
+    return list(parts.items())
+
+
+def run_watched(
+    units: list[Unit], jobs: int, timeout: float, instrument: str | None = None
+) -> list[PhaseResult]:
+    """Run the parts of each day in a worker of its own, killed if they run late.
+
+    The worker parses the input of its day once for all of its parts, like an
+    unwatched run. Each part gets `timeout` seconds, parse included for the
+    first one, unless its day sets a PARTN_TIME_BUDGET. The parts left after
+    one that timed out go on in a new worker. Up to `jobs` workers run at once.
+    """
+    days = day_units(units)
+    pending = schedule(days, load_timings()) if jobs > 1 else days
+    pending.reverse()
+    running: dict[Connection, WatchedDay] = {}
+    results: list[PhaseResult] = []
+
+    def finish(watched: WatchedDay) -> None:
+        nonlocal results
+        results += watched.results
+        del running[watched.connection]
+        remaining = watched.remaining_parts()
+        if len(remaining) > 0:
+            pending.append((watched.day, remaining))
+
+    while len(pending) > 0 or len(running) > 0:
+        while len(pending) > 0 and len(running) < jobs:
+            watched = start_watched(*pending.pop(), instrument, timeout)
+            running[watched.connection] = watched
+        deadline = min(watched.deadline for watched in running.values())
+        wait_time = (
+            max(deadline - time.perf_counter(), 0) if deadline != math.inf else None
+        )
+        for connection in wait(list(running), wait_time):
+            watched = running[connection]  # type: ignore[index]
+            try:
+                kind, value = watched.connection.recv()
+            except EOFError:
+                # The worker died without a word, e.g. killed for lack of memory
+                watched.process.join()
+                watched.fail(f"worker died with exit code {watched.process.exitcode}")
+                watched.connection.close()
+                finish(watched)
+                continue
+            if kind == RESULT:
+                watched.add_result(value)
+            elif kind == DONE:
+                watched.process.join()
+                watched.connection.close()
+                finish(watched)
+        now = time.perf_counter()
+        for watched in [e for e in running.values() if e.deadline <= now]:
+            watched.stop()
+            finish(watched)
+    return unique_results(results)
+
+
+def run_days(
+    days: list[Day],
+    parts: list[int] | None = None,
+    jobs: int = 1,
+    instrument: str | None = None,
+    timeout: float | None = None,
+) -> list[PhaseResult]:
+    """Solve the parts of the days, each in a killable worker if `timeout`."""
+    units, results = plan_units(days, parts)
+    if timeout is not None:
+        results += run_watched(units, jobs, timeout, instrument)
+    elif jobs > 1:
+        results += run_parallel(units, jobs, instrument)
+    else:
+        for day in days:
+            day_parts = [part for unit_day, part in units if unit_day == day]
+            if len(day_parts) > 0:
+                results += solve_day(day, day_parts, instrument)
+    results.sort(
+        key=lambda result: (
+            result.day.year,
+            result.day.day,
+            PHASE_ORDER.index(result.phase),
+        )
+    )
+    return results
+
+
+def format_reports(results: list[PhaseResult], top: int = DEFAULT_TOP) -> str:
+    """The reports of the instrumented phases of a run."""
+    reports: list[str] = []
+    for result in results:
+        if result.profile is not None and result.profile.is_file():
+            reports.append(
+                f"== {result.day.label} {result.phase} ({result.profile})\n"
+                + format_profile(result.profile, top)
+            )
+        elif result.memory is not None:
+            reports.append(
+                f"== {result.day.label} {result.phase}\n"
+                + format_memory_report(result.memory, top)
+            )
+        elif result.samples is not None and result.samples.is_file():
+            reports.append(
+                f"== {result.day.label} {result.phase} ({result.samples})\n"
+                + format_samples(load_stacks(result.samples), top)
+            )
+    return "\n\n".join(reports)
+
+
+def format_timeouts(results: list[PhaseResult]) -> str:
+    return "\n".join(
+        f"{result.day.label} {result.phase}: {format_timeout(result.timeout)}"
+        for result in results
+        if result.timeout is not None
+    )
+
+
+def aggregate_samples(results: list[PhaseResult], path: Path) -> Path:
+    """Merge the stack samples of every phase of a run into a single file."""
+    save_stacks(
+        aggregate_stacks(
+            [
+                (f"{result.day.label};{result.phase}", result.samples)
+                for result in results
+                if result.samples is not None and result.samples.is_file()
+            ]
+        ),
+        path,
+    )
+    return path
+
+
+def record_timings(results: list[PhaseResult]) -> None:
+    timings = load_timings()
+    for result in results:
+        if result.error is None and result.phase != LOAD:
+            timings[timing_key(result.day.label, result.phase)] = result.duration
+    save_timings(timings)
+
+
+def format_duration(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    elif seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.0f}us"
+
+
+def format_table(results: list[PhaseResult], wall_time: float | None = None) -> str:
+    rows: list[tuple[str, str, str, str]] = [("Day", "Phase", "Answer", "Time")]
+    total = 0.0
+    day_total = 0.0
+    for i, result in enumerate(results):
+        total += result.duration
+        day_total += result.duration
+        label = result.day.label
+        if result.input is not None:
+            label += f" {result.input}"
+        if result.error is not None:
+            answer = f"! {result.error}"
+        elif result.phase == PARSE:
+            answer = ""
+        else:
+            answer = str(result.answer)
+        rows.append((label, result.phase, answer, format_duration(result.duration)))
+        # Batch runs total each input of a day apart
+        is_last_of_day = i + 1 == len(results) or (
+            results[i + 1].day,
+            results[i + 1].input,
+        ) != (result.day, result.input)
+        if is_last_of_day and result.phase != LOAD:
+            rows.append((label, "*", "", format_duration(day_total)))
+        if is_last_of_day:
+            day_total = 0.0
+    rows.append(("Total", "", "", format_duration(total)))
+    if wall_time is not None:
+        rows.append(("Wall", "", "", format_duration(wall_time)))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(4)]
+    lines = [
+        f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  "
+        f"{row[2]:<{widths[2]}}  {row[3]:>{widths[3]}}"
+        for row in rows
+    ]
+    return "\n".join(lines)
+
+
+def profile_main(year: int, day: int, argv: list[str]) -> int:
+    """Entry point of `python src/<year>/dayNN.py [input] --profile`."""
+    parser = argparse.ArgumentParser(prog=f"day{day:02d}.py")
+    parser.add_argument("input", nargs="?", type=Path, default=None)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    args = parser.parse_args(argv)
+    input_text = args.input.read_text() if args.input is not None else None
+    results = solve_day(Day(year, day), list(PARTS), PROFILE, input_text)
+    print(format_table(results))
+    print()
+    print(format_reports(results, args.top))
+    return 1 if any(result.error is not None for result in results) else 0
@@ -0,0 +1,133 @@
+from collections import Counter
+from pathlib import Path
+import signal
+import threading
+from types import CodeType, FrameType
+from typing import Any, Callable
+
+from advent.days import Day
+from advent.profiling import HARNESS_FILES
+from advent.streaming import lines
+from advent.timings import STATE_DIR
+
+SAMPLES_DIR = STATE_DIR / "samples"
+AGGREGATE_PATH = SAMPLES_DIR / "all.folded"
+# Seconds of CPU time between two samples
+INTERVAL = 0.001
+
+# Number of samples of each collapsed stack, "outer;...;inner"
+type Stacks = Counter[str]
+
+
+def sample_path(day: Day, phase: str, directory: Path = SAMPLES_DIR) -> Path:
+    return directory / str(day.year) / f"{day.name}-{phase}.folded"
+
+
+# Name of the function of each code object, or None for the harness
+_names: dict[CodeType, str | None] = {}
+
+
+def code_name(code: CodeType) -> str | None:
+    # Called for every frame of every sample, hence the cache
+    if code not in _names:
+        _names[code] = (
+            None
+            if code.co_filename in HARNESS_FILES
+            else f"{Path(code.co_filename).stem}.{code.co_qualname}"
+        )
+    return _names[code]
+
+
+def collapse(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None:
+        name = code_name(frame.f_code)
+        if name is None:
+            # Everything from the harness up is the same for every sample
+            break
+        names.append(name)
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def run_sampled(
+    function: Callable[[], Any], path: Path, interval: float = INTERVAL
+) -> Any:
+    """Call `function` while sampling its stack, and save them to `path`.
+
+    A SIGPROF timer interrupts the main thread every `interval` seconds of CPU
+    time, which is much lighter than tracing every call like cProfile does.
+    The stacks are saved collapsed, in the text format of flamegraph.pl.
+    Outside of the main thread, where there are no signals, nothing is sampled.
+    """
+    stacks: Stacks = Counter()
+    sampling = False
+
+    def on_timer(signum: int, frame: FrameType | None) -> None:
+        nonlocal sampling
+        # A slow sample could be interrupted by the next one, which would then
+        # sample this handler
+        if sampling:
+            return
+        sampling = True
+        stack = collapse(frame)
+        if stack != "":
+            stacks[stack] += 1
+        sampling = False
+
+    use_timer = threading.current_thread() is threading.main_thread()
+    if use_timer:
+        previous_handler = signal.signal(signal.SIGPROF, on_timer)
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        return function()
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous_handler)
+        save_stacks(stacks, path)
+
+
+def save_stacks(stacks: Stacks, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+    )
+
+
+def load_stacks(path: Path) -> Stacks:
+    stacks: Stacks = Counter()
+    for line in lines(path):
+        stack, _, count = line.rpartition(" ")
+        stacks[stack] += int(count)
+    return stacks
+
+
+def aggregate_stacks(paths: list[tuple[str, Path]]) -> Stacks:
+    """Merge the stacks of several phases, under a root frame for each.
+
+    `paths` pairs each file with its root, e.g. "2024/22;part1", so that a
+    flame graph of a whole year still groups the samples per day.
+    """
+    stacks: Stacks = Counter()
+    for root, path in paths:
+        for stack, count in load_stacks(path).items():
+            stacks[f"{root};{stack}"] += count
+    return stacks
+
+
+def format_samples(stacks: Stacks, top: int) -> str:
+    """The `top` functions the samples were taken in, by self samples."""
+    total = sum(stacks.values())
+    if total == 0:
+        return "No samples, the phase is shorter than the sampling interval"
+    leaves: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        leaves[stack.rpartition(";")[2]] += count
+    rows = [("Samples", "Share", "Function (by self samples)")]
+    for function, count in leaves.most_common(top):
+        rows.append((str(count), f"{count / total * 100:.1f}%", function))
+    widths = [max(len(row[i]) for row in rows) for i in range(2)]
+    return "\n".join(
+        f"{row[0]:>{widths[0]}}  {row[1]:>{widths[1]}}  {row[2]}" for row in rows
+    )
@@ -0,0 +1,195 @@
+from dataclasses import dataclass, field
+from functools import partial
+import math
+import time
+from typing import Any, Callable
+
+from advent.days import Day
+from advent.generators import dimensions, generate
+from advent.memo import clear_memos
+from advent.solver import PARSE, Solver, part_phase
+
+# Exponent of the input scale expected from each phase of the solutions, when
+# it is not linear. Phases mapped to None are not measured (e.g. a search whose
+# cost depends on the values in the input rather than on its length).
+EXPECTED_EXPONENTS: dict[str, dict[str, float | None]] = {
+    # Replays the walk of the guard, whose length depends on the layout of the
+    # obstructions much more than on the size of the lab
+    "2024/06": {"part2": None},
+    # Pairs of antennas of the same frequency, and there are at most 62 of them
+    "2024/08": {"part1": 2.0, "part2": 2.0},
+    # Searches for a picture, which random robots never draw
+    "2024/14": {"part2": None},
+    # Every lock is tried against every key
+    "2024/25": {"part1": 2.0},
+}
+DEFAULT_EXPONENT = 1.0
+
+
+class NotEnoughPointsError(Exception):
+    pass
+
+
+@dataclass
+class ScalingPoint:
+    size: int
+    # How much the input grew: the size itself for line counts, its square for
+    # grid sides... Measuring the length of the input instead would count the
+    # fixed sections of some inputs (e.g. the rules of day 5) as growth
+    scale: int
+    duration: float
+
+
+@dataclass
+class ScalingResult:
+    day: Day
+    phase: str
+    expected: float
+    points: list[ScalingPoint] = field(default_factory=list)
+    exponent: float | None = None
+    error: str | None = None
+
+    def exceeds(self, tolerance: float) -> bool:
+        return self.exponent is not None and self.exponent > self.expected + tolerance
+
+
+def fit_exponent(points: list[ScalingPoint]) -> float:
+    """Slope of the least-squares line through the points, in log-log space."""
+    if len(points) < 3:
+        raise NotEnoughPointsError(len(points))
+    xs = [math.log(point.scale) for point in points]
+    ys = [math.log(point.duration) for point in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        raise NotEnoughPointsError(len(points))
+    return covariance / variance
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    # The minimum is the least noisy estimate of the cost of a call
+    durations: list[float] = []
+    for _ in range(repeat):
+        # Every call starts from empty caches, or the repeats would only time
+        # cache hits
+        clear_memos()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def measure_scaling(
+    day: Day,
+    parts: list[int] | None = None,
+    seed: int = 0,
+    start_size: int = 16,
+    points: int = 5,
+    repeat: int = 3,
+    min_time: float = 1e-3,
+    max_time: float = 1.0,
+    max_scale: int = 2**20,
+) -> list[ScalingResult]:
+    """Time the phases of a day on generated inputs of doubling sizes.
+
+    A phase grows until its next call is expected to take more than `max_time`,
+    and the exponent is fitted on its `points` largest sizes only, where fixed
+    costs matter least. Calls shorter than `min_time` are never fitted.
+    """
+    solver = Solver(day.load())
+    expectations = EXPECTED_EXPONENTS.get(day.label, {})
+    phases = [PARSE] if solver.parses_once else []
+    phases += [
+        part_phase(part) for part in solver.parts if parts is None or part in parts
+    ]
+    results: dict[str, ScalingResult] = {}
+    for phase in phases:
+        expected = expectations.get(phase, DEFAULT_EXPONENT)
+        if expected is not None:
+            results[phase] = ScalingResult(day, phase, expected)
+    growing = set(results)
+    scale_dimensions = dimensions(day)
+    step = 0
+    size = start_size
+    # Past a million lines or grid cells, generating inputs takes longer than
+    # solving them
+    while len(growing) > 0 and size**scale_dimensions <= max_scale:
+        input_text = generate(day, size, seed)
+        try:
+            parsed = solver.parse(input_text)
+        except Exception as e:
+            for phase in growing:
+                results[phase].error = f"{type(e).__name__} at size {size}"
+            break
+        for phase in sorted(growing):
+            if phase == PARSE:
+                function = partial(solver.parse, input_text)
+            else:
+                function = partial(
+                    solver.solve, int(phase.removeprefix("part")), parsed
+                )
+            try:
+                duration = best_time(function, repeat)
+            except Exception as e:
+                # Keep what was measured on the smaller sizes
+                results[phase].error = f"{type(e).__name__} at size {size}"
+                growing.remove(phase)
+                continue
+            measured = results[phase].points
+            measured.append(ScalingPoint(size, size**scale_dimensions, duration))
+            # Doubling the size of a quadratic phase quadruples its duration (or
+            # worse), so extrapolate from the last doubling rather than wait for
+            # a call to actually go over the limit
+            growth = 2.0
+            if len(measured) > 1 and measured[-2].duration >= min_time:
+                growth = max(growth, duration / measured[-2].duration)
+            if duration * growth > max_time:
+                growing.remove(phase)
+        # Double the scale of the input at each step, whatever its dimensions
+        step += 1
+        size = round(start_size * 2 ** (step / scale_dimensions))
+
+    for result in results.values():
+        fitted = [point for point in result.points if point.duration >= min_time]
+        try:
+            result.exponent = fit_exponent(fitted[-points:])
+        except NotEnoughPointsError:
+            pass
+    return list(results.values())
+
+
+def render_scaling(results: list[ScalingResult], tolerance: float) -> str:
+    rows = [("Day", "Phase", "Sizes", "Exponent", "Expected", "")]
+    for result in results:
+        sizes = (
+            f"{result.points[0].size}-{result.points[-1].size}"
+            if len(result.points) > 0
+            else ""
+        )
+        notes: list[str] = []
+        if result.exceeds(tolerance):
+            notes.append("STEEPER")
+        if result.exponent is None:
+            notes.append("not enough points to fit")
+        if result.error is not None:
+            notes.append(f"! {result.error}")
+        rows.append(
+            (
+                result.day.label,
+                result.phase,
+                sizes,
+                f"{result.exponent:.2f}" if result.exponent is not None else "-",
+                f"{result.expected:.2f}",
+                ", ".join(notes),
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.rjust(widths[i]) if i in (3, 4) else cell.ljust(widths[i])
+            for i, cell in enumerate(row)
+        ).rstrip()
+        for row in rows
+    )
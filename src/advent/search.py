@@ -0,0 +1,151 @@
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+import heapq
+import sys
+
+# Nodes are integers below the `size` given to the searches, e.g. indices of
+# grid cells, so that the distances fit in a flat list
+type Node = int
+type Cost = int
+type Neighbours = Callable[[Node], Iterable[Node]]
+type WeightedNeighbours = Callable[[Node], Iterable[tuple[Node, Cost]]]
+type Goal = Callable[[Node], bool]
+type Heuristic = Callable[[Node], Cost]
+
+# Distance of the nodes the search did not reach
+UNREACHED = sys.maxsize
+
+
+class UnreachedError(Exception):
+    pass
+
+
+@dataclass
+class SearchResult:
+    # Distance from the closest start of each node
+    distances: list[Cost]
+    # Node each node was first reached from, or -1
+    previous: list[Node]
+    # First goal reached, if the search had a goal and reached it
+    goal: Node | None = None
+    # Every node each node is reached from along a shortest path, only filled
+    # by searches asked for all of them
+    predecessors: dict[Node, list[Node]] = field(default_factory=dict)
+
+    def distance(self, node: Node) -> Cost:
+        if self.distances[node] == UNREACHED:
+            raise UnreachedError(node)
+        return self.distances[node]
+
+    def path(self, node: Node) -> list[Node]:
+        """One of the shortest paths to `node`, from its start."""
+        self.distance(node)
+        path = [node]
+        while self.previous[node] != -1:
+            node = self.previous[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+    def on_shortest_paths(self, ends: Iterable[Node]) -> set[Node]:
+        """Nodes on any shortest path to `ends`, which needs all predecessors."""
+        seen = set(ends)
+        to_visit = list(seen)
+        while len(to_visit) > 0:
+            node = to_visit.pop()
+            for predecessor in self.predecessors.get(node, ()):
+                if predecessor not in seen:
+                    seen.add(predecessor)
+                    to_visit.append(predecessor)
+        return seen
+
+
+def bfs(
+    starts: Iterable[Node],
+    neighbours: Neighbours,
+    size: int,
+    goal: Goal | None = None,
+) -> SearchResult:
+    """Breadth-first search, for graphs whose edges all cost 1.
+
+    Stops at the first node `goal` accepts, otherwise explores everything
+    reachable from `starts`.
+    """
+    result = SearchResult([UNREACHED] * size, [-1] * size)
+    distances = result.distances
+    queue: deque[Node] = deque()
+    for start in starts:
+        distances[start] = 0
+        queue.append(start)
+    while len(queue) > 0:
+        node = queue.popleft()
+        if goal is not None and goal(node):
+            result.goal = node
+            break
+        distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = distance
+                result.previous[neighbour] = node
+                queue.append(neighbour)
+    return result
+
+
+def dijkstra(
+    starts: Iterable[Node],
+    neighbours: WeightedNeighbours,
+    size: int,
+    goal: Goal | None = None,
+    heuristic: Heuristic | None = None,
+    all_predecessors: bool = False,
+) -> SearchResult:
+    """Shortest paths from `starts`, for edges of non-negative costs.
+
+    With a `heuristic`, this is A*: it must never overestimate the distance
+    left to a goal, nor decrease by more than the cost of an edge along one,
+    for the goal to be reached along a shortest path.
+
+    Stops once the first node `goal` accepts is settled, or once all the paths
+    as short as the one to it are known when `all_predecessors` is set.
+    """
+    result = SearchResult([UNREACHED] * size, [-1] * size)
+    distances = result.distances
+    previous = result.previous
+    predecessors = result.predecessors
+    # (priority, node): the binary heap has no decrease-key, so a node is pushed
+    # again whenever a shorter path to it is found and the stale entries are
+    # skipped when popped
+    queue: list[tuple[Cost, Node]] = []
+    for start in starts:
+        distances[start] = 0
+        queue.append((heuristic(start) if heuristic is not None else 0, start))
+    heapq.heapify(queue)
+    settled = bytearray(size)
+    bound = UNREACHED
+    while len(queue) > 0:
+        priority, node = heapq.heappop(queue)
+        if priority > bound:
+            break
+        if settled[node]:
+            continue
+        settled[node] = True
+        if result.goal is None and goal is not None and goal(node):
+            result.goal = node
+            if not all_predecessors:
+                break
+            bound = priority
+        distance = distances[node]
+        for neighbour, cost in neighbours(node):
+            alternative = distance + cost
+            if alternative < distances[neighbour]:
+                distances[neighbour] = alternative
+                previous[neighbour] = node
+                if all_predecessors:
+                    predecessors[neighbour] = [node]
+                if heuristic is not None:
+                    alternative += heuristic(neighbour)
+                heapq.heappush(queue, (alternative, neighbour))
+            elif all_predecessors and alternative == distances[neighbour]:
+                predecessors.setdefault(neighbour, []).append(node)
+    return result
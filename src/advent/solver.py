@@ -0,0 +1,111 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+
+PARTS = (1, 2)
+PARSE = "parse"
+PHASES = (PARSE, "part1", "part2")
+
+
+def part_phase(part: int) -> str:
+    return f"part{part}"
+
+
+def reference_name(part: int) -> str:
+    return f"reference_part{part}"
+
+
+def stream_name(part: int) -> str:
+    return f"stream_part{part}"
+
+
+@dataclass
+class Solver:
+    """Uniform interface over the two shapes a solution module can take.
+
+    A module that defines `parse(text) -> Parsed` follows the parse-once
+    contract: its input is parsed a single time and `part1(parsed)` and
+    `part2(parsed)` share the result, so they must not mutate it.
+
+    Any other module is driven through its historical `partN(input: str)`
+    functions, which parse on their own. The parse phase then only times
+    `parse_input`, when there is one, for information.
+
+    Either kind may also keep a straightforward `reference_partN(input: str)`
+    next to an optimized `partN`, for advent.differential to check the answers
+    of one against the other.
+
+    Days whose records can be read a batch at a time also expose
+    `stream_partN(chunks: Iterable[str])`, taking the input as texts of whole
+    lines (see advent.streaming), for inputs too large to hold in memory. The
+    ones setting `STREAM_WHOLE_LINES = False` get chunks cut anywhere.
+    """
+
+    module: ModuleType
+
+    @property
+    def parses_once(self) -> bool:
+        return callable(getattr(self.module, "parse", None))
+
+    @property
+    def parts(self) -> list[int]:
+        return [
+            part
+            for part in PARTS
+            if callable(getattr(self.module, part_phase(part), None))
+        ]
+
+    @property
+    def reference_parts(self) -> list[int]:
+        return [
+            part
+            for part in self.parts
+            if callable(getattr(self.module, reference_name(part), None))
+        ]
+
+    @property
+    def stream_parts(self) -> list[int]:
+        return [
+            part
+            for part in self.parts
+            if callable(getattr(self.module, stream_name(part), None))
+        ]
+
+    @property
+    def stream_whole_lines(self) -> bool:
+        return getattr(self.module, "STREAM_WHOLE_LINES", True)
+
+    def part_args(self, part: int) -> tuple[Any, ...]:
+        # Some parts take puzzle parameters on top of the input (e.g. the grid
+        # size of day 14), which the days expose as PART1_ARGS / PART2_ARGS
+        return tuple(getattr(self.module, f"PART{part}_ARGS", ()))
+
+    def time_budget(self, part: int) -> float | None:
+        # Seconds a part may take before the watchdog of the runner stops it,
+        # for the days that need more (or less) than the default
+        return getattr(self.module, f"PART{part}_TIME_BUDGET", None)
+
+    def parse(self, input_text: str) -> Any:
+        if self.parses_once:
+            return self.module.parse(input_text)
+        return input_text
+
+    def parse_only(self, input_text: str) -> Any:
+        # What the parse phase of a benchmark measures
+        if self.parses_once:
+            return self.module.parse(input_text)
+        parse_input = getattr(self.module, "parse_input", None)
+        return parse_input(input_text) if callable(parse_input) else input_text
+
+    def solve(self, part: int, parsed: Any) -> Any:
+        solver = getattr(self.module, part_phase(part))
+        return solver(parsed, *self.part_args(part))
+
+    def solve_reference(self, part: int, input_text: str) -> Any:
+        reference = getattr(self.module, reference_name(part))
+        return reference(input_text, *self.part_args(part))
+
+    def solve_stream(self, part: int, chunks: Iterable[str]) -> Any:
+        stream = getattr(self.module, stream_name(part))
+        return stream(chunks, *self.part_args(part))
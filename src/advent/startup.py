@@ -0,0 +1,244 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import py_compile
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+from advent.days import SRC_DIR, Day, available_years
+from advent.runner import format_duration
+from advent.timings import STATE_DIR
+
+# days.ROOT_DIR relies on the bundle being right under the state directory
+BUNDLE_PATH = STATE_DIR / "advent.pyz"
+BUNDLE_MAIN = """import sys
+
+from advent.__main__ import main
+
+sys.exit(main())
+"""
+DEFAULT_REPEAT = 5
+DEFAULT_PACKAGES = 3
+# Written to stderr between loading a day and running it, so that the imports
+# traced after it are the ones the day defers until it runs
+LOADED_MARKER = "advent: day loaded"
+
+# e.g. "import time:       844 |       9794 |     re", in microseconds, with
+# two more spaces of indentation per level of nesting
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    # Seconds spent running the module itself, and with the imports it made
+    self_time: float
+    cumulative: float
+    # 0 for the imports made by the measured code itself
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    day: Day
+    # Fastest wall time of an interpreter that only loads the day
+    wall_time: float = 0.0
+    # Imports beyond the ones of a bare interpreter, in the order they ended
+    imports: list[ImportTime] = field(default_factory=list)
+    # Imports made only once the day runs, e.g. numpy by advent.parsing
+    deferred: list[ImportTime] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def import_time(self) -> float:
+        return sum(module.self_time for module in self.imports)
+
+    @property
+    def deferred_time(self) -> float:
+        return sum(module.self_time for module in self.deferred)
+
+    def packages(self) -> list[tuple[str, float]]:
+        """Import time per top-level package, e.g. all of numpy, slowest first.
+
+        Deferred imports count too, as every run of the day pays for them.
+        """
+        totals: defaultdict[str, float] = defaultdict(float)
+        for module in self.imports + self.deferred:
+            totals[module.module.split(".")[0]] += module.self_time
+        return sorted(totals.items(), key=lambda e: e[1], reverse=True)
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse the report `python -X importtime` writes to stderr."""
+    imports: list[ImportTime] = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_time, cumulative, indent, module = match.groups()
+        imports.append(
+            ImportTime(
+                module, int(self_time) / 1e6, int(cumulative) / 1e6, len(indent) // 2
+            )
+        )
+    return imports
+
+
+def run_python(
+    code: str, path: Path, *options: str
+) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(path)}
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_startup(
+    code: str, path: Path, repeat: int
+) -> tuple[float, list[ImportTime]]:
+    """Fastest wall time of running `code` in a new interpreter, and its imports.
+
+    The imports are traced in a separate run, as tracing slows them down.
+    """
+    wall_time = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_python(code, path)
+        wall_time = min(wall_time, time.perf_counter() - start)
+    traced = run_python(code, path, "-X", "importtime")
+    return wall_time, parse_import_times(traced.stderr)
+
+
+def load_code(day: Day) -> str:
+    return f"from advent.days import Day; Day({day.year}, {day.day}).load()"
+
+
+def run_code(day: Day) -> str:
+    # Loads the day, then parses its example input and solves part 1 on it,
+    # which is enough to go through the imports it defers
+    return f"""import sys
+from advent.days import Day
+from advent.solver import Solver
+solver = Solver(Day({day.year}, {day.day}).load())
+print({LOADED_MARKER!r}, file=sys.stderr, flush=True)
+try:
+    solver.solve(1, solver.parse(getattr(solver.module, "EXAMPLE_INPUT", "")))
+except Exception:
+    pass
+"""
+
+
+def deferred_imports(day: Day, path: Path) -> list[ImportTime]:
+    """The imports a day only makes once it runs, traced on its example."""
+    traced = run_python(run_code(day), path, "-X", "importtime")
+    _, _, after_load = traced.stderr.partition(LOADED_MARKER)
+    return parse_import_times(after_load)
+
+
+def startup_reports(
+    days: list[Day], repeat: int = DEFAULT_REPEAT, bundle: Path | None = None
+) -> tuple[float, list[StartupReport]]:
+    """Measure what it costs to start an interpreter and load each day.
+
+    Returns the wall time of a bare interpreter too, whose own imports are
+    left out of the reports. With `bundle`, the days are loaded from that
+    zipapp instead of the source tree.
+    """
+    path = bundle if bundle is not None else SRC_DIR
+    bare_time, bare_imports = measure_startup("pass", path, repeat)
+    preloaded = {module.module for module in bare_imports}
+    reports: list[StartupReport] = []
+    for day in days:
+        report = StartupReport(day)
+        try:
+            report.wall_time, imports = measure_startup(load_code(day), path, repeat)
+        except subprocess.CalledProcessError as e:
+            last_line = e.stderr.strip().splitlines()[-1:] or [
+                f"exit code {e.returncode}"
+            ]
+            report.error = last_line[0]
+        else:
+            report.imports = [e for e in imports if e.module not in preloaded]
+            report.deferred = deferred_imports(day, path)
+        reports.append(report)
+    return bare_time, reports
+
+
+def render_startup(
+    bare_time: float, reports: list[StartupReport], top: int = DEFAULT_PACKAGES
+) -> str:
+    header = ("Day", "Wall", "Imports", "Deferred", "Slowest packages")
+    rows: list[tuple[str, ...]] = [("python", format_duration(bare_time), "", "", "")]
+    for report in reports:
+        if report.error is not None:
+            rows.append((report.day.label, "", "", "", f"! {report.error}"))
+            continue
+        rows.append(
+            (
+                report.day.label,
+                format_duration(report.wall_time),
+                format_duration(report.import_time),
+                format_duration(report.deferred_time),
+                ", ".join(
+                    f"{package} {format_duration(seconds)}"
+                    for package, seconds in report.packages()[:top]
+                ),
+            )
+        )
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(4)]
+    lines: list[str] = []
+    for row in [header, *rows]:
+        lines.append(
+            f"{row[0]:<{widths[0]}}  {row[1]:>{widths[1]}}  "
+            f"{row[2]:>{widths[2]}}  {row[3]:>{widths[3]}}  {row[4]}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+def bundle_sources() -> list[tuple[Path, str]]:
+    # (source file, name in the bundle) of the harness and of every solution
+    sources = [
+        (path, path.relative_to(SRC_DIR).as_posix())
+        for path in sorted((SRC_DIR / "advent").rglob("*.py"))
+    ]
+    for year in available_years():
+        for path in sorted((SRC_DIR / str(year)).glob("day[0-9][0-9].py")):
+            day = Day(year, int(path.stem.removeprefix("day")))
+            sources.append((path, f"{day.module_name}.py"))
+    return sources
+
+
+def build_bundle(path: Path = BUNDLE_PATH) -> Path:
+    """Zip the harness and every solution into a zipapp, with their bytecode.
+
+    `python .advent/advent.pyz run 2024` then reads one uncompressed archive
+    instead of looking up every module and its cached bytecode on disk. The
+    bytecode is hash-based and unchecked, as the sources in the archive can not
+    change: rebuild the bundle after editing them.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as bundle,
+    ):
+        bytecode = Path(directory) / "module.pyc"
+        bundle.writestr("__main__.py", BUNDLE_MAIN)
+        for source, name in bundle_sources():
+            py_compile.compile(
+                str(source),
+                str(bytecode),
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+            bundle.write(source, name)
+            bundle.write(bytecode, name + "c")
+    return path
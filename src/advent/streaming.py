@@ -0,0 +1,61 @@
+import codecs
+from collections.abc import Iterator
+from contextlib import contextmanager
+import mmap
+import os
+from pathlib import Path
+
+# Bytes per chunk of a file, which then runs to the end of its last line
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """The content of `path`, mapped read-only instead of read into memory.
+
+    The OS pages it in as it is read, and can drop the pages already read, so
+    that even inputs larger than memory can be scanned.
+    """
+    with path.open("rb") as file:
+        # Empty files can not be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def file_chunks(
+    path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE, whole_lines: bool = True
+) -> Iterator[str]:
+    """The text of `path`, `chunk_size` bytes at a time, cut after line ends.
+
+    Each chunk holds whole lines, so that it can go through the parser of a
+    whole input, e.g. the NumPy ones of advent.parsing. Blank chunks are left
+    out, as such parsers would read them as an empty record.
+
+    Without `whole_lines`, chunks are cut every `chunk_size` bytes wherever
+    they fall, for readers that carry what a cut splits over to the next
+    chunk (e.g. the tokenizer of day 3, whose input is a few long lines).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with mapped(path) as data:
+        start = 0
+        while start < len(data):
+            end = start + chunk_size
+            if whole_lines and end < len(data):
+                newline = data.find(b"\n", end - 1)
+                end = len(data) if newline == -1 else newline + 1
+            # A cut can split a character, whose end then comes with the next chunk
+            chunk = decoder.decode(data[start:end], final=end >= len(data))
+            start = end
+            if whole_lines and chunk.isspace():
+                continue
+            if chunk != "":
+                yield chunk
+
+
+def lines(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """The lines of `path` without their line end, read lazily."""
+    for chunk in file_chunks(path, chunk_size):
+        yield from chunk.splitlines()
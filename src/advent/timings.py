@@ -0,0 +1,28 @@
+import json
+from pathlib import Path
+
+from advent.days import ROOT_DIR
+
+STATE_DIR = ROOT_DIR / ".advent"
+TIMINGS_PATH = STATE_DIR / "timings.json"
+
+# Keyed by "<year>/<day>/<phase>", e.g. "2024/01/part1", in seconds
+type Timings = dict[str, float]
+
+
+def timing_key(label: str, phase: str) -> str:
+    return f"{label}/{phase}"
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> Timings:
+    if not path.is_file():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_timings(timings: Timings, path: Path = TIMINGS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(timings, indent=2, sort_keys=True) + "\n")
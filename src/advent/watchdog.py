@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+import os
+import signal
+from types import FrameType
+from typing import TYPE_CHECKING, Any
+
+from advent.sampling import collapse
+
+if TYPE_CHECKING:
+    # Solutions import this module to report progress, and multiprocessing
+    # would double the import time of the short ones
+    from multiprocessing.connection import Connection
+
+# Seconds a part may run, parse included, before its worker is killed
+DEFAULT_BUDGET = 60.0
+# Seconds a worker gets to report where it was stuck, before being killed anyway
+GRACE_PERIOD = 1.0
+# Signal asking a worker for its partial report
+REPORT_SIGNAL = signal.SIGUSR1
+
+# Kinds of the messages workers send to the parent: a PhaseResult, then DONE,
+# or a TimeoutReport when asked for one
+RESULT = "result"
+DONE = "done"
+TIMEOUT = "timeout"
+
+# Last value passed to progress() in this process
+_progress: Any = None
+
+
+@dataclass
+class TimeoutReport:
+    budget: float
+    # Last value passed to progress() by the phase, if any
+    progress: Any = None
+    # Collapsed stack the phase was in when it was stopped, "outer;...;inner",
+    # or None if it did not answer (e.g. stuck in C code)
+    stack: str | None = None
+
+
+def progress(value: Any) -> None:
+    """Record how far a long phase got, reported if it runs out of time.
+
+    e.g. the iteration of a search loop. This is a single assignment, cheap
+    enough to call once per iteration of all but the hottest loops.
+    """
+    global _progress
+    _progress = value
+
+
+def reset_progress() -> None:
+    global _progress
+    _progress = None
+
+
+def install_report_handler(connection: "Connection") -> None:
+    """Answer REPORT_SIGNAL by sending a TimeoutReport through `connection`.
+
+    The budget is left to the parent, which knows it. The worker exits right
+    after, the parent would kill it anyway.
+    """
+
+    def on_signal(signum: int, frame: FrameType | None) -> None:
+        report = TimeoutReport(0.0, _progress, collapse(frame) or None)
+        connection.send((TIMEOUT, report))
+        connection.close()
+        os._exit(1)
+
+    signal.signal(REPORT_SIGNAL, on_signal)
+
+
+def format_timeout(report: TimeoutReport) -> str:
+    lines = [f"no answer after {report.budget:g}s"]
+    if report.progress is not None:
+        lines.append(f"last progress: {report.progress!r}")
+    lines.append(
+        f"stopped in: {report.stack}"
+        if report.stack is not None
+        else "stopped outside of Python code, no stack"
+    )
+    return ", ".join(lines)
@@ -1,39 +1,47 @@
 from pathlib import Path
 import sys
 
+from advent.inputs import read_input
+
 
 EXAMPLE_INPUT = """
 """
 
+type Parsed = list[str]
+
 
-def parse_input(input: str) -> None:
-    return
+def parse(input: str) -> Parsed:
+    return input.strip().split("\n")
 
 
-def part1(input: str) -> int:
+def part1(parsed: Parsed) -> int:
     count = 0
     return count
 
 
-def part2(input: str) -> int:
+def part2(parsed: Parsed) -> int:
     count = 0
     return count
 
 
-"""
-"""
 if __name__ == "__main__":
+    # Placeholders of the template, e.g. "2024" and "01" once copied
+    year, day = int("YYYY"), int("XX")
+    if "--profile" in sys.argv:
+        # Only needed to profile, and the harness is slow to import
+        from advent.runner import profile_main
+
+        sys.exit(profile_main(year, day, sys.argv[1:]))
     if len(sys.argv) > 1:
         input_text = Path(sys.argv[1]).read_text()
     else:
-        input_text = (
-            Path(__file__).parent.parent / "inputs" / "YYYY" / "dayXX.txt"
-        ).read_text()
+        input_text = read_input(year, day)
+    parsed = parse(input_text)
 
-    assert part1(EXAMPLE_INPUT) == -1
-    result1 = part1(input_text)
+    assert part1(parse(EXAMPLE_INPUT)) == -1
+    result1 = part1(parsed)
     print(result1)
 
-    assert part2(EXAMPLE_INPUT) == -1
-    result2 = part2(input_text)
+    assert part2(parse(EXAMPLE_INPUT)) == -1
+    result2 = part2(parsed)
     print(result2)
@@ -0,0 +1,7 @@
+from pathlib import Path
+import sys
+
+# Same as the PYTHONPATH the justfile exports, so that plain `pytest` works too
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,60 @@
+import random
+
+from advent.days import Day
+
+day01 = Day(2024, 1).load()
+
+
+def example_pairs() -> list[tuple[int, int]]:
+    left, right = day01.parse_input(day01.EXAMPLE_INPUT)
+    return list(zip(left.tolist(), right.tolist()))
+
+
+def test_location_index_example() -> None:
+    index = day01.LocationIndex(example_pairs())
+    assert len(index) == 6
+    assert index.total_distance() == 11
+    assert index.similarity_score() == 31
+
+
+def test_location_index_empty() -> None:
+    index = day01.LocationIndex()
+    assert len(index) == 0
+    assert index.total_distance() == 0
+    assert index.similarity_score() == 0
+
+
+def test_location_index_queries_between_adds() -> None:
+    pairs = example_pairs()
+    index = day01.LocationIndex()
+    for count, (left, right) in enumerate(pairs, start=1):
+        index.add(left, right)
+        text = "\n".join(f"{left}   {right}" for left, right in pairs[:count])
+        assert len(index) == count
+        assert index.total_distance() == day01.reference_part1(text)
+        assert index.similarity_score() == day01.reference_part2(text)
+        # Asking again, with nothing added since, gives the same answers
+        assert index.total_distance() == day01.reference_part1(text)
+
+
+def test_location_index_random_batches() -> None:
+    generator = random.Random(1)
+    index = day01.LocationIndex()
+    pairs: list[tuple[int, int]] = []
+    for _ in range(20):
+        # Few distinct ids, so that both lists share many of them
+        batch = [
+            (generator.randrange(10), generator.randrange(10))
+            for _ in range(generator.randrange(5))
+        ]
+        for left, right in batch:
+            index.add(left, right)
+        pairs += batch
+        left_ids = sorted(left for left, _ in pairs)
+        right_ids = sorted(right for _, right in pairs)
+        assert index.total_distance() == sum(
+            abs(left - right) for left, right in zip(left_ids, right_ids)
+        )
+        assert index.similarity_score() == sum(
+            left * right_ids.count(left) for left in left_ids
+        )
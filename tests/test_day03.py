@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from advent.days import Day
+
+day03 = Day(2024, 3).load()
+
+EXAMPLE_INPUT: str = day03.EXAMPLE_INPUT
+TOKENS = ["mul(", "123", ",", "4", ")", "do()", "don't()", "mul(7,8)", "x", "("]
+
+
+def answers(chunks: list[str]) -> tuple[int, int]:
+    scanner = day03.scan(chunks)
+    return scanner.total, scanner.enabled_total
+
+
+def test_whole_example() -> None:
+    assert answers([EXAMPLE_INPUT]) == (161, 48)
+
+
+@pytest.mark.parametrize("cut", range(len(EXAMPLE_INPUT) + 1))
+def test_cut_anywhere(cut: int) -> None:
+    # Cuts through the middle of "mul(", of operands, and of "don't()"
+    chunks = [EXAMPLE_INPUT[:cut], EXAMPLE_INPUT[cut:]]
+    assert answers(chunks) == (161, 48)
+
+
+def test_one_character_at_a_time() -> None:
+    assert answers(list(EXAMPLE_INPUT)) == (161, 48)
+
+
+def test_empty_chunks() -> None:
+    assert answers(["", "mul(2,", "", "3)", ""]) == (6, 6)
+
+
+def test_random_cuts() -> None:
+    generator = random.Random(3)
+    for _ in range(50):
+        text = "".join(generator.choice(TOKENS) for _ in range(200))
+        cuts = sorted(generator.sample(range(len(text)), 20))
+        chunks = [text[start:end] for start, end in zip([0, *cuts], [*cuts, None])]
+        assert answers(chunks) == (
+            day03.reference_part1(text),
+            day03.reference_part2(text),
+        )
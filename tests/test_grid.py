@@ -0,0 +1,78 @@
+import pytest
+
+from advent.grid import BORDER, Grid
+
+TEXT = """
+#..
+.^#
+"""
+
+
+def test_shape_and_str() -> None:
+    grid = Grid(TEXT)
+    assert (grid.height, grid.width) == (2, 3)
+    assert grid.stride == 5
+    assert str(grid) == "#..\n.^#"
+
+
+def test_index_and_coords() -> None:
+    grid = Grid(TEXT, padding=2)
+    for line in range(grid.height):
+        for column in range(grid.width):
+            index = grid.index(line, column)
+            assert grid.coords(index) == (line, column)
+            assert chr(grid[index]) == TEXT.strip().split("\n")[line][column]
+
+
+def test_indices() -> None:
+    grid = Grid(TEXT)
+    assert "".join(chr(grid[index]) for index in grid.indices()) == "#...^#"
+
+
+def test_border_around_the_grid() -> None:
+    grid = Grid(TEXT)
+    up, right, down, left = grid.directions
+    assert grid.is_border(grid.index(0, 0) + up)
+    assert grid.is_border(grid.index(0, 2) + right)
+    assert grid.is_border(grid.index(1, 1) + down)
+    assert grid.is_border(grid.index(1, 0) + left)
+    assert grid.is_border(grid.index(0, 0) + grid.diagonals[3])
+    assert not grid.is_border(grid.index(0, 0) + grid.diagonals[1])
+    assert grid[grid.index(-1, -1)] == BORDER
+
+
+def test_directions_clockwise() -> None:
+    grid = Grid(TEXT)
+    start = grid.index(0, 1)
+    right = start + grid.directions[1]
+    assert grid.coords(right) == (0, 2)
+    assert grid.coords(right + grid.directions[2]) == (1, 2)
+
+
+def test_find() -> None:
+    grid = Grid(TEXT)
+    assert grid.coords(grid.find("^")) == (1, 1)
+    assert [grid.coords(i) for i in grid.find_all("#")] == [(0, 0), (1, 2)]
+    assert grid.count(".") == 3
+    with pytest.raises(ValueError):
+        grid.find("E")
+
+
+def test_offsets_within() -> None:
+    grid = Grid(TEXT, padding=2)
+    offsets = grid.offsets_within(2)
+    # The cell itself, then 4 at distance 1 and 8 at distance 2
+    assert sorted(distance for _, distance in offsets) == [0] + [1] * 4 + [2] * 8
+    start = grid.index(0, 0)
+    for offset, distance in offsets:
+        line, column = grid.coords(start + offset)
+        assert abs(line) + abs(column) == distance
+
+
+def test_copy_is_independent() -> None:
+    grid = Grid(TEXT)
+    copy = grid.copy()
+    copy[copy.find("^")] = ord(".")
+    assert grid.count("^") == 1
+    assert copy.count("^") == 0
+    assert copy.directions == grid.directions
@@ -0,0 +1,107 @@
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from advent.inputs import InputCache, InputNotFoundError, InputProvider
+
+
+class CountingBackend:
+    """Plaintext "decryption" that counts its calls."""
+
+    calls: int
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def decrypt(self, path: Path) -> bytes:
+        self.calls += 1
+        return path.read_bytes().upper()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> InputCache:
+    return InputCache(tmp_path / "cache")
+
+
+def test_cache_round_trip(cache: InputCache) -> None:
+    assert cache.get("key") is None
+    path = cache.put("key", b"data")
+    assert path.read_bytes() == b"data"
+    assert cache.get("key") == b"data"
+    # Another process only has the directory
+    assert InputCache(cache.directory).get("key") == b"data"
+
+
+def test_cache_directory_is_private(cache: InputCache) -> None:
+    cache.put("key", b"data")
+    assert cache.directory.stat().st_mode & 0o777 == 0o700
+
+
+def test_cache_refuses_shared_directory(tmp_path: Path) -> None:
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    directory.chmod(0o777)
+    (directory / "key.txt").write_bytes(b"planted")
+    cache = InputCache(directory)
+    with pytest.raises(PermissionError):
+        cache.get("key")
+    with pytest.raises(PermissionError):
+        cache.put("key", b"data")
+
+
+def test_cache_expires_entries(cache: InputCache) -> None:
+    path = cache.put("key", b"data")
+    old = time.time() - cache.max_age - 1
+    os.utime(path, (old, old))
+    assert InputCache(cache.directory).get("key") is None
+    assert not path.exists()
+
+
+def test_cache_evicts_oldest_past_max_size(tmp_path: Path) -> None:
+    cache = InputCache(tmp_path / "cache", max_size=10)
+    first = cache.put("first", b"123456")
+    old = time.time() - 60
+    os.utime(first, (old, old))
+    second = cache.put("second", b"123456")
+    assert not first.exists()
+    assert second.exists()
+    # An entry larger than the whole cache is still kept
+    assert cache.put("large", b"x" * 20).exists()
+
+
+def test_cache_clear(cache: InputCache) -> None:
+    path = cache.put("key", b"data")
+    cache.clear()
+    assert not path.exists()
+    assert cache.get("key") is None
+
+
+def test_provider_prefers_plaintext(tmp_path: Path, cache: InputCache) -> None:
+    (tmp_path / "2024").mkdir()
+    (tmp_path / "2024" / "day01.txt").write_text("plain")
+    (tmp_path / "2024" / "day01.txt.enc").write_text("encrypted")
+    backend = CountingBackend()
+    provider = InputProvider(backend, cache, tmp_path)
+    assert provider.read_text(2024, 1) == "plain"
+    assert provider.path(2024, 1) == tmp_path / "2024" / "day01.txt"
+    assert backend.calls == 0
+
+
+def test_provider_decrypts_once(tmp_path: Path, cache: InputCache) -> None:
+    (tmp_path / "2024").mkdir()
+    (tmp_path / "2024" / "day02.txt.enc").write_text("secret")
+    backend = CountingBackend()
+    assert InputProvider(backend, cache, tmp_path).read_text(2024, 2) == "SECRET"
+    # A new provider, e.g. in another process, reuses the decrypted entry
+    provider = InputProvider(backend, InputCache(cache.directory), tmp_path)
+    assert provider.path(2024, 2).read_text() == "SECRET"
+    assert backend.calls == 1
+
+
+def test_provider_missing_input(tmp_path: Path, cache: InputCache) -> None:
+    provider = InputProvider(CountingBackend(), cache, tmp_path)
+    assert not provider.has_input(2024, 3)
+    with pytest.raises(InputNotFoundError):
+        provider.read_text(2024, 3)
@@ -0,0 +1,79 @@
+from advent.memo import MemoStats, clear_memos, memo_stats, memoize
+
+
+def stats_of(name: str) -> MemoStats:
+    # Functions memoized anywhere else, e.g. by days, are registered too
+    [stats] = [stats for stats in memo_stats() if stats.name.endswith(name)]
+    return stats
+
+
+def test_memoize_counts_hits() -> None:
+    calls: list[int] = []
+
+    @memoize()
+    def square(n: int) -> int:
+        calls.append(n)
+        return n * n
+
+    assert [square(3), square(3), square(4)] == [9, 9, 16]
+    assert calls == [3, 4]
+    hits, misses, _, size = square.cache_info()
+    assert (hits, misses, size) == (1, 2, 2)
+    stats = stats_of("<locals>.square")
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+
+def test_memoize_evicts_least_recently_used() -> None:
+    calls: list[int] = []
+
+    @memoize(max_size=2)
+    def identity(n: int) -> int:
+        calls.append(n)
+        return n
+
+    identity(1)
+    identity(2)
+    identity(1)
+    identity(3)
+    # 2 was the least recently used, 1 is still there
+    identity(1)
+    identity(2)
+    assert calls == [1, 2, 3, 2]
+    assert identity.cache_info()[2:] == (2, 2)
+
+
+def test_memoize_key() -> None:
+    calls: list[tuple[int, list[int]]] = []
+
+    @memoize(max_size=2, key=lambda n, table: n)
+    def lookup(n: int, table: list[int]) -> int:
+        calls.append((n, table))
+        return table[n]
+
+    table = [10, 20, 30]
+    assert lookup(1, table) == 20
+    # Same key, the other argument is left out of it
+    assert lookup(1, [0, 0]) == 20
+    assert lookup(2, table) == 30
+    assert lookup(0, table) == 10
+    assert lookup(2, table) == 30
+    assert len(calls) == 3
+    assert lookup.cache_info() == (2, 3, 2, 2)
+
+
+def test_clear_memos() -> None:
+    @memoize()
+    def double(n: int) -> int:
+        return 2 * n
+
+    @memoize(key=lambda n: n % 2)
+    def parity(n: int) -> int:
+        return n % 2
+
+    double(1)
+    parity(1)
+    parity(3)
+    clear_memos()
+    assert double.cache_info()[:2] == (0, 0)
+    assert parity.cache_info() == (0, 0, 1 << 20, 0)
+    assert stats_of("<locals>.parity").size == 0
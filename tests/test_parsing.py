@@ -0,0 +1,92 @@
+import pytest
+
+from advent.parsing import (
+    IntegerOverflowError,
+    RecordWidthError,
+    integer_array,
+    integers,
+    ragged_rows,
+    records,
+)
+
+
+def test_integers_skip_everything_else() -> None:
+    assert integers("p=0,4 v=3,-3").tolist() == [0, 4, 3, -3]
+    assert integers(b"Button A: X+94, Y+34").tolist() == [94, 34]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("-4", [-4]),
+        ("x-5", [-5]),
+        # Dashes that are not right before digits, or come right after them
+        ("a -> b", []),
+        ("1-3", [1, 3]),
+        ("- 6", [6]),
+        ("7-", [7]),
+        ("-", []),
+    ],
+)
+def test_integers_signs(text: str, expected: list[int]) -> None:
+    assert integers(text).tolist() == expected
+
+
+@pytest.mark.parametrize("text", ["", "\n\n", "no digits here"])
+def test_integers_blank(text: str) -> None:
+    assert integers(text).tolist() == []
+
+
+def test_integers_int64_bounds() -> None:
+    assert integers(str(2**63 - 2)).tolist() == [2**63 - 2]
+    assert integers(str(-(2**63) + 1)).tolist() == [-(2**63) + 1]
+
+
+@pytest.mark.parametrize("value", [2**63, -(2**63) - 5, 10**30])
+def test_integers_overflow(value: int) -> None:
+    with pytest.raises(IntegerOverflowError):
+        integers(f"1 {value} 2")
+
+
+def test_integer_array() -> None:
+    values = integer_array("1 -2\n3")
+    assert values.typecode == "q"
+    assert list(values) == [1, -2, 3]
+
+
+def test_records() -> None:
+    robots = records("p=0,4 v=3,-3\np=6,3 v=-1,-3\n", 4)
+    assert robots.tolist() == [[0, 4, 3, -3], [6, 3, -1, -3]]
+    assert records("", 4).shape == (0, 4)
+
+
+def test_records_width() -> None:
+    with pytest.raises(RecordWidthError):
+        records("1 2 3", 2)
+
+
+def test_ragged_rows() -> None:
+    rows = ragged_rows("7 6 4 2 1\n1 2\n\n9\n")
+    assert len(rows) == 4
+    assert rows.tolist() == [[7, 6, 4, 2, 1], [1, 2], [], [9]]
+    assert rows[1].tolist() == [1, 2]
+    assert rows.lengths().tolist() == [5, 2, 0, 1]
+
+
+def test_ragged_rows_strip_outer_blank_lines() -> None:
+    assert ragged_rows("\n\n1 2\n3\n\n").tolist() == [[1, 2], [3]]
+
+
+@pytest.mark.parametrize("text", ["", "\n", "  \n "])
+def test_ragged_rows_blank(text: str) -> None:
+    rows = ragged_rows(text)
+    assert len(rows) == 0
+    assert rows.tolist() == []
+
+
+def test_ragged_rows_separators() -> None:
+    # Day 7 equations, where ":" is not part of any integer
+    assert ragged_rows("190: 10 19\n3267: 81 40 27").tolist() == [
+        [190, 10, 19],
+        [3267, 81, 40, 27],
+    ]
@@ -0,0 +1,99 @@
+from collections.abc import Iterable
+
+import pytest
+
+from advent.search import UNREACHED, UnreachedError, bfs, dijkstra
+
+# 0 - 1 - 2 - 3, with 4 - 5 apart from them
+EDGES = {0: [1], 1: [0, 2], 2: [1, 3], 3: [2], 4: [5], 5: [4]}
+SIZE = 6
+
+
+def neighbours(node: int) -> list[int]:
+    return EDGES[node]
+
+
+def weighted(node: int) -> Iterable[tuple[int, int]]:
+    # 0 -> 2 directly costs 5, through 1 it costs 2
+    costs = {(0, 1): 1, (1, 2): 1, (0, 2): 5, (2, 3): 1}
+    return [(end, cost) for (start, end), cost in costs.items() if start == node]
+
+
+def test_bfs_distances() -> None:
+    result = bfs([0], neighbours, SIZE)
+    assert result.distances[:4] == [0, 1, 2, 3]
+    assert result.path(3) == [0, 1, 2, 3]
+    assert result.goal is None
+
+
+def test_bfs_several_starts() -> None:
+    result = bfs([0, 3], neighbours, SIZE)
+    assert result.distances[:4] == [0, 1, 1, 0]
+
+
+def test_bfs_goal() -> None:
+    result = bfs([0], neighbours, SIZE, goal=lambda node: node == 2)
+    assert result.goal == 2
+    assert result.distance(2) == 2
+
+
+def test_bfs_unreachable_goal() -> None:
+    result = bfs([0], neighbours, SIZE, goal=lambda node: node == 5)
+    assert result.goal is None
+    assert result.distances[4:] == [UNREACHED, UNREACHED]
+    with pytest.raises(UnreachedError):
+        result.distance(5)
+    with pytest.raises(UnreachedError):
+        result.path(5)
+
+
+def test_bfs_no_starts() -> None:
+    result = bfs([], neighbours, SIZE, goal=lambda node: True)
+    assert result.goal is None
+    assert result.distances == [UNREACHED] * SIZE
+
+
+def test_dijkstra_takes_the_cheaper_path() -> None:
+    result = dijkstra([0], weighted, 4)
+    assert result.distances == [0, 1, 2, 3]
+    assert result.path(3) == [0, 1, 2, 3]
+
+
+def test_dijkstra_goal_with_heuristic() -> None:
+    # Never overestimates: every edge left costs at least 1
+    result = dijkstra(
+        [0], weighted, 4, goal=lambda node: node == 3, heuristic=lambda node: 3 - node
+    )
+    assert result.goal == 3
+    assert result.distance(3) == 3
+
+
+def test_dijkstra_unreachable_goal() -> None:
+    result = dijkstra([2], weighted, 4, goal=lambda node: node == 0)
+    assert result.goal is None
+    assert result.distances == [UNREACHED, UNREACHED, 0, 1]
+    with pytest.raises(UnreachedError):
+        result.distance(0)
+
+
+def test_dijkstra_all_predecessors() -> None:
+    # Two paths of cost 2 from 0 to 3, through 1 or through 2
+    costs = {0: [(1, 1), (2, 1)], 1: [(3, 1)], 2: [(3, 1)], 3: [(4, 1)], 4: []}
+    result = dijkstra(
+        [0],
+        lambda node: costs[node],
+        5,
+        goal=lambda node: node == 3,
+        all_predecessors=True,
+    )
+    assert result.goal == 3
+    assert sorted(result.predecessors[3]) == [1, 2]
+    assert result.on_shortest_paths([3]) == {0, 1, 2, 3}
+
+
+def test_dijkstra_all_predecessors_unreachable_goal() -> None:
+    result = dijkstra(
+        [3], weighted, 4, goal=lambda node: node == 0, all_predecessors=True
+    )
+    assert result.goal is None
+    assert result.on_shortest_paths([0]) == {0}